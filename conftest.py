@@ -1,16 +1,15 @@
 import logging
 from time import time
+from uuid import uuid4
 from datetime import datetime
 
-from time import sleep
-
 import requests
-from dictdiffer import diff
 from pytest import (
     fixture,
     skip
 )
 
+from utils.time_accounting import sleep
 from utils.errors import NoHostArgException
 from utils.helper_funcs import (
     get_host,
@@ -22,13 +21,18 @@ from utils.helper_funcs import (
     utc_to_iso,
     convert_json_to_dict
 )
-from utils.clients import (
-    AppClient,
-    DrAccountPortalClient,
-    Auth0Client,
-    DocsPortalClient
-)
+# clients are imported on first use, see utils/clients/__init__.py
+from utils import clients
 from utils.http_utils import ResponseHandler
+from utils.dict_diff import diff
+from utils.web_performance import (
+    WEB_PERFORMANCE,
+    WEB_PERF_MODES
+)
+from utils.resource_broker import (
+    RESOURCE_BROKER,
+    marker_resources
+)
 from utils.constants import (
     ERROR_TEXT_NOT_IN_RESP,
     ERROR_TEXT_IN_RESP,
@@ -43,7 +47,13 @@ from utils.constants import (
     LIMITED_ACCESS_MESSAGE,
     NF_ERROR_TEXT,
     PORTAL_ID_KEY,
-    TIMEOUT_MESSAGE
+    TIMEOUT_MESSAGE,
+    REUSE_DATASETS_ARG,
+    NO_NETWORK_ROUTES_ARG,
+    RECORD_UI_STUBS_ARG,
+    WEB_PERF_ARG,
+    KEEP_ARTIFACTS_ARG,
+    RECORD_VIDEO_ARG
 )
 from utils.data_enums import (
     DeploymentActionLogKeys,
@@ -54,6 +64,14 @@ from utils.data_enums import (
 
 LOGGER = logging.getLogger(__name__)
 
+pytest_plugins = [
+    'utils.plugins.lpt_scheduler',
+    'utils.plugins.time_accounting',
+    'utils.plugins.tracing',
+    'utils.plugins.perf_store',
+    'utils.plugins.json_logging'
+]
+
 
 def pytest_addoption(parser):
     """
@@ -70,6 +88,25 @@ def pytest_addoption(parser):
         DR_ACCOUNT_HOST_ARG, action='store', help='DataRobot Account Portal host')
     parser.addoption(
         AUTH0_HOST_ARG, action='store', help='Auth0 host')
+    parser.addoption(
+        REUSE_DATASETS_ARG, action='store_true', default=False,
+        help='Create projects from AI Catalog datasets uploaded once per env')
+    parser.addoption(
+        NO_NETWORK_ROUTES_ARG, action='store_true', default=False,
+        help='UI tests: do not block third-party hosts, cache assets and stub responses')
+    parser.addoption(
+        RECORD_UI_STUBS_ARG, action='store_true', default=False,
+        help='UI tests: record responses of @mark.stub_response instead of stubbing them')
+    parser.addoption(
+        WEB_PERF_ARG, action='store', choices=WEB_PERF_MODES, default=None,
+        help='UI tests: save web performance of page navigations to ui/web_performance (record) '
+             'and fail tests exceeding WEB_PERF_BUDGETS (enforce)')
+    parser.addoption(
+        KEEP_ARTIFACTS_ARG, action='store_true', default=False,
+        help='UI tests: save trace, screenshots and video of passed tests too')
+    parser.addoption(
+        RECORD_VIDEO_ARG, action='store_true', default=False,
+        help='UI tests: record video, saved to ui/videos for failed tests')
 
 
 @fixture(scope='session')
@@ -126,9 +163,35 @@ def skip_test_by_env(request, app_host):
             skip(f'This test should not run at "{app_host}" env.')
 
 
+@fixture(autouse=True)
+def acquire_resources(request, app_host, skip_test_by_env):
+    """
+    Holds a slot of each resource capped per account or environment
+    while a test runs, so that no more than limit tests use it at the same time
+    across pytest-xdist workers.
+    Apply to test function: @mark.resource('autopilot') or @mark.resource('autopilot', 2)
+    Default limits are in RESOURCE_LIMITS.
+
+    Parameters
+    ----------
+    request : FixtureRequest
+        Special fixture providing information of the requesting test function
+    app_host : function
+        Returns application hostname, e.g. prod
+    skip_test_by_env : function
+        Skips a test before it takes a slot
+    """
+    # sorted to avoid deadlocks between tests holding several resources
+    slots = [RESOURCE_BROKER.acquire(resource, limit, app_host)
+             for resource, limit in sorted(marker_resources(request.node).items())]
+    yield
+    for slot in slots:
+        slot.release()
+
+
 def pytest_configure(config):
     """
-    Adds skip_if_env marker to pytest config.
+    Adds skip_if_env, resource, allow_hosts and stub_response markers to pytest config.
 
     Parameters
     ----------
@@ -138,6 +201,34 @@ def pytest_configure(config):
     config.addinivalue_line(
         'markers',
         'skip_test_by_env(app_host): skip running a test for the passed env',)
+    config.addinivalue_line(
+        'markers',
+        'resource(name, limit): limit number of tests using the resource at the same time',)
+    config.addinivalue_line(
+        'markers',
+        'allow_hosts(*hosts): do not block third-party hosts in a UI test',)
+    config.addinivalue_line(
+        'markers',
+        'stub_response(url_pattern, stub_name): fulfill UI test requests '
+        'with response recorded to data/ui_stubs/{stub_name}.json',)
+
+    if config.getoption(WEB_PERF_ARG) and getattr(config, 'workerinput', None) is None:
+        # pytest-xdist passes it to workers
+        config.option.testrunuid = getattr(config.option, 'testrunuid', None) or uuid4().hex
+
+
+def pytest_sessionfinish(session):
+    """
+    With --web_perf, merges web performance records of all workers into a per-run file.
+
+    Parameters
+    ----------
+    session : Session
+        pytest session
+    """
+    config = session.config
+    if config.getoption(WEB_PERF_ARG) and getattr(config, 'workerinput', None) is None:
+        WEB_PERFORMANCE.merge(config.option.testrunuid)
 
 
 def pytest_collection_modifyitems(items):
@@ -244,7 +335,7 @@ def app_client(env_params, session):
     app_client : AppClient
         App client object
     """
-    return AppClient(env_params, session)
+    return clients.AppClient(env_params, session)
 
 
 @fixture(scope='session')
@@ -264,7 +355,7 @@ def auth0_client(env_params, session):
     app_client : Auth0Client
         Auth0Client client object
     """
-    return Auth0Client(env_params, session)
+    return clients.Auth0Client(env_params, session)
 
 
 @fixture(scope='session')
@@ -284,7 +375,7 @@ def docs_client(env_params, session):
     docs_client : DocsPortalClient
         DocsPortalClient client object
     """
-    return DocsPortalClient(env_params, session)
+    return clients.DocsPortalClient(env_params, session)
 
 
 @fixture
@@ -384,7 +475,7 @@ def dr_account_client(env_params, session):
     dr_account_client : DrAccountPortalClient
         DrAccountPortalClient client object
     """
-    return DrAccountPortalClient(env_params, session)
+    return clients.DrAccountPortalClient(env_params, session)
 
 
 @fixture
@@ -421,6 +512,29 @@ def resp_json():
     return resp_json_
 
 
+@fixture
+def credit_records():
+    """
+    Returns a function which loads records of Credits System JSON responses,
+    e.g. pages of GET api/creditsSystem/creditUsageDetails, into CreditRecords columns.
+
+    Returns
+    -------
+    credit_records_ : function
+        Function which returns CreditRecords of all passed pages
+    """
+    # numpy is imported on first use
+    from utils.credit_records import (
+        CreditRecords,
+        CREDIT_USAGE_FIELDS
+    )
+
+    def credit_records_(*pages, fields=CREDIT_USAGE_FIELDS):
+        return CreditRecords.from_pages(pages, fields)
+
+    return credit_records_
+
+
 @fixture
 def resp_text():
     """
@@ -455,14 +569,18 @@ def resp_content():
 
 
 @fixture
-def setup_project(app_client):
+def setup_project(app_client, request):
     """
     Creates a project from file and sets a target.
+    With --reuse_datasets the project is created from AI Catalog dataset
+    uploaded once per env instead of uploading the file.
 
     Parameters
     ----------
     app_client : function
         Returns AppClient object
+    request : FixtureRequest
+        Special fixture providing information of the requesting test function
 
     Returns
     -------
@@ -471,7 +589,10 @@ def setup_project(app_client):
     """
     def project_setup_(dataset_path, target):
 
-        project_id = app_client.v2_create_project_from_file(dataset_path)
+        if request.config.getoption(REUSE_DATASETS_ARG):
+            project_id = app_client.v2_create_project_from_catalog(dataset_path)
+        else:
+            project_id = app_client.v2_create_project_from_file(dataset_path)
         app_client.set_target(target, project_id)
         return project_id
 
@@ -911,19 +1032,17 @@ def get_dicts_diff(resp_json):
     """
     Converts Response object to actual_dict and
     expected_json_file to expected_dict.
-    Optionally, ignores keys passed to 'ignore' param of diff().
-    'ignore' param must be a set of keys where each key is a list element, e.g.
-    ignore=(['results', 0, 'processingTimeMS'],).
-    Returns a difference list of two dicts.
+    Optionally, ignores keys passed to set_of_ignored_keys param,
+    where each key is a list of keys and indexes or a dotted string, e.g.
+    (['results', 0, 'processingTimeMS'], 'results.*.hits.*.objectID').
+    '*' matches any key or index.
+    Returns a difference list of two dicts, all differences or the first one.
     """
-    def get_dicts_diff(resp, expected_json_file, set_of_ignored_keys):
+    def get_dicts_diff(resp, expected_json_file, set_of_ignored_keys, first_only=False):
 
         actual_dict = resp_json(resp)
         expected_dict = convert_json_to_dict(expected_json_file)
 
-        result = diff(
-            actual_dict, expected_dict, ignore=set_of_ignored_keys
-        )
-        return list(result)
+        return diff(actual_dict, expected_dict, set_of_ignored_keys, first_only)
 
     return get_dicts_diff
@@ -23,67 +23,67 @@ class AiPlatformHomePage(BasePage):
 
     @property
     def buy_credits_button(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.BUY_CREDITS.value)
 
     @property
     def data_prep_card(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.PAXATA_DATA_PREP_CARD.value)
 
     @property
     def data_prep_continue_button(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.DATA_PREP_CONTINUE_BUTTON.value)
 
     @property
     def ml_dev_card(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.ML_DEV_CARD.value)
 
     @property
     def ml_ops_card(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.ML_OPS_CARD.value)
 
     @property
     def go_to_ml_ops_button(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.GO_TO_MLOPS_BUTTON.value)
 
     @property
     def ml_dev_continue_button(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.ML_DEV_CONTINUE_BUTTON.value)
 
     @property
     def ml_dev_create_new_project_button(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.CREATE_NEW_PROJECT_BUTTON.value)
 
     @property
     def credit_usage_dropdown_icon(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.CREDITS_USAGE_DROPDOWN_BUTTON.value)
 
     @property
     def widget_circle(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.WIDGET_CIRCLE.value)
 
     @property
     def widget_date_dropdown(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.WIDGET_DATE_DROPDOWN.value)
 
     @property
     def widget_usage_dropdown(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.WIDGET_USAGE_DROPDOWN.value)
 
     @property
     def full_usage_details_link(self):
-        return self.wait_for_element(
+        return self.element(
             HomePageSelectors.FULL_USAGE_DETAILS_LINK.value)
 
     def continue_from_ml_dev(self):
@@ -102,11 +102,13 @@ class AiPlatformHomePage(BasePage):
     def go_to_credits_packs_modal(self):
         """Go to Credits Packs modal by clicking Buy Credits button from Home page"""
 
+        navigation_start = self.performance_now()
         self.click_element(self.buy_credits_button)
         self.wait_for_element(
             CreditsPacksPageSelectors.BUY_EXPLORER_PACK_BUTTON.value
         )
         self.logger.info('User went to Credits Packs page')
+        self.capture_web_performance('Credits Packs', navigation_start)
 
     def open_credit_usage_widget(self):
         """Opens credit usage widget at Home page"""
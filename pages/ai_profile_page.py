@@ -16,77 +16,77 @@ class AiProfilePage(BasePage):
 
     @property
     def role_drop_down(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.ROLE_DROPDOWN.value)
 
     @property
     def industry_drop_down(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.INDUSTRY_DROPDOWN.value)
 
     @property
     def next_button(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.NEXT_BUTTON.value)
 
     @property
     def start_button(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.START_BUTTON.value)
 
     @property
     def prepare_data_option(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.PREPARE_DATA.value)
 
     @property
     def explore_insights_option(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.EXPLORE_INSIGHTS.value)
 
     @property
     def create_ai_models_option(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.CREATE_MODELS.value)
 
     @property
     def deploy_monitor_option(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.DEPLOY_AND_MONITOR.value)
 
     @property
     def analyst_role(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.ANALYST.value)
 
     @property
     def data_scientist_role(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.DATA_SCIENTIST.value)
 
     @property
     def developer_role(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.DEVELOPER.value)
 
     @property
     def director_role(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.DIRECTOR.value)
 
     @property
     def executive_role(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.EXECUTIVE.value)
 
     @property
     def product_manager_role(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.PRODUCT_MANAGER.value)
 
     @property
     def other_role(self):
-        return self.wait_for_element(
+        return self.element(
             AiProfilePageSelectors.OTHER.value)
 
     def select_role(self, selector):
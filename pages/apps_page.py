@@ -8,7 +8,7 @@ class AppsPage(BasePage):
 
     @property
     def open_app_button(self):
-        return self.wait_for_element(
+        return self.element(
             AppsPageSelectors.OPEN_APP_BUTTON.value)
 
     def open_app(self, app_page_title, app_page_object):
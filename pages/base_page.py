@@ -1,6 +1,7 @@
 """Set env var DEBUG: pw:api for Playwright logs"""
 
 import logging
+from time import time
 from playwright._impl._api_types import (
     TimeoutError,
     Error
@@ -9,7 +10,8 @@ from playwright._impl._api_types import (
 from utils.ui_constants import (
     DEFAULT_TIMEOUT,
     ELEM_NOT_FOUND_TIMEOUT,
-    SCREENSHOTS_PATH,
+    PAGE_SETTLED_TIMEOUT,
+    RENDER_QUIET_PERIOD,
     DOWNLOADS_PATH
 )
 from utils.selectors_enums import (
@@ -20,9 +22,28 @@ from utils.selectors_enums import (
 from utils.errors import (
     WaitForElementTimeoutException,
     ElementAttributeTimeoutException,
-    DownloadFileTimeoutException
+    DownloadFileTimeoutException,
+    ConditionTimeoutException
 )
 from utils.helper_funcs import screenshot_name
+from utils.web_performance import WEB_PERFORMANCE
+from utils.time_accounting import (
+    TIME_ACCOUNT,
+    PLAYWRIGHT
+)
+from utils.tracing import TRACER
+from utils.artifacts import TEST_ARTIFACTS
+from utils.dom_snapshot import (
+    SNAPSHOT_JS,
+    DomSnapshot
+)
+from utils.ui_conditions import (
+    CONDITION_JS,
+    PAGE_SETTLED_JS,
+    ANIMATIONS_FINISHED_JS,
+    DETACHED,
+    TIMED_OUT
+)
 from utils.data_enums import (
     PagePath,
     HtmlAttribute
@@ -42,7 +63,14 @@ class BasePage:
             'width': 1920,
             'height': 1080
         })
-
+        # elements of page object properties by selector, see element()
+        self._elements = {}
+        # elements of navigated away documents, disposed on the next element() call
+        self._forgotten_elements = []
+        self.page.on('framenavigated', self._forget_elements)
+
+    @TRACER.traced(None, 'selector')
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def wait_for_element(self, selector, timeout=DEFAULT_TIMEOUT,
                          screenshot=True, raise_error=True, help_text=''):
         """
@@ -85,13 +113,78 @@ class BasePage:
                 'Did not find element by selector %s. %s. %s',
                 selector, error, help_text)
 
+    def element(self, selector, timeout=DEFAULT_TIMEOUT, help_text=''):
+        """
+        Returns element for page object properties.
+        Element is waited for (see wait_for_element()) on first access only
+        and memoized by selector until the main frame navigates.
+        A memoized element detached from the DOM is looked up again.
+
+        Parameters
+        ----------
+        selector : str
+            Element selector
+        timeout : int
+            Timeout waiting for element on first access in N ms
+        help_text : str
+            Help text for debugging
+
+        Returns
+        -------
+        element : playwright.sync_api._generated.ElementHandle
+            Element
+        """
+        self._dispose_forgotten_elements()
+        element = self._elements.get(selector)
+        if element is not None:
+            if self._is_attached(element):
+                self.logger.debug('Reused element by selector %s', selector)
+                return element
+            del self._elements[selector]
+            self._dispose(element)
+
+        element = self.wait_for_element(selector, timeout, help_text=help_text)
+        if element is not None:
+            self._elements[selector] = element
+        return element
+
+    @staticmethod
+    def _is_attached(element):
+        try:
+            return element.evaluate('element => element.isConnected')
+        except Error:
+            return False
+
+    def _forget_elements(self, frame):
+        # Playwright calls can't be made from an event handler:
+        # handles are disposed on the next element() call
+        if frame.parent_frame is None and self._elements:
+            self._forgotten_elements.extend(self._elements.values())
+            self._elements = {}
+
+    def _dispose_forgotten_elements(self):
+        forgotten_elements, self._forgotten_elements = self._forgotten_elements, []
+        for element in forgotten_elements:
+            self._dispose(element)
+
+    @staticmethod
+    def _dispose(element):
+        try:
+            element.dispose()
+        except Error:
+            # handle of a closed page or a navigated away document
+            pass
+
+    @TRACER.traced(None, 'path')
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def navigate(self, path='', query_params='', wait_for_element=False,
-                 selector='', timeout=DEFAULT_TIMEOUT):
+                 selector='', timeout=DEFAULT_TIMEOUT, page_name=None):
         """
         Goes to page by provided path.
         Waits for page to load within timeout.
         Optionally accepts query params string.
         Optionally waits for element at the target page.
+        With --web_perf, captures web performance of the page load (see utils/web_performance.py).
 
         Parameters
         ----------
@@ -106,6 +199,8 @@ class BasePage:
         timeout : int
             Wait for target page to load or
             element at target page is visible
+        page_name : str
+            Page name of WEB_PERF_BUDGETS, e.g. 'Home'. Page object class name by default
         """
         if query_params is None:
             url = f'{self.app_host}{path}?{query_params}'
@@ -119,6 +214,7 @@ class BasePage:
             self.logger.info(NAVIGATE_LOG_MESSAGE, url)
         else:
             self.logger.info(NAVIGATE_LOG_MESSAGE, url)
+        self.capture_web_performance(page_name)
 
     def navigate_to_ai_platform_page(self):
         """
@@ -129,14 +225,39 @@ class BasePage:
             PagePath.AI_PLATFORM_HOME.value,
             query_params='', wait_for_element=True,
             selector=HomePageSelectors.BUY_CREDITS.value,
-            timeout=DEFAULT_TIMEOUT)
+            timeout=DEFAULT_TIMEOUT, page_name='Home')
+
+    def capture_web_performance(self, page_name=None, since=0):
+        """
+        With --web_perf, saves web performance metrics of the last navigation
+        and checks them against WEB_PERF_BUDGETS of page_name.
+        For in-app navigation (clicking a tab, a button) pass since=self.performance_now()
+        taken before the click.
+
+        Parameters
+        ----------
+        page_name : str
+            Page name of WEB_PERF_BUDGETS. Page object class name by default
+        since : float
+            0 for a page load or performance_now() value before in-app navigation
+        """
+        WEB_PERFORMANCE.capture(self, page_name or type(self).__name__, since)
+
+    def performance_now(self):
+        """Returns current time of page performance timeline in ms, 0 without --web_perf."""
 
+        return WEB_PERFORMANCE.now(self.page)
+
+    @TRACER.traced()
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def refresh_page(self):
         """Reloads current page using reload()"""
 
         self.page.reload()
         self.logger.info('%s page was reloaded', self.page_url)
 
+    @TRACER.traced()
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def enter_text(self, element, text):
         """
         Enters text into element field.
@@ -151,6 +272,8 @@ class BasePage:
         element.fill(text)
         self.logger.info('Entered %s into %s', text, element)
 
+    @TRACER.traced()
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def type_text(self, element, text, delay=100):
         """
         Types text into into a focused element field.
@@ -167,6 +290,8 @@ class BasePage:
         element.type(text, delay=delay)
         self.logger.info('Typed "%s" into %s field', text, element)
 
+    @TRACER.traced()
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def click_element(self, element):
         """
         Clicks element.
@@ -183,6 +308,8 @@ class BasePage:
             self.make_screenshot('click_failed')
             raise WaitForElementTimeoutException(element, error)
 
+    @TRACER.traced(None, 'selector')
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def click_selector(self, selector):
         """
         Clicks selector.
@@ -195,6 +322,8 @@ class BasePage:
         self.page.click(selector)
         self.logger.info('Clicked %s selector', selector)
 
+    @TRACER.traced(None, 'selector')
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def is_element_clickable(self, selector, timeout=5000):
         """
         Returns True if element can be clicked within timeout, otherwise False.
@@ -221,13 +350,20 @@ class BasePage:
             self.logger.info(log_message.format('not'), selector)
             return False
 
+    @TRACER.traced(None, 'selector')
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def is_element_present(self, selector, timeout=ELEM_NOT_FOUND_TIMEOUT,
-                           screenshot=True, raise_error=False, help_text=''):
+                           screenshot=True, raise_error=False, help_text='',
+                           until_settled=False):
         """
         If raise_error=True, waits for element for timeout ms.
         If element is found, then True is returned, else WaitForElementTimeoutException is raised.
         If raise_error=False, waits for element for timeout ms.
         If element is found, then True is returned, else False.
+        With until_settled=True and raise_error=False, returns True at once if element is visible,
+        otherwise checks it again once page is settled (see wait_for_page_settled()).
+        Page is settled by load state and DOM quiet period only, so use it for elements
+        rendered with the page, not for ones shown after an XHR or a backend job.
 
         Parameters
         ----------
@@ -241,21 +377,165 @@ class BasePage:
             If to make screenshot or not
         help_text : str
             Help text for debugging
+        until_settled : bool
+            If raise_error=False, if to wait for element until page is settled
+            instead of the whole timeout. False by default
 
         Returns
         -------
-        element : playwright.sync_api._generated.ElementHandle
-            Element
+        is_present : bool
+            If element is present
         """
-        if self.wait_for_element(
-                selector, timeout, screenshot, raise_error, help_text) is None:
-            self.logger.error(
-                'Element with selector %s not found in %d ms. %s',
-                selector, timeout, help_text)
+        if raise_error or not until_settled:
+            return self.wait_for_element(
+                selector, timeout, screenshot, raise_error, help_text) is not None
+
+        if self._is_visible_now(selector):
+            self.logger.info('Found element by selector %s', selector)
+            return True
+
+        self.wait_for_page_settled(timeout)
+        if self._is_visible_now(selector):
+            self.logger.info('Found element by selector %s', selector)
+            return True
+
+        if screenshot:
+            self.make_screenshot(selector)
+        self.logger.error(
+            'Element with selector %s not found at settled page. %s',
+            selector, help_text)
+        return False
+
+    @TRACER.traced(None, 'selector')
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
+    def is_element_absent(self, selector, timeout=PAGE_SETTLED_TIMEOUT):
+        """
+        Waits for page to settle (see wait_for_page_settled()) within timeout ms.
+        Then checks at once that element is absent or hidden.
+
+        Parameters
+        ----------
+        selector : str
+            Element selector
+        timeout : int
+            Timeout waiting for page to settle in N ms
+
+        Returns
+        -------
+        is_absent : bool
+            If element is absent or hidden
+        """
+        self.wait_for_page_settled(timeout)
+        if self._is_visible_now(selector):
+            self.logger.info('Element with selector %s is present', selector)
             return False
 
+        self.logger.info('Element with selector %s is absent', selector)
         return True
 
+    @TRACER.traced()
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
+    def wait_for_page_settled(self, timeout=PAGE_SETTLED_TIMEOUT):
+        """
+        Waits for page to settle within timeout ms:
+        1. Network is idle
+        2. DOM is not changed for RENDER_QUIET_PERIOD ms (React finished rendering)
+        3. Pendo agent, if loaded, is ready
+
+        Parameters
+        ----------
+        timeout : int
+            Timeout waiting for page to settle in N ms
+
+        Returns
+        -------
+        is_settled : bool
+            If page settled within timeout
+        """
+        deadline = time() + timeout / 1000
+        try:
+            self.wait_for_network_idle(timeout)
+            is_settled = self.page.evaluate(
+                PAGE_SETTLED_JS,
+                [RENDER_QUIET_PERIOD, max(int((deadline - time()) * 1000), 1)])
+        except Error as error:
+            # TimeoutError or execution context destroyed by navigation
+            self.logger.warning('Page %s is not settled. %s', self.page.url, error)
+            return False
+
+        if not is_settled:
+            self.logger.warning(
+                'Page %s is not settled within %d ms', self.page.url, timeout)
+        return is_settled
+
+    @TRACER.traced()
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
+    def take_snapshot(self, selectors, attributes=(), text=False,
+                      timeout=PAGE_SETTLED_TIMEOUT):
+        """
+        Waits for page to settle (see wait_for_page_settled()) within timeout ms.
+        Then reads visibility, optionally inner text and attributes
+        of all elements in one page.evaluate() instead of a call per element and property.
+        Selectors the in-page resolver doesn't support or doesn't find, and all selectors
+        of a page with shadow DOM, are resolved by Playwright one by one.
+
+        Parameters
+        ----------
+        selectors : list
+            Element selectors
+        attributes : tuple
+            Names of attributes to read from each element
+        text : bool
+            If to read inner text of each element
+        timeout : int
+            Timeout waiting for page to settle in N ms
+
+        Returns
+        -------
+        snapshot : utils.dom_snapshot.DomSnapshot
+            Elements state by selector
+        """
+        self.wait_for_page_settled(timeout)
+        results = self.page.evaluate(
+            SNAPSHOT_JS, [list(selectors), list(attributes), text])
+
+        elements = {}
+        for selector, result in zip(selectors, results):
+            if 'error' in result:
+                self.logger.debug(
+                    'Resolving selector %s with Playwright: %s', selector, result['error'])
+                result = self._element_state(selector, attributes, text)
+            elements[selector] = result
+
+        snapshot = DomSnapshot(elements)
+        self.logger.info(
+            'Took snapshot of %d elements, %d of them are not visible',
+            len(elements), len(snapshot.missing()))
+        return snapshot
+
+    def _element_state(self, selector, attributes, text):
+        element = self.page.query_selector(selector)
+        if element is None:
+            return {'present': False, 'visible': False, 'text': None, 'attributes': {}}
+
+        return {
+            'present': True,
+            'visible': element.is_visible(),
+            'text': element.inner_text() if text else None,
+            'attributes': {attribute: element.get_attribute(attribute)
+                           for attribute in attributes}
+        }
+
+    def _is_visible_now(self, selector):
+        try:
+            element = self.page.query_selector(selector)
+            return element is not None and element.is_visible()
+        except Error as error:
+            self.logger.debug('Element with selector %s is not checked. %s', selector, error)
+            return False
+
+    @TRACER.traced(None, 'selector')
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def get_attribute_value(self, selector, attribute_name,
                             timeout=ELEM_NOT_FOUND_TIMEOUT, raise_error=True):
         """
@@ -315,27 +595,144 @@ class BasePage:
                           attribute_name, element, value)
         return value
 
-    def make_screenshot(self, selector_str=''):
+    @TRACER.traced()
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
+    def wait_for_condition(self, condition, timeout=DEFAULT_TIMEOUT,
+                           screenshot=True, raise_error=True, help_text=''):
         """
-        If runs locally, creates screenshot in ui/screenshots/{selector_name_no_spaces}-{ts}.png
-        In Jenkins: {selector_name_no_spaces}-{ts}.png
+        Waits for page condition (see utils/ui_conditions.py) to be met within timeout ms.
+        Condition is checked in the browser on every DOM mutation, so it is detected
+        as soon as page state changes, without polling and sleeping.
+        If element was re-rendered (detached from DOM), it is found by selector again.
+        If timed out:
+        1. Makes screenshot
+        2. Logs error message
+        3. Optionally raises custom ConditionTimeoutException
 
         Parameters
         ----------
-        selector_str : str
-            Element selector
+        condition : utils.ui_conditions.Condition
+            Condition to wait for, e.g. attribute_absent(selector, 'disabled')
+        timeout : int
+            Timeout waiting for condition in N ms
+        screenshot : bool
+            If to make screenshot or not
+        raise_error : bool
+            If to raise ConditionTimeoutException or not
+        help_text : str
+            Help text for debugging
+
+        Returns
+        -------
+        is_met : bool
+            If condition was met within timeout
         """
-        name = screenshot_name(selector_str)
-        local_path = f'{SCREENSHOTS_PATH}/{name}'
-        log_message = 'Made screenshot: %s'
+        deadline = time() + timeout / 1000
+        error = TIMED_OUT
+        while time() < deadline:
+            remaining = max(int((deadline - time()) * 1000), 1)
+            try:
+                element = self.page.wait_for_selector(
+                    condition.selector, state='attached', timeout=remaining)
+                result = self.page.evaluate(
+                    CONDITION_JS,
+                    [element, condition.attribute, condition.operator,
+                     condition.value, remaining])
+            except TimeoutError as timeout_error:
+                error = timeout_error
+                break
+            except Error as evaluate_error:
+                # condition is checked again at the page navigated to
+                if 'Execution context was destroyed' not in str(evaluate_error):
+                    raise
+                error = evaluate_error
+                self.logger.debug('Rechecking %s: %s', condition, evaluate_error)
+                continue
+
+            if result is True:
+                self.logger.info('%s is met', condition)
+                return True
+            if result == DETACHED:
+                self.logger.debug(
+                    'Element with selector %s was re-rendered', condition.selector)
+                continue
+            break
+
+        if screenshot:
+            self.make_screenshot(condition.selector)
+        if raise_error:
+            raise ConditionTimeoutException(condition, timeout, f'{error}. {help_text}')
+        self.logger.error(
+            '%s was not met within %d ms. %s. %s', condition, timeout, error, help_text)
+        return False
+
+    @TRACER.traced()
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
+    def wait_for_network_idle(self, timeout=DEFAULT_TIMEOUT):
+        """
+        Waits until there are no network connections for at least 500 ms.
+
+        Parameters
+        ----------
+        timeout : int
+            Timeout waiting for network idle in N ms
+        """
+        self.page.wait_for_load_state('networkidle', timeout=timeout)
+        self.logger.debug('Network is idle at %s', self.page.url)
+
+    def expect_response(self, url_part, timeout=DEFAULT_TIMEOUT):
+        """
+        Returns context manager waiting for response whose url contains url_part,
+        e.g. to wait for API call triggered by a click:
+        with page.expect_response('/predictions/'):
+            page.click_selector(selector)
+
+        Parameters
+        ----------
+        url_part : str
+            Part of response url
+        timeout : int
+            Timeout waiting for response in N ms
+
+        Returns
+        -------
+        event_context : playwright.sync_api._generated.EventContextManager
+            Context manager with response in its value
+        """
+        return self.page.expect_response(
+            lambda response: url_part in response.url, timeout=timeout)
+
+    @TRACER.traced()
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
+    def wait_for_animations_finished(self, timeout=ELEM_NOT_FOUND_TIMEOUT):
+        """
+        Waits until page has no running CSS animations and transitions,
+        e.g. until modal or tour slide-in is over.
+
+        Parameters
+        ----------
+        timeout : int
+            Timeout waiting for animations in N ms
+        """
+        self.page.wait_for_function(
+            ANIMATIONS_FINISHED_JS, polling='raf', timeout=timeout)
+        self.logger.debug('Animations finished at %s', self.page.url)
 
-        try:  # for local runs
-            self.page.screenshot(path=local_path)
-            self.logger.info(log_message, local_path)
+    def make_screenshot(self, selector_str='', persist=False):
+        """
+        Makes screenshot {selector_name_no_spaces}-{ts}.jpeg for the test report.
+        It is saved to ui/screenshots in a background thread only if the test fails,
+        unless persist=True. While Playwright trace is recorded, the page state
+        is taken from the trace instead (see utils/artifacts.py).
 
-        except FileNotFoundError:  # for Jenkins runs
-            self.page.screenshot(path=f'{name}')
-            self.logger.info(log_message, name)
+        Parameters
+        ----------
+        selector_str : str
+            Element selector
+        persist : bool
+            If to save the screenshot even if the test passes
+        """
+        TEST_ARTIFACTS.screenshot(self.page, screenshot_name(selector_str), persist)
 
     def get_child_elements_by_selector(self, selector):
         """
@@ -420,6 +817,8 @@ class BasePage:
         )
         return text
 
+    @TRACER.traced()
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def download_file(self, element, save_locally=True, timeout=300000,
                       raise_error=True):
         """
@@ -486,6 +885,8 @@ class BasePage:
 
         return suggested_file_name
 
+    @TRACER.traced(None, 'selector')
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def upload_file(self, selector, file_name, file_path='',
                     default_directory=True):
         """
@@ -549,6 +950,8 @@ class BasePage:
 
         return title
 
+    @TRACER.traced()
+    @TIME_ACCOUNT.timed(PLAYWRIGHT)
     def open_new_tab(self, element, page):
         """
         Switches context to a new browser tab opened after clicking a button which initiates opening of a new tab.
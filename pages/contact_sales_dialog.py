@@ -16,22 +16,22 @@ class ContactSalesDialog(BasePage):
 
     @property
     def close_x_button(self):
-        return self.wait_for_element(
+        return self.element(
             ContactSalesDialogSelectors.CLOSE_X_BUTTON.value)
 
     @property
     def text_field(self):
-        return self.wait_for_element(
+        return self.element(
             ContactSalesDialogSelectors.TEXT_AREA.value)
 
     @property
     def category_dropdown(self):
-        return self.wait_for_element(
+        return self.element(
             ContactSalesDialogSelectors.CATEGORY_DROPDOWN.value)
 
     @property
     def send_button(self):
-        return self.wait_for_element(
+        return self.element(
             ContactSalesDialogSelectors.SEND_BUTTON.value)
 
     def close_dialog(self):
@@ -13,112 +13,112 @@ class CreditsPacksPage(BasePage):
 
     @property
     def buy_explorer_pack_button(self):
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.BUY_EXPLORER_PACK_BUTTON.value)
 
     @property
     def buy_accel_pack_button(self):
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.BUY_ACCEL_PACK_BUTTON.value)
 
     @property
     def explorer_street_address_field(self):
         if Envs.STAGING.value in self.app_host:
-            return self.wait_for_element(
+            return self.element(
                 CreditsPacksPageSelectors.EXPLORER_STREET_ADDRESS_FIELD_STAGING.value
             )
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.EXPLORER_STREET_ADDRESS_FIELD_PROD.value)
 
     @property
     def accel_street_address_field(self):
         if Envs.STAGING.value in self.app_host:
-            return self.wait_for_element(
+            return self.element(
                 CreditsPacksPageSelectors.ACCEL_STREET_ADDRESS_FIELD_STAGING.value
             )
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.ACCEL_STREET_ADDRESS_FIELD_PROD.value)
 
     @property
     def explorer_city_field(self):
         if Envs.STAGING.value in self.app_host:
-            return self.wait_for_element(
+            return self.element(
                 CreditsPacksPageSelectors.EXPLORER_CITY_FIELD_STAGING.value
             )
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.EXPLORER_CITY_FIELD_PROD.value)
 
     @property
     def accel_city_field(self):
         if Envs.STAGING.value in self.app_host:
-            return self.wait_for_element(
+            return self.element(
                 CreditsPacksPageSelectors.ACCEL_CITY_FIELD_STAGING.value
             )
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.ACCEL_CITY_FIELD_PROD.value)
 
     @property
     def explorer_state_dropdown(self):
         if Envs.STAGING.value in self.app_host:
-            return self.wait_for_element(
+            return self.element(
                 CreditsPacksPageSelectors.EXPLORER_STATE_DROPDOWN_STAGING.value
             )
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.EXPLORER_STATE_ADDRESS_FIELD_PROD.value)
 
     @property
     def accel_state_dropdown(self):
         if Envs.STAGING.value in self.app_host:
-            return self.wait_for_element(
+            return self.element(
                 CreditsPacksPageSelectors.ACCEL_STATE_DROPDOWN_STAGING.value
             )
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.ACCEL_STATE_ADDRESS_FIELD_PROD.value)
 
     @property
     def explorer_zip_field(self):
         if Envs.STAGING.value in self.app_host:
-            return self.wait_for_element(
+            return self.element(
                 CreditsPacksPageSelectors.EXPLORER_ZIP_FIELD_STAGING.value
             )
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.EXPLORER_ZIP_FIELD_PROD.value)
 
     @property
     def accel_zip_field(self):
         if Envs.STAGING.value in self.app_host:
-            return self.wait_for_element(
+            return self.element(
                 CreditsPacksPageSelectors.ACCEL_ZIP_FIELD_STAGING.value
             )
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.ACCEL_ZIP_FIELD_PROD.value)
 
     @property
     def explorer_country_dropdown(self):
         if Envs.STAGING.value in self.app_host:
-            return self.wait_for_element(
+            return self.element(
                 CreditsPacksPageSelectors.EXPLORER_COUNTRY_DROPDOWN_STAGING.value
             )
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.EXPLORER_COUNTRY_DROPDOWN_PROD.value)
 
     @property
     def accel_country_dropdown(self):
         if Envs.STAGING.value in self.app_host:
-            return self.wait_for_element(
+            return self.element(
                 CreditsPacksPageSelectors.ACCEL_COUNTRY_DROPDOWN_STAGING.value
             )
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.ACCEL_COUNTRY_DROPDOWN_PROD.value)
 
     @property
     def proceed_button(self):
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.PROCEED_BUTTON.value)
 
     @property
     def contact_sales_button(self):
-        return self.wait_for_element(
+        return self.element(
             CreditsPacksPageSelectors.CONTACT_SALES_BUTTON.value)
 
     def open_credit_pack_shipping_info(self, pack_name):
@@ -16,22 +16,22 @@ class DataPage(BasePage):
     @property
     def recommended_target_button(self):
         # Recommended target is: {RECOMMENDED_TARGET_BUTTON}
-        return self.wait_for_element(
+        return self.element(
             DataPageSelectors.RECOMMENDED_TARGET_BUTTON.value)
 
     @property
     def target_field(self):
-        return self.wait_for_element(
+        return self.element(
             DataPageSelectors.ENTERED_TARGET.value)
 
     @property
     def start_modeling_button(self):
-        return self.wait_for_element(
+        return self.element(
             DataPageSelectors.START_MODELING_BUTTON.value)
 
     @property
     def data_quality_view_info_button(self):
-        return self.wait_for_element(
+        return self.element(
             DataPageSelectors.DATA_QUALITY_VIEW_INFO_BUTTON.value)
 
     def enter_recommended_target(self, expected_target):
@@ -1,17 +1,22 @@
-from time import sleep
+from playwright._impl._api_types import Error
+
 from pages.base_page import BasePage
+from utils.time_accounting import sleep
 from utils.selectors_enums import (
     DeploymentsPageSelectors,
     AppsPageSelectors
 )
-from utils.helper_funcs import (
-    time_left,
-    time
-)
 from utils.data_enums import HtmlAttribute
-from utils.constants import TIMEOUT_MESSAGE
-from utils.ui_constants import COMPUTE_PREDICTIONS_BUTTON
+from utils.ui_constants import (
+    COMPUTE_PREDICTIONS_BUTTON,
+    PREDICTION_DATASETS_URL_PART
+)
 from utils.errors import ElementIsAbsentException
+from utils.ui_conditions import (
+    attribute_contains,
+    attribute_not_contains,
+    attribute_absent
+)
 
 
 class DeploymentsPage(BasePage):
@@ -20,55 +25,55 @@ class DeploymentsPage(BasePage):
 
     @property
     def predictions_tab(self):
-        return self.wait_for_element(
+        return self.element(
             DeploymentsPageSelectors.PREDICTIONS_TAB.value)
 
     @property
     def download_sample_data_button(self):
-        return self.wait_for_element(
+        return self.element(
             DeploymentsPageSelectors.DOWNLOAD_SAMPLE_DATA_BUTTON.value)
 
     @property
     def choose_prediction_file_button(self):
-        return self.wait_for_element(
+        return self.element(
             DeploymentsPageSelectors.CHOOSE_PREDICTION_FILE_BUTTON.value)
 
     @property
     def compute_predictions_button(self):
         # Compute and download predictions button
         # Disabled until prediction dataset is uploaded
-        return self.wait_for_element(
+        return self.element(
             DeploymentsPageSelectors.COMPUTE_DOWNLOAD_PREDICTIONS_BUTTON.value)
 
     @property
     def splash_modal_close_button(self):
         # Close X button at top right corner of MLOps splash modal
-        return self.wait_for_element(
+        return self.element(
             DeploymentsPageSelectors.SPLASH_MODAL_CLOSE_BUTTON.value)
 
     @property
     def automodel_deployed_flag(self):
-        return self.wait_for_element(
+        return self.element(
             DeploymentsPageSelectors.AUTOMODEL_DEPLOYED_FLAG.value)
 
     @property
     def deployment_actions_menu(self):
-        return self.wait_for_element(
+        return self.element(
             DeploymentsPageSelectors.DEPLOYMENT_ACTIONS_MENU.value)
 
     @property
     def create_app_button(self):
-        return self.wait_for_element(
+        return self.element(
             DeploymentsPageSelectors.CREATE_APP_BUTTON.value)
 
     @property
     def deploy_app_button(self):
-        return self.wait_for_element(
+        return self.element(
             DeploymentsPageSelectors.DEPLOY_APP_BUTTON.value)
 
     @property
     def what_if_app(self):
-        return self.wait_for_element(
+        return self.element(
             DeploymentsPageSelectors.WHAT_IF_APP.value)
 
     def download_predictions_sample_dataset(self):
@@ -97,9 +102,16 @@ class DeploymentsPage(BasePage):
             retry = retry + 1
 
             self.click_element(self.choose_prediction_file_button)
-            self.upload_file(
-                DeploymentsPageSelectors.
-                    UPLOAD_SAMPLE_DATA_FILE_INPUT.value, file_name)
+            try:
+                # the file is uploaded by an API call once it is chosen
+                with self.expect_response(PREDICTION_DATASETS_URL_PART) as upload:
+                    self.upload_file(
+                        DeploymentsPageSelectors.
+                            UPLOAD_SAMPLE_DATA_FILE_INPUT.value, file_name)
+                self.logger.info('Predictions dataset upload status: %d',
+                                 upload.value.status)
+            except Error as error:
+                self.logger.warning('Predictions dataset upload was not finished: %s', error)
 
             if retry >= max_retries:
                 self.make_screenshot('prediction_dataset_not_uploaded')
@@ -108,12 +120,13 @@ class DeploymentsPage(BasePage):
                     f' Tried {max_retries} times.')
 
             if self.is_compute_predictions_button_enabled():
-                sleep(5)
-                # wait and then refresh the page if predictions error alert is present
+                # upload response is received, so the alert is rendered by the time
+                # the page is settled: refresh the page if predictions error alert is present
                 if self.is_element_present(
                         DeploymentsPageSelectors.PREDICTIONS_ERROR_ALERT.value,
                         timeout=9000,
-                        screenshot=False
+                        screenshot=False,
+                        until_settled=True
                 ):
                     self.logger.warning(
                         'Predictions error alert. Wait for %d seconds and'
@@ -147,54 +160,26 @@ class DeploymentsPage(BasePage):
 
     def is_compute_predictions_button_enabled(self,
                                               timeout_period=5,
-                                              poll_interval=5,
                                               raise_error=False):
         """
-        Polls for "Compute and download predictions" button to be enabled
-        at deployments/{deployment_id}/predictions/make-predictions page.
-        Returns True if the button is enabled, otherwise ether returns False or raises TimeoutError.
-        If get_attribute_value() returns None, this means element has no 'disabled' attribute --> element is enabled.
+        Waits for "Compute and download predictions" button to be enabled
+        at deployments/{deployment_id}/predictions/make-predictions page:
+        the button has no 'disabled' attribute.
+        Returns True if the button is enabled,
+        otherwise ether returns False or raises ConditionTimeoutException.
         If 'Compute and download predictions' button is enabled, this means predictions dataset has been uploaded.
         """
-        timeout = time() + 60 * timeout_period
-        while True:
-            disabled_attribute = self.get_attribute_value(
-                DeploymentsPageSelectors.
-                    COMPUTE_DOWNLOAD_PREDICTIONS_BUTTON.value,
-                HtmlAttribute.DISABLED.value,
-                raise_error=False
-            )
-            self.logger.info(
-                'Polling for %s to be enabled. Time left %s.',
-                COMPUTE_PREDICTIONS_BUTTON, time_left(timeout)
-            )
-            if time() > timeout:
-                if raise_error:
-                    self.make_screenshot(
-                        DeploymentsPageSelectors.
-                            COMPUTE_DOWNLOAD_PREDICTIONS_BUTTON.value
-                    )
-                    raise TimeoutError(
-                        f'{COMPUTE_PREDICTIONS_BUTTON} did not get enabled'
-                        f' in {timeout_period} minutes.')
-
-                self.logger.error(
-                    '%s did not get enabled in %d minutes',
-                    COMPUTE_PREDICTIONS_BUTTON, timeout_period
-                )
-                self.make_screenshot(
-                    DeploymentsPageSelectors.
-                        COMPUTE_DOWNLOAD_PREDICTIONS_BUTTON.value
-                )
-                return False
-
-            if disabled_attribute is None:
-                self.logger.info(
-                    '%s is enabled.', COMPUTE_PREDICTIONS_BUTTON
-                )
-                return True
-
-            sleep(poll_interval)
+        is_enabled = self.wait_for_condition(
+            attribute_absent(
+                DeploymentsPageSelectors.COMPUTE_DOWNLOAD_PREDICTIONS_BUTTON.value,
+                HtmlAttribute.DISABLED.value),
+            timeout=timeout_period * 60 * 1000,
+            raise_error=raise_error,
+            help_text=f'{COMPUTE_PREDICTIONS_BUTTON} did not get enabled')
+        if is_enabled:
+            self.logger.info('%s is enabled.', COMPUTE_PREDICTIONS_BUTTON)
+
+        return is_enabled
 
     def close_mlops_splash_modal(self, raise_error=False):
         """
@@ -229,14 +214,13 @@ class DeploymentsPage(BasePage):
         self.wait_for_element(
             DeploymentsPageSelectors.DELETE_DEPLOYMENT_BUTTON.value)
 
-    def create_app(self, app_selector,
-                   timeout_period=10, poll_interval=2):
+    def create_app(self, app_selector, timeout_period=10):
         """
         Clicks Create Application option element from deployment actions menu.
         Selects the app by app_selector and confirms the app is selected.
         Confirms if 'Deploy' app button is enabled and clicks it.
-        Polls for app to be deployed by checking
-        if 'class' attribute of 'Open' app button doesn't contain 'disabled' string.
+        Waits for app to be deployed:
+        'class' attribute of 'Open' app button doesn't contain 'disabled' string.
         Returns app url retrieved from 'Open' app button 'href' attribute.
         """
         self.click_element(self.create_app_button)
@@ -247,71 +231,32 @@ class DeploymentsPage(BasePage):
         self._assert_deploy_button_enabled()
         self.click_element(self.deploy_app_button)
 
-        timeout = time() + 60 * timeout_period
-        while True:
-            class_attribute = self.get_attribute_value(
+        self.wait_for_condition(
+            attribute_not_contains(
                 AppsPageSelectors.OPEN_APP_BUTTON.value,
-                HtmlAttribute.CLASS.value
-            )
-            self.logger.info(
-                'Polling for App with %s selector to be deployed.'
-                ' Time left %s', app_selector, time_left(timeout)
-            )
-            if time() > timeout:
-                raise TimeoutError(
-                    TIMEOUT_MESSAGE.format(
-                        f'App with selector {app_selector}',
-                        'to be deployed',
-                        f'class attribute value: {class_attribute}',
-                        timeout_period)
-                )
-            if HtmlAttribute.DISABLED.value not in class_attribute:
-                app_url = self.get_attribute_value(
-                    AppsPageSelectors.OPEN_APP_BUTTON.value,
-                    HtmlAttribute.HREF.value
-                )
-                self.logger.info(
-                    'App with %s selector is deployed. App url: %s',
-                    app_selector, app_url
-                )
-                return app_url
-
-            sleep(poll_interval)
+                HtmlAttribute.CLASS.value, HtmlAttribute.DISABLED.value),
+            timeout=timeout_period * 60 * 1000,
+            help_text=f'App with selector {app_selector} is not deployed')
+        app_url = self.get_attribute_value(
+            AppsPageSelectors.OPEN_APP_BUTTON.value,
+            HtmlAttribute.HREF.value
+        )
+        self.logger.info(
+            'App with %s selector is deployed. App url: %s',
+            app_selector, app_url
+        )
+        return app_url
 
-    def poll_for_app_selected(self,
-                              app_selector,
-                              timeout_period=2,
-                              poll_interval=1):
+    def poll_for_app_selected(self, app_selector, timeout_period=2):
         """
-        Polls for App to be selected at Create Application modal.
+        Waits for App to be selected at Create Application modal:
         'class' attribute should contain 'selected' string.
         """
-        expected_value = 'selected'
-        timeout = time() + 60 * timeout_period
-        while True:
-            class_attribute = self.get_attribute_value(
-                app_selector, HtmlAttribute.CLASS.value
-            )
-            self.logger.info(
-                'Polling for App with %s selector to be %s.'
-                ' Time left %s',
-                app_selector, expected_value, time_left(timeout)
-            )
-            if time() > timeout:
-                raise TimeoutError(
-                    TIMEOUT_MESSAGE.format(
-                        f'App with selector {app_selector}', 'to be selected',
-                        f'class attribute value: {class_attribute}',
-                        timeout_period)
-                )
-            if expected_value in class_attribute:
-                self.logger.info(
-                    'App with %s selector is selected.',
-                    app_selector
-                )
-                break
-
-            sleep(poll_interval)
+        self.wait_for_condition(
+            attribute_contains(app_selector, HtmlAttribute.CLASS.value, 'selected'),
+            timeout=timeout_period * 60 * 1000,
+            help_text=f'App with selector {app_selector} is not selected')
+        self.logger.info('App with %s selector is selected.', app_selector)
 
     def _assert_deploy_button_enabled(self):
         """'Deploy' app button must be enabled."""
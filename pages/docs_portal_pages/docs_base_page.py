@@ -17,12 +17,13 @@ class DocsBasePage(BasePage):
             self.docs_host = Envs.DOCS_PROD.value
 
     def navigate(self, path='', query_params='', wait_for_element=False,
-                 selector='', timeout=DEFAULT_TIMEOUT):
+                 selector='', timeout=DEFAULT_TIMEOUT, page_name='Docs Portal'):
         """
         Goes to page by provided path.
         Waits for page to load within timeout.
         Optionally accepts query params string.
         Optionally waits for element at the target page.
+        With --web_perf, captures web performance of the page load.
 
         Parameters
         ----------
@@ -37,6 +38,8 @@ class DocsBasePage(BasePage):
         timeout : int
             Wait for target page to load or
             element at target page is visible
+        page_name : str
+            Page name of WEB_PERF_BUDGETS
         """
         if query_params is None:
             url = f'{self.docs_host}{path}?{query_params}'
@@ -50,6 +53,7 @@ class DocsBasePage(BasePage):
             self.logger.info(NAVIGATE_LOG_MESSAGE, url)
         else:
             self.logger.info(NAVIGATE_LOG_MESSAGE, url)
+        self.capture_web_performance(page_name)
 
     def click_docs_nav_link(self, nav_item_selector):
         """
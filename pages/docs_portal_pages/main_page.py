@@ -11,7 +11,7 @@ class DocsMainPage(DocsBasePage):
 
     @property
     def platform_card_title(self):
-        return self.wait_for_element(
+        return self.element(
             DocsMainPageSelectors.PLATFORM_CARD_TITLE.value)
 
     def go_to_platform_card_details(self):
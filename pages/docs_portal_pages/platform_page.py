@@ -11,7 +11,7 @@ class DocsPlatformPage(DocsBasePage):
 
     @property
     def data_card_title(self):
-        return self.wait_for_element(
+        return self.element(
             DocsPlatformPageSelectors.DATA_CARD_TITLE.value)
 
     def go_to_data_card_details(self):
@@ -1,8 +1,10 @@
-from time import sleep
-
 from pages.docs_portal_pages import DocsBasePage
 from utils.selectors_enums import DocsSearchSelectors
-from utils.ui_constants import DEFAULT_TIMEOUT
+from utils.ui_constants import (
+    DEFAULT_TIMEOUT,
+    FOCUS_TIMEOUT
+)
+from utils.ui_conditions import attribute_equals
 
 
 class DocsSearchComponent(DocsBasePage):
@@ -11,7 +13,7 @@ class DocsSearchComponent(DocsBasePage):
 
     @property
     def search_field(self):
-        return self.wait_for_element(
+        return self.element(
             DocsSearchSelectors.SEARCH_FIELD.value)
 
     def click_search_field(self):
@@ -20,28 +22,21 @@ class DocsSearchComponent(DocsBasePage):
         Asserts 'data-focus-visible-added' attribute is present
         as an indicator of focused search field.
         """
-        retry = 0
-        max_retry = 20
-        while True:
-            retry += 1
-            if retry >= 20:
-                self.make_screenshot('search_field_not_focused')
-                raise Exception(
-                    f'Search field is not focused '
-                    f'after clicking it {max_retry} times.')
-
+        max_retry = 3
+        for _ in range(max_retry):
             self.click_element(self.search_field)
-
-            attribute_name = 'data-focus-visible-added'
-            data_focus_visible_added_attribute = self.get_element_attribute_value(
-                self.search_field, attribute_name
-            )
-            if data_focus_visible_added_attribute == '':
-                break
-
-            sleep(1)
-
-            self.logger.info('Search is focused. Ready to type')
+            if self.wait_for_condition(
+                    attribute_equals(
+                        DocsSearchSelectors.SEARCH_FIELD.value,
+                        'data-focus-visible-added', ''),
+                    timeout=FOCUS_TIMEOUT, screenshot=False, raise_error=False):
+                self.logger.info('Search is focused. Ready to type')
+                return
+
+        self.make_screenshot('search_field_not_focused')
+        raise Exception(
+            f'Search field is not focused '
+            f'after clicking it {max_retry} times.')
 
     def search(self, text):
         """
@@ -12,37 +12,37 @@ class InvoiceCardPage(BasePage):
 
     @property
     def view_invoice_details_button(self):
-        return self.wait_for_element(
+        return self.element(
             InvoiceCardPageSelectors.VIEW_INVOICE_DETAILS_BUTTON.value)
 
     @property
     def close_invoice_details_from_card_button(self):
-        return self.wait_for_element(
+        return self.element(
             InvoiceCardPageSelectors.CLOSE_INVOICE_DETAILS_FROM_CARD_BUTTON.value)
 
     @property
     def close_invoice_details_x_button(self):
-        return self.wait_for_element(
+        return self.element(
             InvoiceCardPageSelectors.CLOSE_INVOICE_DETAILS_X_BUTTON.value)
 
     @property
     def invoice_details_contact_dr_button(self):
-        return self.wait_for_element(
+        return self.element(
             InvoiceCardPageSelectors.INVOICE_DETAILS_CONTACT_DR_BUTTON.value)
 
     @property
     def download_invoice_icon(self):
-        return self.wait_for_element(
+        return self.element(
             InvoiceCardPageSelectors.CARD_INVOICE_DOWNLOAD_ICON.value)
 
     @property
     def download_paid_invoice_button(self):
-        return self.wait_for_element(
+        return self.element(
             InvoiceCardPageSelectors.DOWNLOAD_PAID_INVOICE_BUTTON.value)
 
     @property
     def download_receipt_button(self):
-        return self.wait_for_element(
+        return self.element(
             InvoiceCardPageSelectors.DOWNLOAD_RECEIPT_BUTTON.value)
 
     def view_invoice_details(self):
@@ -1,6 +1,5 @@
-from time import sleep
-
 from pages.base_page import BasePage
+from utils.time_accounting import sleep
 from utils.selectors_enums import ModelingRightSidebarSelectors
 
 
@@ -10,22 +9,22 @@ class ModelingRightSidebar(BasePage):
 
     @property
     def pause_modeling_tasks_button(self):
-        return self.wait_for_element(
+        return self.element(
             ModelingRightSidebarSelectors.PAUSE_MODELING_TASKS_BUTTON.value)
 
     @property
     def start_modeling_tasks_button(self):
-        return self.wait_for_element(
+        return self.element(
             ModelingRightSidebarSelectors.START_MODELING_TASKS_BUTTON.value)
 
     @property
     def workers_count(self):
-        return self.wait_for_element(
+        return self.element(
             ModelingRightSidebarSelectors.WORKERS_COUNT.value)
 
     @property
     def decrease_workers_button(self):
-        return self.wait_for_element(
+        return self.element(
             ModelingRightSidebarSelectors.DECREASE_WORKERS_BUTTON.value)
 
     def pause_modeling_tasks(self):
@@ -1,18 +1,15 @@
-from time import sleep
-
 from pages.base_page import BasePage
 from utils.selectors_enums import (
     ModelsPageSelectors,
     DeploymentsPageSelectors
 )
-from utils.constants import TIMEOUT_MESSAGE
 from utils.ui_constants import WAIT_FOR_MODEL_TIMEOUT
-from utils.helper_funcs import (
-    time_left,
-    time,
-    get_id_from_url
-)
+from utils.helper_funcs import get_id_from_url
 from utils.data_enums import HtmlAttribute
+from utils.ui_conditions import (
+    attribute_not_contains,
+    attribute_absent
+)
 
 
 class ModelsPage(BasePage):
@@ -21,40 +18,40 @@ class ModelsPage(BasePage):
 
     @property
     def predict_tab(self):
-        return self.wait_for_element(
+        return self.element(
             ModelsPageSelectors.MODEL_DETAILS_PREDICT_TAB.value)
 
     @property
     def deploy_tab(self):
-        return self.wait_for_element(
+        return self.element(
             ModelsPageSelectors.MODEL_DETAILS_DEPLOY_TAB.value)
 
     @property
     def deploy_model_button(self):
-        return self.wait_for_element(
+        return self.element(
             # Model detailed view
             ModelsPageSelectors.DEPLOY_MODEL_BUTTON.value)
 
     @property
     def automodel_button(self):
-        return self.wait_for_element(
+        return self.element(
             ModelsPageSelectors.AUTOMODEL_BUTTON.value)
 
     @property
     def random_forest_classifier_gini_model_title(self):
-        return self.wait_for_element(
+        return self.element(
             ModelsPageSelectors.RANDOM_FOREST_CLASSIFIER_GINI_MODEL.value,
             timeout=WAIT_FOR_MODEL_TIMEOUT)
 
     @property
     def boosted_trees_classifier_model_title(self):
-        return self.wait_for_element(
+        return self.element(
             ModelsPageSelectors.GRADIENT_BOOSTED_TREES_CLASSIFIER_MODEL.value,
             timeout=WAIT_FOR_MODEL_TIMEOUT)
 
     @property
     def close_welcome_video_button(self):
-        return self.wait_for_element(
+        return self.element(
             ModelsPageSelectors.WELCOME_VIDEO_CLOSE_BUTTON.value)
 
     def expand_model(self, model_element):
@@ -66,31 +63,18 @@ class ModelsPage(BasePage):
 
         return model_id
 
-    def poll_for_predict_tab_enabled(self, timeout_period=8, poll_interval=5):
+    def poll_for_predict_tab_enabled(self, timeout_period=8):
         """
-        Polls for 'Predict' tab at model detailed view to be enabled by checking
+        Waits for 'Predict' tab at model detailed view to be enabled:
         its class attribute doesn't contain 'disabled' string.
         """
-        timeout = time() + 60 * timeout_period
-        while True:
-            class_attribute_value = self.get_attribute_value(
-                ModelsPageSelectors.MODEL_DETAILS_PREDICT_TAB.value, HtmlAttribute.CLASS.value
-            )
-            self.logger.info(
-                'Polling for Predict tab to be enabled. Time left %s', time_left(timeout)
-            )
-            if time() > timeout:
-                raise TimeoutError(
-                    TIMEOUT_MESSAGE.format(
-                    'Predict tab', 'to be enabled', class_attribute_value, timeout_period)
-                )
-            if HtmlAttribute.DISABLED.value not in class_attribute_value:
-                self.logger.info(
-                    'Predict tab is enabled. Class attribute value: "%s"', class_attribute_value
-                )
-                break
-
-            sleep(poll_interval)
+        self.wait_for_condition(
+            attribute_not_contains(
+                ModelsPageSelectors.MODEL_DETAILS_PREDICT_TAB.value,
+                HtmlAttribute.CLASS.value, HtmlAttribute.DISABLED.value),
+            timeout=timeout_period * 60 * 1000,
+            help_text='Predict tab is not enabled')
+        self.logger.info('Predict tab is enabled')
 
     def deploy_model(self):
         """
@@ -119,36 +103,22 @@ class ModelsPage(BasePage):
 
         return deployment_id
 
-    def poll_for_automodel_button_enabled(
-            self, selector, timeout_period=8, poll_interval=2):
-        """Polls for Automodel button to be enabled by checking it doesn't have 'disabled' attribute"""
-
-        timeout = time() + 60 * timeout_period
-        while True:
-            disable_attribute = self.get_attribute_value(
-                selector, HtmlAttribute.DISABLED.value, raise_error=False
-            )
-            self.logger.info(
-                'Polling for Automodel button to be enabled. Time left %s', time_left(timeout)
-            )
-            if time() > timeout:
-                raise TimeoutError(TIMEOUT_MESSAGE.format(
-                    'Automodel button', 'to be enabled',
-                    f'disabled attribute value: {disable_attribute}', timeout_period)
-                )
-            if disable_attribute is None:
-                self.logger.info('Automodel button is enabled.')
-                break
-
-            sleep(poll_interval)
-
-    def deploy_automodel(self, timeout_period=8, poll_interval=2):
+    def poll_for_automodel_button_enabled(self, selector, timeout_period=8):
+        """Waits for Automodel button to be enabled: it doesn't have 'disabled' attribute"""
+
+        self.wait_for_condition(
+            attribute_absent(selector, HtmlAttribute.DISABLED.value),
+            timeout=timeout_period * 60 * 1000,
+            help_text='Automodel button is not enabled')
+        self.logger.info('Automodel button is enabled.')
+
+    def deploy_automodel(self, timeout_period=8):
         """
         Deploys Automodel once the button is enabled.
         Retrieves and returns deployment_id from href attribute.
         """
         self.poll_for_automodel_button_enabled(
-            ModelsPageSelectors.AUTOMODEL_BUTTON.value, timeout_period, poll_interval)
+            ModelsPageSelectors.AUTOMODEL_BUTTON.value, timeout_period)
         # Click Automodel button
         self.click_element(self.automodel_button)
 
@@ -16,44 +16,44 @@ class NewPage(BasePage):
 
     @property
     def ai_catalog_button(self):
-        return self.wait_for_element(
+        return self.element(
             NewPageSelectors.AI_CATALOG_BUTTON.value)
 
     @property
     def hospital_readmission_import_button(self):
-        return self.wait_for_element(
+        return self.element(
             f'{NewPageSelectors.HOSPITAL_READMISSION_DEMO_DATASET.value}'
             f' {IMPORT_DATASET}')
 
     @property
     def predict_late_shipment_import_button(self):
-        return self.wait_for_element(
+        return self.element(
             f'{NewPageSelectors.PREDICT_LATE_SHIPMENT_DEMO_DATASET.value}'
             f' {IMPORT_DATASET}')
 
     @property
     def welcome_splash_modal_close_button(self):
-        return self.wait_for_element(
+        return self.element(
             NewPageSelectors.WELCOME_SPLASH_MODAL_CLOSE_BUTTON.value)
 
     @property
     def view_dataset_requirements_button(self):
-        return self.wait_for_element(
+        return self.element(
             NewPageSelectors.DATASETS_REQUIREMENTS_BUTTON.value)
 
     @property
     def dataset_requirements_modal_learn_more_button(self):
-        return self.wait_for_element(
+        return self.element(
             NewPageSelectors.DATASETS_REQUIREMENTS_MODAL_LEARN_MORE_BUTTON.value)
 
     @property
     def dataset_requirements_modal_got_it_button(self):
-        return self.wait_for_element(
+        return self.element(
             NewPageSelectors.DATASETS_REQUIREMENTS_MODAL_GOT_IT_BUTTON.value)
 
     @property
     def dataset_requirements_modal_close_button(self):
-        return self.wait_for_element(
+        return self.element(
             NewPageSelectors.DATASETS_REQUIREMENTS_MODAL_CLOSE_BUTTON.value)
 
     def view_dataset_requirements(self):
@@ -9,47 +9,47 @@ class PendoTourPage(BasePage):
 
     @property
     def no_thanks_button(self):
-        return self.wait_for_element(
+        return self.element(
             PendoTourSelectors.NO_THANKS_BUTTON.value)
 
     @property
     def remind_me_tomorrow_button(self):
-        return self.wait_for_element(
+        return self.element(
             PendoTourSelectors.REMIND_ME_TOMORROW_BUTTON.value)
 
     @property
     def close_tour_x_button(self):
-        return self.wait_for_element(
+        return self.element(
             PendoTourSelectors.CLOSE_TOUR_X_BUTTON.value)
 
     @property
     def start_tour_button(self):
-        return self.wait_for_element(
+        return self.element(
             PendoTourSelectors.START_TOUR_BUTTON.value)
 
     @property
     def show_me_around_button(self):
-        return self.wait_for_element(
+        return self.element(
             PendoTourSelectors.SHOW_ME_AROUND_BUTTON.value)
 
     @property
     def back_button(self):
-        return self.wait_for_element(
+        return self.element(
             PendoTourSelectors.BACK_BUTTON.value)
 
     @property
     def next_button(self):
-        return self.wait_for_element(
+        return self.element(
             PendoTourSelectors.NEXT_BUTTON.value)
 
     @property
     def helpful_no_button(self):
-        return self.wait_for_element(
+        return self.element(
             PendoTourSelectors.HELPFUL_NO_BUTTON.value)
 
     @property
     def helpful_yes_button(self):
-        return self.wait_for_element(
+        return self.element(
             PendoTourSelectors.HELPFUL_YES_BUTTON.value)
 
     def start_tour(self, wait_for_back_button=True, tooltip_title=''):
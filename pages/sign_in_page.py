@@ -16,36 +16,36 @@ class SignInPage(BasePage):
     def email_field(self):
         if Envs.PROD.value in self.app_host:
             return self.auth0_email_field
-        return self.wait_for_element(
+        return self.element(
             SignInPageSelectors.STAGING_EMAIL_FIELD.value)
 
     @property
     def auth0_email_field(self):
-        return self.wait_for_element(
+        return self.element(
             SignInPageSelectors.APP2_EMAIL_FIELD.value)
 
     @property
     def password_field(self):
         if Envs.PROD.value in self.app_host:
             return self.auth0_password_field
-        return self.wait_for_element(
+        return self.element(
             SignInPageSelectors.STAGING_PASSWORD_FIELD.value)
 
     @property
     def auth0_password_field(self):
-        return self.wait_for_element(
+        return self.element(
             SignInPageSelectors.APP2_PASSWORD_FIELD.value)
 
     @property
     def sign_in_button(self):
         if Envs.PROD.value in self.app_host:
             return self.auth0_sign_in_button
-        return self.wait_for_element(
+        return self.element(
             SignInPageSelectors.STAGING_SIGN_IN_BUTTON.value)
 
     @property
     def auth0_sign_in_button(self):
-        return self.wait_for_element(
+        return self.element(
             SignInPageSelectors.APP2_SIGN_IN_BUTTON.value)
 
     def sign_in(self, username, is_auth0=False):
@@ -102,3 +102,14 @@ class SignInPage(BasePage):
                 TopMenuSelectors.DR_LOGO.value)
 
         self.logger.info('User %s signed in', username)
+
+    def sign_in_with_cookies(self, username, cookies):
+        """
+        Signs in user by adding session cookies of API login to browser context.
+        Goes to the app and waits for app2/staging DataRobot logo.
+        """
+        self.page.context.add_cookies(cookies)
+        self.navigate(wait_for_element=True,
+                      selector=TopMenuSelectors.DR_LOGO.value)
+
+        self.logger.info('User %s signed in with API session cookies', username)
@@ -1,5 +1,3 @@
-from time import sleep
-
 from pages.base_page import BasePage
 from utils.selectors_enums import (
     TopMenuSelectors,
@@ -11,6 +9,7 @@ from utils.helper_funcs import (
 )
 from utils.data_enums import HtmlAttribute
 from utils.errors import ElementAttributeTimeoutException
+from utils.ui_conditions import attribute_contains
 
 
 class TopMenuPage(BasePage):
@@ -19,49 +18,52 @@ class TopMenuPage(BasePage):
 
     @property
     def dr_logo_icon(self):
-        return self.wait_for_element(
+        return self.element(
             TopMenuSelectors.DR_LOGO.value)
 
     @property
     def models_tab(self):
-        return self.wait_for_element(
+        return self.element(
             TopMenuSelectors.MODELS_TAB.value)
 
     @property
     def deployments_tab(self):
-        return self.wait_for_element(
+        return self.element(
             TopMenuSelectors.DEPLOYMENTS_TAB.value)
 
     @property
     def profile_icon(self):
-        return self.wait_for_element(
+        return self.element(
             TopMenuSelectors.DEPLOYMENTS_TAB.value)
 
     @property
     def profile_and_settings_option(self):
-        return self.wait_for_element(
+        return self.element(
             TopMenuSelectors.PROFILE_AND_SETTINGS_OPTION.value)
 
     def go_to_models_page(self):
         self.go_to_top_menu_page(
             self.models_tab,
-            TopMenuSelectors.MODELS_TAB.value)
+            TopMenuSelectors.MODELS_TAB.value, page_name='Models')
 
     def go_to_deployments_page(self):
         self.go_to_top_menu_page(
             self.deployments_tab,
-            TopMenuSelectors.DEPLOYMENTS_TAB.value)
+            TopMenuSelectors.DEPLOYMENTS_TAB.value, page_name='Deployments')
 
     def go_to_top_menu_page(
             self, page_tab_element, page_tab_selector,
-            close_pendo_tour=True, timeout_period=2, poll_interval=2
+            close_pendo_tour=True, timeout_period=2, poll_interval=2,
+            page_name=None
     ):
         """
         Goes to top menu page by clicking page tab,
         e.g. Models, Deployments, etc.
         Page element should have 'active' in class attribute,
         meaning the page has loaded.
+        With --web_perf, captures web performance of the navigation as page_name page.
         """
+        navigation_start = self.performance_now()
         timeout = time() + 60 * timeout_period
         while True:
             self.click_element(page_tab_element)
@@ -69,11 +71,19 @@ class TopMenuPage(BasePage):
                 if page_tab_selector == TopMenuSelectors.MODELS_TAB.value:
                     self.close_pendo_tour_if_present()
 
-            class_attribute = self.get_attribute_value(
-                page_tab_selector, HtmlAttribute.CLASS.value
-            )
+            # 'class' attribute value contains 'active'
+            # if page tab is selected
+            if self.wait_for_condition(
+                    attribute_contains(
+                        page_tab_selector, HtmlAttribute.CLASS.value, 'active'),
+                    timeout=poll_interval * 1000,
+                    screenshot=False, raise_error=False):
+                self.logger.info('User is at top menu page with %s selector',
+                                 page_tab_selector)
+                break
+
             self.logger.info(
-                'Polling for top menu page with selector %s to load. '
+                'Clicking top menu page tab with selector %s again. '
                 'Time left %s', page_tab_selector, time_left(timeout)
             )
             if time() > timeout:
@@ -82,14 +92,8 @@ class TopMenuPage(BasePage):
                     f'Expected "active" in attribute. '
                     f'User is not at page with {page_tab_selector} selector'
                 )
-            # 'class' attribute value contains 'active'
-            # if page tab is selected
-            if 'active' in class_attribute:
-                self.logger.info('User is at top menu page with %s selector',
-                                 page_tab_selector)
-                break
 
-            sleep(poll_interval)
+        self.capture_web_performance(page_name, navigation_start)
 
     def go_to_home_page_by_clicking_dr_logo_icon(self):
         """Goes to Home page by clicking DR logo icon from top left corner."""
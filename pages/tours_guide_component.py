@@ -1,5 +1,3 @@
-from time import sleep
-
 from pages.base_page import BasePage
 from utils.selectors_enums import (
     ToursGuideSelectors,
@@ -14,29 +12,29 @@ class ToursGuideComponent(BasePage):
 
     @property
     def robot_icon(self):
-        return self.wait_for_element(
+        return self.element(
             ToursGuideSelectors.ROBOT_ICON.value)
 
     @property
     def announcements_button(self):
         # Both Tour Guide menu option and 'back' button
         # to return from ANNOUNCEMENTS to Tour Guide
-        return self.wait_for_element(
+        return self.element(
             ToursGuideSelectors.ANNOUNCEMENTS.value)
 
     @property
     def onboarding_tours_button(self):
-        return self.wait_for_element(
+        return self.element(
             ToursGuideSelectors.ONBOARDING_TOURS.value)
 
     @property
     def progress_bar_section(self):
-        return self.wait_for_element(
+        return self.element(
             ToursGuideSelectors.PROGRESS_BAR.value)
 
     @property
     def build_ai_models_tour(self):
-        return self.wait_for_element(
+        return self.element(
             ToursGuideSelectors.BUILD_AI_MODELS_TOUR.value)
 
     def get_robot_icon_notifications_count(self):
@@ -130,8 +128,8 @@ class ToursGuideComponent(BasePage):
         Clicks ANNOUNCEMENTS header to return from ANNOUNCEMENTS details
         to Tours Guide.
         """
-        # the only option to successfully click the element
-        sleep(5)
+        # the element can't be clicked while announcement details slide in
+        self.wait_for_animations_finished()
         self.click_element(self.announcements_button)
         self.is_element_present(
             ToursGuideSelectors.EXPLORE_DATAROBOT_GUIDE_HEADER.value,
@@ -12,6 +12,9 @@ cd self-service-api-tests || exit
 pip install --upgrade pip
 pip install -r requirements.txt
 
+# report only: import time doesn't block the tests
+python -m utils.import_profile || echo "> Import profile check failed, see the report above"
+
 cd tests || exit
 
 echo ""
@@ -19,4 +22,4 @@ echo "> Starting to run the tests"
 echo ""
 
 python -m pytest --app_host "$ENV" --dr_account_host "$DR_ACCOUNT_HOST" --auth0_host="$AUTH0_HOST" --reruns "$RERUN" \
--n "$CPUS" -m "$GROUP" --html=test_report.html --junitxml=junit_report.xml -s -v
+-n "$CPUS" --lpt_schedule -m "$GROUP" --ignore=ui --html=test_report.html --junitxml=junit_report.xml -s -v
@@ -109,22 +109,21 @@ def credit_packs(env_params):
 
 
 @fixture
-def checkout_created_ts(dr_account_client, resp_json):
+def checkout_created_ts(dr_account_client):
     """
     Returns "created" key for given "productName" (credit pack) from
-    GET api/billing/getCheckoutHistory?portalId={portalId} response
+    GET api/billing/getCheckoutHistory?portalId={portalId} pages,
+    no more pages are requested once the checkout is found
     """
     def checkout_created_ts(credit_pack_name):
 
-        checkouts = resp_json(
-            dr_account_client.get_checkout_history()
+        checkout = next(
+            (checkout for checkout in dr_account_client.iter_checkout_history()
+             if checkout['productName'] == credit_pack_name),
+            None
         )
-        checkout = [
-            checkout for checkout in checkouts
-            if checkout['productName'] == credit_pack_name
-        ]
         if checkout:
-            created_ts = checkout[0]['created']
+            created_ts = checkout['created']
             LOGGER.info(
                 'Found created_ts %s for pack %s',
                 created_ts, credit_pack_name
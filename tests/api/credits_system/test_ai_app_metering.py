@@ -1,11 +1,11 @@
 import logging
-from time import sleep
 
 from pytest import (
     mark,
     fixture
 )
 
+from utils.time_accounting import sleep
 from utils.constants import (
     ASSERT_ERRORS,
     ANIMALS_DATASET,
@@ -60,6 +60,8 @@ def what_if_app(grant_credits,
 
 @mark.credits_system
 @mark.trial
+@mark.resource('autopilot')
+@mark.resource('deployment')
 def test_ai_app_metering(payg_drap_user_setup_teardown,
                          what_if_app,
                          get_ai_app_uptime_info,
@@ -1,8 +1,8 @@
-from time import sleep
 import logging
 
 from pytest import mark
 
+from utils.time_accounting import sleep
 from utils.data_enums import (
     CreditPackType,
     NfKeys
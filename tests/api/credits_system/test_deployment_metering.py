@@ -1,11 +1,11 @@
 import logging
-from time import sleep
 
 from pytest import (
     mark,
     fixture
 )
 
+from utils.time_accounting import sleep
 from utils.constants import (
     ASSERT_ERRORS,
     ERROR_JSON_KEY,
@@ -41,6 +41,8 @@ def deployment(grant_credits, app_client,
 
 @mark.credits_system
 @mark.trial
+@mark.resource('autopilot')
+@mark.resource('deployment')
 def test_deployment_metering(payg_drap_user_setup_teardown,
                              deployment,
                              poll_for_deploy_uptime,
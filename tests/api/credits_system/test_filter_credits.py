@@ -1,7 +1,4 @@
-from time import (
-    time,
-    sleep
-)
+from time import time
 import logging
 
 from pytest import (
@@ -9,11 +6,11 @@ from pytest import (
     fixture
 )
 
+from utils.time_accounting import sleep
 from utils.constants import (
     ANIMALS_DATASET,
     ASSERT_ERRORS,
     TIMEOUT_MESSAGE,
-    ERROR_JSON_KEY,
     TEN_K_DIABETES_PROJECT_NAME
 )
 from utils.helper_funcs import (
@@ -30,6 +27,7 @@ LOGGER = logging.getLogger(__name__)
 ANIMALS_PROJECT = 'animals.csv'
 CATEGORY = 'category'
 PROJECT_NAME = 'projectName'
+SEGMENT_KEY = 'key'
 
 TIMEOUT_PERIOD = 15
 USAGE_SUMMARY_MSG = 'in GET creditUsageSummary/?segmentBy={}'
@@ -76,30 +74,23 @@ def setup_2_projects(payg_drap_user_setup_teardown):
 @mark.credits_system
 @mark.trial
 def test_credit_usage_summary_by_project(setup_2_projects, assert_total_usage,
-                                         resp_key_value):
+                                         assert_segment_keys):
 
     app_client, _, _, _ = setup_2_projects
     resp = app_client.v2_get_credit_usage_summary(utc_to_iso(),
                                                   segment_by=PROJECT_NAME)
     errors = []
     assert_total_usage(resp, errors)
-
-    resp_key_value(resp,
-                   expected_value=TEN_K_DIABETES_PROJECT_NAME,
-                   errors_list=errors,
-                   data_index=0)
-
-    resp_key_value(resp,
-                   expected_value=ANIMALS_PROJECT,
-                   errors_list=errors,
-                   data_index=1)
+    assert_segment_keys(resp,
+                        expected_keys=[TEN_K_DIABETES_PROJECT_NAME, ANIMALS_PROJECT],
+                        errors_list=errors)
 
     assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
 
 
 @mark.credits_system
 @mark.trial
-def test_credit_usage_summary_by_category(setup_2_projects, resp_key_value,
+def test_credit_usage_summary_by_category(setup_2_projects, assert_segment_keys,
                                           assert_total_usage):
 
     app_client, _, _, _ = setup_2_projects
@@ -108,21 +99,11 @@ def test_credit_usage_summary_by_category(setup_2_projects, resp_key_value,
                                                   segment_by=CATEGORY)
     errors = []
     assert_total_usage(resp, errors)
-
-    resp_key_value(resp,
-                   expected_value=CreditsCategory.DATA_PROCESSING.value,
-                   errors_list=errors,
-                   data_index=0)
-
-    resp_key_value(resp,
-                   expected_value=CreditsCategory.ML_DEV.value,
-                   errors_list=errors,
-                   data_index=1)
-
-    resp_key_value(resp,
-                   expected_value=CreditsCategory.ML_OPS.value,
-                   errors_list=errors,
-                   data_index=2)
+    assert_segment_keys(resp,
+                        expected_keys=[CreditsCategory.DATA_PROCESSING.value,
+                                       CreditsCategory.ML_DEV.value,
+                                       CreditsCategory.ML_OPS.value],
+                        errors_list=errors)
 
     assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
 
@@ -141,18 +122,15 @@ def assert_total_usage(resp_json):
 
 
 @fixture
-def resp_key_value(resp_json):
+def assert_segment_keys(resp_json, credit_records):
     """
-    Assert [data][data_index][key] value
+    Assert [data][index][key] values of the first len(expected_keys) segments
     from GET api/v2/creditsSystem/creditUsageSummary response
     """
-    def resp_key_value_(resp, expected_value, errors_list, data_index=0):
-        actual_value = resp_json(resp)['data'][data_index]['key']
-        if actual_value != expected_value:
-            errors_list.append(
-                ERROR_JSON_KEY.format(
-                    expected_value, '[data][index][key]', actual_value))
-    return resp_key_value_
+    def segment_keys(resp, expected_keys, errors_list):
+        records = credit_records(resp_json(resp), fields=(SEGMENT_KEY,))
+        records.check_column(SEGMENT_KEY, expected_keys, errors_list)
+    return segment_keys
 
 
 def _poll_for_projects_are_billed(app_client):
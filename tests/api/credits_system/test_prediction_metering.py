@@ -59,6 +59,8 @@ def make_predictions(payg_drap_user_setup_teardown,
 
 @mark.credits_system
 @mark.trial
+@mark.resource('autopilot')
+@mark.resource('deployment')
 def test_predictions_are_metered(make_predictions,
                                  is_credit_category_found,
                                  category_credit_usage,
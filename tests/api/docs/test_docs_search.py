@@ -1,4 +1,5 @@
 import os
+import json
 
 from pytest import mark
 
@@ -7,6 +8,8 @@ from utils.constants import (
     TEST_FILES_PATH,
     ASSERT_ERRORS
 )
+from utils.dict_diff import compile_ignored
+from utils.http_utils import ResponseHandler
 
 
 QUERY_STRING = 'configure time-aware feature engineering'
@@ -18,11 +21,8 @@ def test_search_all(docs_client, get_dicts_diff):
 
     resp = docs_client.search(QUERY_STRING)
 
-    # ignore dynamic values for processingTimeMS and objectID (for 3 hits) keys
-    ignored_keys = (
-        PROCESSING_TIME_KEY, OBJECT_ID_HIT_1, OBJECT_ID_HIT_2, OBJECT_ID_HIT_3
-    )
-    difference = get_dicts_diff(resp, DOCS_SEARCH_ALL, ignored_keys)
+    # ignore dynamic values of processingTimeMS and objectID of hits
+    difference = get_dicts_diff(resp, DOCS_SEARCH_ALL, IGNORED_KEYS)
 
     assert not difference, f'Responses do not match. Diff:\n {difference}'
 
@@ -32,8 +32,7 @@ def test_search_filter_by_platform(docs_client, get_dicts_diff):
 
     resp = docs_client.search(QUERY_STRING, filters='itemType:platform')
 
-    ignored_keys = (PROCESSING_TIME_KEY, OBJECT_ID_HIT_1)
-    difference = get_dicts_diff(resp, DOCS_SEARCH_PLATFORM, ignored_keys)
+    difference = get_dicts_diff(resp, DOCS_SEARCH_PLATFORM, IGNORED_KEYS)
 
     assert not difference, f'Responses do not match. Diff:\n {difference}'
 
@@ -43,8 +42,7 @@ def test_search_filter_by_api(docs_client, get_dicts_diff):
 
     resp = docs_client.search(QUERY_STRING, filters='itemType:api')
 
-    ignored_keys = (PROCESSING_TIME_KEY, OBJECT_ID_HIT_1)
-    difference = get_dicts_diff(resp, DOCS_SEARCH_API, ignored_keys)
+    difference = get_dicts_diff(resp, DOCS_SEARCH_API, IGNORED_KEYS)
 
     assert not difference, f'Responses do not match. Diff:\n {difference}'
 
@@ -54,32 +52,32 @@ def test_search_filter_by_tutorials(docs_client, get_dicts_diff):
 
     resp = docs_client.search(QUERY_STRING, filters='itemType:tutorials')
 
-    ignored_keys = (PROCESSING_TIME_KEY, OBJECT_ID_HIT_1, OBJECT_ID_HIT_2)
-    difference = get_dicts_diff(resp, DOCS_SEARCH_TUTORIALS, ignored_keys)
+    difference = get_dicts_diff(resp, DOCS_SEARCH_TUTORIALS, IGNORED_KEYS)
 
     assert not difference, f'Responses do not match. Diff:\n {difference}'
 
 
+@mark.docs
+def test_search_hits_streamed(docs_client):
+
+    resp = docs_client.search(QUERY_STRING)
+    streamed_resp = docs_client.search(QUERY_STRING, stream=True)
+
+    expected_hits = json.loads(resp.text)['results'][0]['hits']
+    streamed_hits = list(ResponseHandler(streamed_resp).iter_json_items(HITS_PATH))
+
+    assert streamed_hits == expected_hits, \
+        f'Streamed hits do not match. Streamed: {streamed_hits}\nExpected: {expected_hits}'
+
+
 @mark.docs
 def test_search_multiple_pages(docs_client, get_dicts_diff, resp_json):
 
     resp_page0 = docs_client.search(QUERY_STRING_2_PAGES, page=0, filters=None)
     resp_page1 = docs_client.search(QUERY_STRING_2_PAGES, page=1, filters=None)
 
-    ignored_keys_page0 = (
-        PROCESSING_TIME_KEY, OBJECT_ID_HIT_1, OBJECT_ID_HIT_2,
-        OBJECT_ID_HIT_3, OBJECT_ID_HIT_4, OBJECT_ID_HIT_5, OBJECT_ID_HIT_6,
-        OBJECT_ID_HIT_7, OBJECT_ID_HIT_8, OBJECT_ID_HIT_9, OBJECT_ID_HIT_10
-    )
-    ignored_keys_page1 = (
-        PROCESSING_TIME_KEY, OBJECT_ID_HIT_1, OBJECT_ID_HIT_2,
-        OBJECT_ID_HIT_3, OBJECT_ID_HIT_4, OBJECT_ID_HIT_5
-    )
-    diff_page0 = get_dicts_diff(
-        resp_page0, DOCS_SEARCH_PAGE_0, ignored_keys_page0
-    )
-    diff_page1 = get_dicts_diff(
-        resp_page1, DOCS_SEARCH_PAGE_1, ignored_keys_page1)
+    diff_page0 = get_dicts_diff(resp_page0, DOCS_SEARCH_PAGE_0, IGNORED_KEYS)
+    diff_page1 = get_dicts_diff(resp_page1, DOCS_SEARCH_PAGE_1, IGNORED_KEYS)
 
     errors = []
     if diff_page0:
@@ -94,17 +92,10 @@ def test_search_multiple_pages(docs_client, get_dicts_diff, resp_json):
     assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
 
 
-PROCESSING_TIME_KEY = ['results', 0, 'processingTimeMS']
-OBJECT_ID_HIT_1 = ['results', 0, 'hits', 0, 'objectID']
-OBJECT_ID_HIT_2 = ['results', 0, 'hits', 1, 'objectID']
-OBJECT_ID_HIT_3 = ['results', 0, 'hits', 2, 'objectID']
-OBJECT_ID_HIT_4 = ['results', 0, 'hits', 3, 'objectID']
-OBJECT_ID_HIT_5 = ['results', 0, 'hits', 4, 'objectID']
-OBJECT_ID_HIT_6 = ['results', 0, 'hits', 5, 'objectID']
-OBJECT_ID_HIT_7 = ['results', 0, 'hits', 6, 'objectID']
-OBJECT_ID_HIT_8 = ['results', 0, 'hits', 7, 'objectID']
-OBJECT_ID_HIT_9 = ['results', 0, 'hits', 8, 'objectID']
-OBJECT_ID_HIT_10 = ['results', 0, 'hits', 9, 'objectID']
+PROCESSING_TIME_KEY = 'results.*.processingTimeMS'
+OBJECT_ID_KEY = 'results.*.hits.*.objectID'
+IGNORED_KEYS = compile_ignored((PROCESSING_TIME_KEY, OBJECT_ID_KEY))
+HITS_PATH = 'results[0].hits[*]'
 
 
 DOCS_SEARCH_ALL = os.path.join(
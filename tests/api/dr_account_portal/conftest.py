@@ -9,7 +9,8 @@ from utils.constants import (
     METERING_START_TS_NO_TZ,
     METERING_END_TS_NO_TZ,
     STAGING_SELF_SERVICE_TEST_USER,
-    USER_PASSWORD
+    USER_PASSWORD,
+    ERROR_JSON_KEY
 )
 from utils.clients import Auth0Client
 from utils.helper_funcs import (
@@ -23,6 +24,7 @@ from utils.helper_funcs import (
     adjust_balance_summary_tests
 )
 from utils.data_enums import (
+    CreditUsageDetailsKeys,
     CreditsSystemDataSource,
     MeteringType,
     Envs,
@@ -451,6 +453,31 @@ def success_register_resp(dr_account_client):
     return register_resp
 
 
+@fixture
+def assert_credit_usage_details(credit_records):
+    """
+    Assert totalCount and records of GET api/creditsSystem/creditUsageDetails
+    JSON response regardless of records order
+    """
+    def credit_usage_details(resp, expected_records, errors_list, add_text=''):
+        errors = []
+        total_count = resp[CreditUsageDetailsKeys.TOTAL_COUNT.value]
+        if total_count != len(expected_records):
+            errors.append(ERROR_JSON_KEY.format(
+                len(expected_records), CreditUsageDetailsKeys.TOTAL_COUNT.value, total_count))
+
+        records = credit_records(resp)
+        records.check_keys(errors)
+        records.check_types('category', str, errors)
+        for field in ('projectId', 'projectName', 'deploymentId', 'deploymentLabel'):
+            records.check_types(field, str, errors, nullable=True)
+        records.check_range('creditUsage', errors, min_value=0)
+        records.check_equals(expected_records, errors)
+        errors_list.extend(f'{add_text}: {error}' if add_text else error for error in errors)
+
+    return credit_usage_details
+
+
 @fixture
 def ml_category():
     def ml_category_(value=1.5):
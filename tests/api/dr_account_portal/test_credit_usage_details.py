@@ -20,10 +20,6 @@ from utils.constants import (
     NOT_VALID_ACCOUNT_ERROR,
     PORTAL_ID_ERROR
 )
-from utils.helper_funcs import (
-    sort_list_of_dicts,
-    sort_credits_system_data_dicts
-)
 from utils.data_enums import (
     CreditUsageDetailsKeys,
     MeteringType
@@ -37,6 +33,7 @@ DATA_LENGTH_ERROR_TEXT = 'data list length is not {}'
 def test_get_credit_usage_details_start_ts_less_end_ts_more(dr_account_client,
                                                             register_single_user_data,
                                                             resp_json,
+                                                            assert_credit_usage_details,
                                                             ml_category,
                                                             mm_category,
                                                             purchase_category,
@@ -47,18 +44,15 @@ def test_get_credit_usage_details_start_ts_less_end_ts_more(dr_account_client,
         dr_account_client.get_credit_usage_details('2020-07-07T08:00:00Z',
                                                    '2020-08-08T11:00:00Z',
                                                    dr_account_client.portal_id))
-    actual_resp = sort_credits_system_data_dicts(resp)
-
-    expected_resp = {
-        'totalCount': 4,
-        'data': sort_list_of_dicts([ml_category(),
-                                    mm_category(),
-                                    purchase_category(),
-                                    prediction_category()])}
+    errors = []
+    assert_credit_usage_details(resp,
+                                expected_records=[ml_category(),
+                                                  mm_category(),
+                                                  purchase_category(),
+                                                  prediction_category()],
+                                errors_list=errors)
 
-    assert actual_resp == expected_resp, \
-        ERROR_JSON_RESP.format(
-            'with earlier start and later end date', expected_resp, actual_resp)
+    assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
 
 
 @mark.dr_account_portal
@@ -432,6 +426,38 @@ def test_credit_usage_details_limit_offset(dr_account_client,
     assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
 
 
+@mark.dr_account_portal
+def test_credit_usage_details_all_pages(dr_account_client,
+                                        register_single_user_data,
+                                        assert_credit_usage_details,
+                                        ml_category,
+                                        mm_category,
+                                        purchase_category,
+                                        prediction_category):
+    register_single_user_data()
+
+    # 4 records are read by 2 pages
+    credit_usage_details = dr_account_client.iter_credit_usage_details(
+        METERING_START_TS_TZ,
+        METERING_END_TS_TZ,
+        dr_account_client.portal_id,
+        page_size=2)
+
+    errors = []
+    assert_credit_usage_details({'totalCount': credit_usage_details.total_count(),
+                                 'data': list(credit_usage_details)},
+                                expected_records=[ml_category(),
+                                                  mm_category(),
+                                                  purchase_category(),
+                                                  prediction_category()],
+                                errors_list=errors)
+
+    if len(credit_usage_details.first(1)) != 1:
+        errors.append(DATA_LENGTH_ERROR_TEXT.format('1'))
+
+    assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
+
+
 @mark.dr_account_portal
 def test_get_credit_usage_details_for_deleted_user(portal_user_setup,
                                                    dr_account_client,
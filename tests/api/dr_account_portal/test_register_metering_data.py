@@ -5,9 +5,7 @@ from pytest import (
 
 from utils.helper_funcs import (
     convert_json_to_dict,
-    generate_unique_email,
-    sort_credits_system_data_dicts,
-    sort_list_of_dicts
+    generate_unique_email
 )
 from utils.constants import (
     ASSERT_ERRORS,
@@ -32,6 +30,7 @@ RESP_DO_NOT_MATCH_ERROR_TEXT = 'Responses do not match after registering data {}
 def test_register_valid_metering_data_one_user(dr_account_client,
                                                metering_data,
                                                resp_json,
+                                               assert_credit_usage_details,
                                                ml_category,
                                                mm_category,
                                                prediction_category,
@@ -43,24 +42,21 @@ def test_register_valid_metering_data_one_user(dr_account_client,
         METERING_START_TS_TZ,
         METERING_END_TS_TZ,
         dr_account_client.portal_id))
-    actual_resp = sort_credits_system_data_dicts(resp)
+    errors = []
+    assert_credit_usage_details(resp,
+                                expected_records=[ml_category(),
+                                                  mm_category(),
+                                                  purchase_category(),
+                                                  prediction_category()],
+                                errors_list=errors)
 
-    expected_resp = {
-        'totalCount': 4,
-        'data': sort_list_of_dicts([ml_category(),
-                                    mm_category(),
-                                    purchase_category(),
-                                    prediction_category()])
-    }
-    assert actual_resp == expected_resp, \
-        ERROR_JSON_RESP.format(
-            'for a single user', expected_resp, actual_resp)
+    assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
 
 
 @mark.dr_account_portal
 def test_register_metering_data_same_user_different_period_twice(dr_account_client,
                                                                  metering_data,
-                                                                 assert_json_resp,
+                                                                 assert_credit_usage_details,
                                                                  ml_category,
                                                                  mm_category,
                                                                  purchase_category,
@@ -76,13 +72,6 @@ def test_register_metering_data_same_user_different_period_twice(dr_account_clie
         dr_account_client.get_credit_usage_details('2019-09-10T08:00:00Z',
                                                    '2019-09-11T08:00:00Z',
                                                    portal_id))
-    actual_resp_1 = sort_credits_system_data_dicts(resp_1)
-    expected_resp_1 = {
-        'totalCount': 4,
-        'data': sort_list_of_dicts([ml_category(),
-                                    mm_category(),
-                                    purchase_category(),
-                                    prediction_category()])}
 
     dr_account_client.admin_register_metering_data(
         metering_data(value=1.8,
@@ -92,18 +81,21 @@ def test_register_metering_data_same_user_different_period_twice(dr_account_clie
         dr_account_client.get_credit_usage_details('2019-09-13T08:00:00Z',
                                                    '2019-09-14T08:00:00Z',
                                                    portal_id))
-    actual_resp_2 = sort_credits_system_data_dicts(resp_2)
-    expected_resp_2 = {
-        'totalCount': 4,
-        'data': sort_list_of_dicts([ml_category(1.8),
-                                    mm_category(3.7),
-                                    purchase_category(3.799),
-                                    prediction_category(3.79)])}
     errors = []
-    if actual_resp_1 != expected_resp_1:
-        errors.append(RESP_DO_NOT_MATCH_ERROR_TEXT.format('1st'))
-    if actual_resp_2 != expected_resp_2:
-        errors.append(RESP_DO_NOT_MATCH_ERROR_TEXT.format('2nd'))
+    assert_credit_usage_details(resp_1,
+                                expected_records=[ml_category(),
+                                                  mm_category(),
+                                                  purchase_category(),
+                                                  prediction_category()],
+                                errors_list=errors,
+                                add_text=RESP_DO_NOT_MATCH_ERROR_TEXT.format('1st'))
+    assert_credit_usage_details(resp_2,
+                                expected_records=[ml_category(1.8),
+                                                  mm_category(3.7),
+                                                  purchase_category(3.799),
+                                                  prediction_category(3.79)],
+                                errors_list=errors,
+                                add_text=RESP_DO_NOT_MATCH_ERROR_TEXT.format('2nd'))
 
     assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
 
@@ -111,7 +103,7 @@ def test_register_metering_data_same_user_different_period_twice(dr_account_clie
 @mark.dr_account_portal
 def test_register_metering_data_for_same_user_same_period_twice(dr_account_client,
                                                                 metering_data,
-                                                                assert_json_resp,
+                                                                assert_credit_usage_details,
                                                                 ml_category,
                                                                 mm_category,
                                                                 purchase_category,
@@ -125,7 +117,6 @@ def test_register_metering_data_for_same_user_same_period_twice(dr_account_clien
         dr_account_client.get_credit_usage_details(METERING_START_TS_TZ,
                                                    METERING_END_TS_TZ,
                                                    dr_account_client.portal_id))
-    actual_resp_1 = sort_credits_system_data_dicts(resp_1)
 
     dr_account_client.admin_register_metering_data(
         metering_data(value=1.8,
@@ -135,19 +126,16 @@ def test_register_metering_data_for_same_user_same_period_twice(dr_account_clien
         dr_account_client.get_credit_usage_details(METERING_START_TS_TZ,
                                                    METERING_END_TS_TZ,
                                                    dr_account_client.portal_id))
-    actual_resp_2 = sort_credits_system_data_dicts(resp_2)
-
-    expected_resp = {
-        'totalCount': 4,
-        'data': sort_list_of_dicts([ml_category(),
-                                    mm_category(),
-                                    purchase_category(),
-                                    prediction_category()])}
+
+    expected_records = [ml_category(),
+                        mm_category(),
+                        purchase_category(),
+                        prediction_category()]
     errors = []
-    if actual_resp_1 != expected_resp:
-        errors.append(RESP_DO_NOT_MATCH_ERROR_TEXT.format('1st'))
-    if actual_resp_2 != expected_resp:
-        errors.append(RESP_DO_NOT_MATCH_ERROR_TEXT.format('2nd'))
+    assert_credit_usage_details(resp_1, expected_records, errors,
+                                add_text=RESP_DO_NOT_MATCH_ERROR_TEXT.format('1st'))
+    assert_credit_usage_details(resp_2, expected_records, errors,
+                                add_text=RESP_DO_NOT_MATCH_ERROR_TEXT.format('2nd'))
 
     assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
 
@@ -156,6 +144,7 @@ def test_register_metering_data_for_same_user_same_period_twice(dr_account_clien
 def test_register_valid_metering_data_two_users(dr_account_client,
                                                 metering_data,
                                                 resp_json,
+                                                assert_credit_usage_details,
                                                 ml_category,
                                                 mm_category,
                                                 purchase_category,
@@ -169,21 +158,20 @@ def test_register_valid_metering_data_two_users(dr_account_client,
         dr_account_client.get_credit_usage_details(METERING_START_TS_TZ,
                                                    METERING_END_TS_TZ,
                                                    dr_account_client.portal_id))
-    actual_resp = sort_credits_system_data_dicts(resp)
-
-    expected_resp = {
-        'totalCount': 8,
-        'data': sort_list_of_dicts([ml_category(33.598),
-                                    mm_category(35.498),
-                                    purchase_category(35.597),
-                                    prediction_category(35.588),
-                                    ml_category(33.598),
-                                    mm_category(35.498),
-                                    purchase_category(35.597),
-                                    prediction_category(35.588)])}
-
-    assert actual_resp == expected_resp, \
-        ERROR_JSON_RESP.format('for 2 users', expected_resp, actual_resp)
+    errors = []
+    assert_credit_usage_details(resp,
+                                expected_records=[ml_category(33.598),
+                                                  mm_category(35.498),
+                                                  purchase_category(35.597),
+                                                  prediction_category(35.588),
+                                                  ml_category(33.598),
+                                                  mm_category(35.498),
+                                                  purchase_category(35.597),
+                                                  prediction_category(35.588)],
+                                errors_list=errors,
+                                add_text='for 2 users')
+
+    assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
 
 
 @mark.dr_account_portal
@@ -26,6 +26,7 @@ from utils.data_enums import (
 
 
 @mark.ai_report
+@mark.resource('autopilot')
 def test_validate_ai_report(user_setup_and_teardown,
                             finish_modeling,
                             prepare_report,
@@ -65,6 +66,7 @@ def test_validate_ai_report(user_setup_and_teardown,
 
 
 @mark.ai_report
+@mark.resource('autopilot')
 def test_generate_ai_report_until_autopilot_is_done(
         user_setup_and_teardown,
         start_modeling,
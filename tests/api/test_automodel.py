@@ -1,13 +1,13 @@
 from time import time
 import logging
 
-from time import sleep
 from pytest import (
     raises,
     fixture,
     mark
 )
 
+from utils.time_accounting import sleep
 from utils.constants import (
     TEN_K_DIABETES_DATASET,
     STATUS_CODE,
@@ -79,6 +79,8 @@ def replacement_reason(resp_json):
 
 @mark.trial
 @mark.automodels
+@mark.resource('autopilot')
+@mark.resource('deployment')
 def test_replace_automodel_manually(
         app_client, user_setup_and_teardown, setup_project, teardown_project,
         make_single_predictions, deploy_automodel, is_model_replaced, resp_json,
@@ -187,9 +189,11 @@ def test_replace_automodel_manually(
 
 @mark.trial
 @mark.automodels
+@mark.resource('autopilot')
+@mark.resource('deployment')
 def test_timeseries_predict_against_deployed_automodel(
         app_client, user_setup_and_teardown, setup_project, teardown_project,
-        deploy_automodel, get_value_from_json_response, resp_json, env_params):
+        deploy_automodel, get_value_from_json_response, env_params):
 
     app_client.v2_add_feature_flag('ENABLE_TIME_SERIES', True)
 
@@ -221,7 +225,9 @@ def test_timeseries_predict_against_deployed_automodel(
                                                               forecast_point='2011-05-10')
 
     deployment = app_client.v2_get_deployment(deployment_id)
-    deployments = app_client.v2_get_deployments()
+    # stops requesting pages once the deployment is found
+    listed_deployment = next((listed for listed in app_client.v2_iter_deployments()
+                              if listed['id'] == deployment_id), None)
 
     app_client.v2_delete_deployment(deployment_id)
 
@@ -229,13 +235,15 @@ def test_timeseries_predict_against_deployed_automodel(
     # GET api/v2/deployments/{deployment_id} and GET api/v2/deployments/ responses
     assert LABEL in get_value_from_json_response(deployment,
                                                  DeploymentsKeys.MODEL_LABEL.value)
-    assert LABEL in resp_json(deployments)['data'][0]['label']
+    assert listed_deployment is not None, \
+        f'Deployment {deployment_id} is not listed in GET api/v2/deployments/ response'
+    assert LABEL in listed_deployment['label']
 
     # 'model.hasAutomodel' key is True in
     # GET api/v2/deployments/{deployment_id} and GET api/v2/deployments/ responses
     assert get_value_from_json_response(deployment,
                                         DeploymentsKeys.HAS_AUTOMODEL.value)
-    assert resp_json(deployments)['data'][0]['model']['hasAutomodel']
+    assert listed_deployment['model']['hasAutomodel']
 
     if Envs.STAGING.value in env_params[0]:
         # 7 rows of predictions returned as forecasting from 2011-05-11 to 2011-05-17
@@ -245,6 +253,8 @@ def test_timeseries_predict_against_deployed_automodel(
 @mark.trial
 @mark.automodels
 @mark.skip_if_env('prod')
+@mark.resource('autopilot')
+@mark.resource('deployment')
 def test_cannot_predict_against_inactive_automodel_deployment(
         app_client, user_setup_and_teardown, status_code, resp_json, setup_project,
         teardown_project, deploy_automodel, make_single_predictions):
@@ -305,6 +315,8 @@ def test_cannot_predict_against_inactive_automodel_deployment(
 
 @mark.trial
 @mark.automodels
+@mark.resource('autopilot')
+@mark.resource('deployment')
 def test_create_app_from_automodel_deployment(app_client, user_setup_and_teardown,
                                               setup_project, teardown_project,
                                               deploy_automodel):
@@ -333,6 +345,7 @@ def test_create_app_from_automodel_deployment(app_client, user_setup_and_teardow
 
 @mark.trial
 @mark.automodels
+@mark.resource('autopilot')
 def test_cannot_deploy_automodel_until_autopilot_starts(app_client, user_setup_and_teardown,
                                                         setup_project, teardown_project):
 
@@ -455,6 +468,8 @@ def test_automodel_no_label_and_description(app_client, user_setup_and_teardown,
 
 @mark.trial
 @mark.automodels
+@mark.resource('autopilot')
+@mark.resource('deployment')
 def test_deploy_automodel_three_times(app_client, user_setup_and_teardown,
                                       setup_project, teardown_project):
 
@@ -497,6 +512,8 @@ def test_deploy_automodel_three_times(app_client, user_setup_and_teardown,
 @mark.trial
 @mark.automodels
 @mark.skip_if_env('prod')
+@mark.resource('autopilot')
+@mark.resource('deployment')
 def test_automodel_cannot_predict_with_explanations(app_client, user_setup_and_teardown,
                                                     setup_project, deploy_automodel,
                                                     resp_json, teardown_project):
@@ -531,6 +548,8 @@ def test_automodel_cannot_predict_with_explanations(app_client, user_setup_and_t
 @mark.trial
 @mark.automodels
 @mark.skip_if_env('prod')
+@mark.resource('autopilot')
+@mark.resource('deployment')
 def test_automodel_auto_replacement_and_predicting(app_client, user_setup_and_teardown,
                                                    setup_project, teardown_project,
                                                    get_value_from_json_response, make_single_predictions,
@@ -612,6 +631,8 @@ def test_automodel_auto_replacement_and_predicting(app_client, user_setup_and_te
 
 @mark.trial
 @mark.automodels
+@mark.resource('autopilot')
+@mark.resource('deployment')
 def test_automodel_no_description(app_client, user_setup_and_teardown, setup_project,
                                   teardown_project):
 
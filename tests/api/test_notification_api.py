@@ -47,6 +47,25 @@ def test_user_notifications_valid_limit(
         RESP_ERROR_TEXT.format(expected_resp, actual_resp)
 
 
+@mark.trial
+@mark.notification
+@mark.skip_if_env('prod')
+def test_user_notifications_all_pages(app_client, user_setup_and_teardown):
+    notifications = app_client.v2_iter_user_notifications()
+
+    errors = []
+    total_count = notifications.total_count()
+    if total_count != DEFAULT_USER_NOTIFICATIONS['totalCount']:
+        errors.append(f'Expected totalCount: {DEFAULT_USER_NOTIFICATIONS["totalCount"]}, '
+                      f'got: {total_count}')
+
+    records = list(notifications)
+    if records != DEFAULT_USER_NOTIFICATIONS['data']:
+        errors.append(RESP_ERROR_TEXT.format(DEFAULT_USER_NOTIFICATIONS['data'], records))
+
+    assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
+
+
 @mark.trial
 @mark.notification
 @mark.skip_if_env('prod')
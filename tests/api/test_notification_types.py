@@ -1,6 +1,5 @@
 import logging
 from urllib.parse import urlparse
-from time import sleep
 
 import requests
 from pytest import (
@@ -8,6 +7,7 @@ from pytest import (
     mark
 )
 
+from utils.time_accounting import sleep
 from utils.constants import (
     TEN_K_DIABETES_DATASET,
     TEN_K_DIABETES_TARGET,
@@ -256,6 +256,7 @@ def mention_without_share_setup(pro_user_setup, user_setup,
 
 @mark.trial
 @mark.notification
+@mark.resource('autopilot')
 def test_autopilot_complete_notification(payg_user_setup_and_teardown,
                                          autopilot_complete_setup,
                                          assert_count, assert_key_is_none,
@@ -452,6 +453,8 @@ def test_project_shared_notification(pro_user_setup,
 @mark.trial
 @mark.notification
 @mark.skip_if_env('prod')
+@mark.resource('autopilot')
+@mark.resource('modeling_workers')
 def test_mention_without_shared_notification(pro_user_setup,
                                              mention_without_share_setup,
                                              assert_count, assert_key_is_none,
@@ -541,6 +544,8 @@ def test_mention_without_shared_notification(pro_user_setup,
 @mark.trial
 @mark.notification
 @mark.skip_if_env('prod')
+@mark.resource('autopilot')
+@mark.resource('modeling_workers')
 def test_comment_notification(pro_user_setup,
                               comment_setup,
                               assert_count,
@@ -712,6 +717,8 @@ def test_comment_notification(pro_user_setup,
 @mark.trial
 @mark.notification
 @mark.skip_if_env('prod')
+@mark.resource('autopilot')
+@mark.resource('modeling_workers')
 def test_user_mention_notification(pro_user_setup,
                                    mention_setup,
                                    assert_count,
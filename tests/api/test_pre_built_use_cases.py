@@ -110,6 +110,7 @@ def assert_case_is_explorable(app_client, get_value_from_json_response):
 
 @mark.prebuilt_use_cases
 @mark.trial
+@mark.resource('deployment')
 def test_pathfinder_use_cases(pathfinder_cases_ids, app_client,
                               assert_case_is_explorable):
 
@@ -121,6 +122,7 @@ def test_pathfinder_use_cases(pathfinder_cases_ids, app_client,
 
 @mark.prebuilt_use_cases
 @mark.trial
+@mark.resource('deployment')
 def test_demo_use_cases(demo_cases_ids, app_client, assert_case_is_explorable):
 
     for use_case in demo_cases_ids:
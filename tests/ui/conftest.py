@@ -1,14 +1,32 @@
 import logging
-from time import sleep
+from uuid import uuid4
 from os import environ
+from time import time
 
-from pytest import fixture
+from pytest import (
+    fixture,
+    hookimpl
+)
 
 from pages import *
 from utils.http_utils import Request
+from utils.network_routes import NetworkRoutes
+from utils.web_performance import WEB_PERFORMANCE
+from utils.artifacts import (
+    ARTIFACT_WRITER,
+    TEST_ARTIFACTS,
+    artifact_name
+)
+from utils.constants import (
+    NO_NETWORK_ROUTES_ARG,
+    RECORD_UI_STUBS_ARG,
+    WEB_PERF_ARG,
+    KEEP_ARTIFACTS_ARG,
+    RECORD_VIDEO_ARG
+)
 from utils.selectors_enums import (
     PendoTourSelectors,
-    AiProfilePageSelectors,
+    TopMenuSelectors,
     HomePageSelectors,
     DrapUsagePageSelectors
 )
@@ -24,12 +42,15 @@ from utils.ui_constants import (
     ATTR_VALUE_NOT_CONTAINS_MESSAGE,
     ATTR_VALUE_NOT_EQUALS_MESSAGE,
     PENDO_HOME_TOUR_GUIDE_ID,
-    PENDO_TOUR_CONTAINER_TIMEOUT,
+    PENDO_TOUR_RESET_TIMEOUT,
+    ELEM_NOT_FOUND_TIMEOUT,
+    AI_PROFILE,
     ATTR_VALUE_EQUALS_INFO_LOG_MESSAGE,
     ATTR_VALUE_NOT_EQUALS_WARN_LOG_MESSAGE,
     INNER_TEXT_NOT_EQUALS_MESSAGE,
     INNER_TEXT_NOT_EQUALS_LOG_MESSAGE,
-    PENDO_HIGHLIGHT
+    PENDO_HIGHLIGHT,
+    VIDEOS_PATH
 )
 from utils.errors import (
     TourNotResetException,
@@ -45,13 +66,113 @@ LOGGER = logging.getLogger(__name__)
 
 
 @fixture
-def browser_context_args(browser_context_args):
-    """This fixture is required for tests where files are downloaded"""
-
-    return {
+def browser_context_args(browser_context_args, pytestconfig):
+    """
+    This fixture is required for tests where files are downloaded.
+    With --record_video, records video of every page.
+    """
+    context_args = {
         **browser_context_args,
         'accept_downloads': True
     }
+    if pytestconfig.getoption(RECORD_VIDEO_ARG):
+        context_args['record_video_dir'] = VIDEOS_PATH
+
+    return context_args
+
+
+@hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item):
+    """
+    Saves setup and call reports to test item, so that fixtures know if the test failed.
+    Captures the page of a failed test without a trace.
+    """
+
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f'report_{report.when}', report)
+    if report.failed and report.when in ('setup', 'call'):
+        TEST_ARTIFACTS.capture_failure()
+
+
+@fixture(scope='session', autouse=True)
+def artifact_writer():
+    """Waits for artifacts to be written at the end of the session."""
+
+    yield ARTIFACT_WRITER
+    ARTIFACT_WRITER.flush()
+
+
+@fixture(autouse=True)
+def test_artifacts(page, request):
+    """
+    Records Playwright trace of a test in memory.
+    Saves trace, screenshots and video only if the test failed
+    (or for all tests with --keep_artifacts). Auto-used for all tests.
+    """
+    TEST_ARTIFACTS.start(
+        page, artifact_name(request.node.nodeid), keep_all=request.config.getoption(KEEP_ARTIFACTS_ARG))
+
+    yield TEST_ARTIFACTS
+
+    failed = any(getattr(request.node, f'report_{when}', None) is not None
+                 and getattr(request.node, f'report_{when}').failed
+                 for when in ('setup', 'call'))
+    TEST_ARTIFACTS.finish(failed)
+
+
+@fixture(autouse=True)
+def network_routes(page, request):
+    """
+    Blocks third-party hosts not needed by UI assertions and serves static assets
+    with content hashed urls from local disk cache for all UI tests. Auto-used for all tests.
+    @mark.allow_hosts('youtube.com') unblocks hosts for a test.
+    @mark.stub_response('**/api/v2/projects/*', 'projects') fulfills matching requests
+    with response recorded to data/ui_stubs/projects.json (record it with --record_ui_stubs).
+    Disabled with --no_network_routes and with --web_perf,
+    so that web performance is measured against real network.
+    """
+    if request.config.getoption(NO_NETWORK_ROUTES_ARG) or request.config.getoption(WEB_PERF_ARG):
+        yield None
+        return
+
+    allowed_hosts = [host for marker in request.node.iter_markers('allow_hosts')
+                     for host in marker.args]
+    routes = NetworkRoutes(page, allowed_hosts)
+    routes.start()
+    for marker in request.node.iter_markers('stub_response'):
+        routes.stub(*marker.args, record=request.config.getoption(RECORD_UI_STUBS_ARG))
+
+    yield routes
+
+    routes.store_responses()
+    routes.log_stats()
+
+
+@fixture(scope='session')
+def test_run_id(request):
+    """Returns id of the test run, the same for all pytest-xdist workers."""
+
+    workerinput = getattr(request.config, 'workerinput', None)
+    if workerinput is not None:
+        return workerinput['testrunuid']
+    return getattr(request.config.option, 'testrunuid', None) or uuid4().hex
+
+
+@fixture(autouse=True)
+def web_performance(page, request, test_run_id):
+    """
+    With --web_perf, page object navigations of a test save web performance metrics
+    to ui/web_performance/{test_run_id}.json. Auto-used for all tests.
+    """
+    mode = request.config.getoption(WEB_PERF_ARG)
+    if mode is None:
+        yield None
+        return
+
+    WEB_PERFORMANCE.start(page, mode, test_run_id, request.node.nodeid)
+    yield WEB_PERFORMANCE
+    WEB_PERFORMANCE.stop()
 
 
 @fixture
@@ -155,22 +276,21 @@ def setup_and_sign_in_payg_user(payg_drap_user_setup_teardown,
                                 grant_credits,
                                 sign_in_user,
                                 new_page, home_page,
-                                create_ai_profile):
+                                setup_ai_profile):
     """
     Sets up PayAsYouGoUser for UI tests:
     1. Creates PayAsYouGoUser with DRAP account
     2. Adds a dict of feature flags optionally
     3. Grants credits to the user
-    4. Signs in user
-    5. If staging, redirects user to Home page
-    6. If prod, creates AI profile
-    7. If close_home_tour=True, closes Pendo Home tour if present
+    4. Creates AI profile over API
+    5. Signs in user
+    6. If staging, redirects user to Home page
+    7. If prod, checks user is at the app once
+    8. If close_home_tour=True, closes Pendo Home tour if present
     """
     def setup_and_sign_in_user(
             credits_amount=20000,
-            role=AiProfilePageSelectors.DEVELOPER.value,
-            industry=AiProfilePageSelectors.GAMING.value,
-            learning_track=AiProfilePageSelectors.CREATE_MODELS.value,
+            profile=AI_PROFILE,
             add_flags=False,
             flags_dict=None,
             close_home_tour=True):
@@ -182,6 +302,7 @@ def setup_and_sign_in_payg_user(payg_drap_user_setup_teardown,
             app_client.v2_add_feature_flags(flags_dict)
 
         grant_credits(credits_amount)
+        setup_ai_profile(app_client, profile)
 
         sign_in_user(username)
         # ENABLE_PLATFORM_QUESTIONNAIRE is False for staging
@@ -191,8 +312,10 @@ def setup_and_sign_in_payg_user(payg_drap_user_setup_teardown,
             new_page.navigate_to_ai_platform_page()
         else:
             # ENABLE_PLATFORM_QUESTIONNAIRE is True for prod
-            # User needs to set up ai profile to proceed to the app
-            create_ai_profile(role, industry, learning_track)
+            # User with AI profile skips ai-profile page
+            home_page.is_element_present(
+                TopMenuSelectors.PROFILE_ICON.value, raise_error=True,
+                help_text='User with AI profile was not taken to the app')
 
         if close_home_tour:
             home_page.close_pendo_tour_if_present()
@@ -227,47 +350,31 @@ def reset_pendo_tour(status_code, resp_text):
 
 
 @fixture
-def confirm_pendo_tour_is_reset(reset_pendo_tour,
-                                pendo_tour_page):
+def confirm_pendo_tour_is_reset(reset_pendo_tour, pendo_tour_page):
     """
-    Make sure Pendo tour is reset:
-    1. Close tour container if present
-    2. Reset tour so that it appears at start page
-    3. Refresh the page
-    Perform the above 3 steps until
-    reset_round >= max expected rounds,
-    If True -> raises TourNotResetException
+    Closes tour container if it is open, resets Pendo tour via Pendo API,
+    reloads the page once and waits for tour container within PENDO_TOUR_RESET_TIMEOUT.
+    If tour is not shown, raises TourNotResetException.
     """
-    def confirm_tour_is_reset(current_page, user_id, rounds_max=5, poll_interval=1):
-
-        reset_round = 0
-        while True:
-            reset_round = reset_round + 1
-
-            if current_page.is_element_present(
-                    PendoTourSelectors.TOUR_CONTAINER.value,
-                    timeout=PENDO_TOUR_CONTAINER_TIMEOUT, screenshot=False, raise_error=False
-            ):  # close tour if present
-                current_page.click_element(pendo_tour_page.close_tour_x_button)
-                LOGGER.info('Closed pendo tour. Round %d', reset_round)
+    def confirm_tour_is_reset(current_page, user_id, guide_id=PENDO_HOME_TOUR_GUIDE_ID):
 
-            reset_pendo_tour(user_id)
-            current_page.refresh_page()
-            LOGGER.info('Waiting for tour container. Round %d', reset_round)
+        # an open tour is not shown again after the page reload until it is closed
+        if not current_page.is_element_absent(PendoTourSelectors.TOUR_CONTAINER.value):
+            current_page.click_element(pendo_tour_page.close_tour_x_button)
+            LOGGER.info('Closed tour %s before reset', guide_id)
 
-            if reset_round >= rounds_max:
-                current_page.make_screenshot(PendoTourSelectors.TOUR_CONTAINER.value)
-                LOGGER.error('Tour was not reset. Round %s ', reset_round)
-                raise TourNotResetException(user_id, reset_round)
+        reset_pendo_tour(user_id, guide_id)
+        current_page.refresh_page()
 
-            if current_page.is_element_present(
-                    PendoTourSelectors.TOUR_CONTAINER.value,
-                    timeout=PENDO_TOUR_CONTAINER_TIMEOUT, screenshot=False, raise_error=False
-            ):  # tour is present if tour container elem is present
-                LOGGER.info('Tour is reset. Round %d', reset_round)
-                break
+        if not current_page.is_element_present(
+                PendoTourSelectors.TOUR_CONTAINER.value,
+                timeout=PENDO_TOUR_RESET_TIMEOUT, screenshot=False
+        ):
+            current_page.make_screenshot(PendoTourSelectors.TOUR_CONTAINER.value)
+            LOGGER.error('Tour %s was not shown after reset', guide_id)
+            raise TourNotResetException(user_id, guide_id)
 
-            sleep(poll_interval)
+        LOGGER.info('Tour %s is reset', guide_id)
 
     return confirm_tour_is_reset
 
@@ -275,7 +382,7 @@ def confirm_pendo_tour_is_reset(reset_pendo_tour,
 @fixture
 def assert_pendo_tour_is_absent():
     """
-    If Pendo tour container element is present at the page,
+    If Pendo tour container element is present at the page once it is settled,
     either adds error message to errors_list (if add_to_errors=True)
     or raises ElementIsPresentException (if raise_error=True),
     otherwise logs a message.
@@ -283,11 +390,8 @@ def assert_pendo_tour_is_absent():
     def assert_pendo_tour_is_absent(current_page, errors_list, help_text='',
                                     add_to_errors=True, raise_error=False):
 
-        if current_page.is_element_present(
-                PendoTourSelectors.TOUR_CONTAINER.value,
-                timeout=PENDO_TOUR_CONTAINER_TIMEOUT,
-                screenshot=False, raise_error=False
-        ):
+        if not current_page.is_element_absent(
+                PendoTourSelectors.TOUR_CONTAINER.value):
             if add_to_errors:
                 errors_list.append(
                     ELEMENT_FOUND_MESSAGE.format(
@@ -328,31 +432,11 @@ def assert_no_tour_again_if_closed(assert_pendo_tour_is_absent,
 
 
 @fixture
-def assert_tour_back_close_buttons_present(pendo_tour_page):
-    """Assert tooltip Back and Close (X) buttons are present"""
-
-    def back_and_close_buttons_are_present(errors_list, help_text=''):
-
-        # Assert Back button is present
-        if not pendo_tour_page.is_element_present(PendoTourSelectors.BACK_BUTTON.value):
-            errors_list.append(
-                ELEMENT_NOT_FOUND_MESSAGE.format(
-                    PendoTourSelectors.BACK_BUTTON.value, help_text))
-        # Assert Close(X) button is present
-        if not pendo_tour_page.is_element_present(PendoTourSelectors.CLOSE_TOUR_X_BUTTON.value):
-            errors_list.append(
-                ELEMENT_NOT_FOUND_MESSAGE.format(
-                    PendoTourSelectors.CLOSE_TOUR_X_BUTTON.value, help_text))
-
-    return back_and_close_buttons_are_present
-
-
-@fixture
-def assert_tooltip_content(pendo_tour_page, assert_element_is_present,
-                           assert_tour_back_close_buttons_present):
+def assert_tooltip_content(pendo_tour_page, assert_elements_are_present):
     """
     Start tour (or go to next tooltip) and check its title and text below title.
     Assert Back and close (X) buttons are present.
+    All elements are checked with one page snapshot.
     """
     def assert_tooltip_content(title_selector, content_selector,
                                errors_list, start_tour=False,
@@ -367,40 +451,49 @@ def assert_tooltip_content(pendo_tour_page, assert_element_is_present,
             if click_next:
                 pendo_tour_page.click_next_button()
 
-        # Check tooltip title
-        assert_element_is_present(
-            pendo_tour_page, title_selector, errors_list,
-            f'Check title of {title_selector} tooltip')
-        # Check tooltip content
-        assert_element_is_present(
-            pendo_tour_page, content_selector, errors_list,
-            f'Check content of {title_selector} tooltip')
+        expected_elements = {
+            # Check tooltip title
+            title_selector: f'Check title of {title_selector} tooltip',
+            # Check tooltip content
+            content_selector: f'Check content of {title_selector} tooltip'
+        }
         # Check if Back and Close (X) buttons are present
         if check_back_close_buttons:
-            assert_tour_back_close_buttons_present(
-                errors_list, f'Check Back and Close buttons at "{title_selector}" tooltip')
+            help_text = f'Check Back and Close buttons at "{title_selector}" tooltip'
+            expected_elements[PendoTourSelectors.BACK_BUTTON.value] = help_text
+            expected_elements[PendoTourSelectors.CLOSE_TOUR_X_BUTTON.value] = help_text
         # Check if Close (X) button is present
         if check_close_button:
-            if not pendo_tour_page.is_element_present(PendoTourSelectors.CLOSE_TOUR_X_BUTTON.value):
-                errors_list.append(ELEMENT_NOT_FOUND_MESSAGE.format(
-                    PendoTourSelectors.CLOSE_TOUR_X_BUTTON.value,
-                    f'X (close) tour button is absent at {title_selector} tooltip'))
+            expected_elements[PendoTourSelectors.CLOSE_TOUR_X_BUTTON.value] = \
+                f'X (close) tour button is absent at {title_selector} tooltip'
+
+        assert_elements_are_present(pendo_tour_page, expected_elements, errors_list)
 
     return assert_tooltip_content
 
 
 @fixture
-def assert_tour_start_page_content(assert_tour_start_page_image,
-                                   assert_element_is_present, pendo_tour_page):
+def assert_tour_start_page_content(pendo_tour_page, assert_elements_are_present):
     """Asserts image and text content of Pendo tour start page."""
 
     def start_page_content(errors_list, text_lines_list):
 
-        assert_tour_start_page_image(errors_list)
+        image_selector = PendoTourSelectors.TOUR_START_PAGE_IMAGE.value
+        image_attribute = 'xlink:href'
+        expected_image = 'data:image/jpeg;base64,'
+
+        expected_elements = {image_selector: 'Check image at tour start page'}
+        expected_elements.update(
+            {text_line: 'Check start page content' for text_line in text_lines_list})
+        snapshot = assert_elements_are_present(
+            pendo_tour_page, expected_elements, errors_list, attributes=(image_attribute,))
 
-        for text_line in text_lines_list:
-            assert_element_is_present(
-                pendo_tour_page, text_line, errors_list, 'Check start page content')
+        image = snapshot.attribute(image_selector, image_attribute)
+        if expected_image not in (image or ''):
+            errors_list.append(
+                ATTR_VALUE_NOT_CONTAINS_MESSAGE.format(
+                    image_attribute, image, image_selector, expected_image,
+                    'Check image at tour start page'))
 
     return start_page_content
 
@@ -418,7 +511,7 @@ def go_to_next_tour_slide(pendo_tour_page):
 
 
 @fixture
-def assert_tooltip_multi_content(assert_element_is_present, pendo_tour_page):
+def assert_tooltip_multi_content(assert_elements_are_present, pendo_tour_page):
     """
     Validates text content of Pendo tour tooltip with multiple text lines.
     Asserts X (Close) button is present.
@@ -427,20 +520,16 @@ def assert_tooltip_multi_content(assert_element_is_present, pendo_tour_page):
     def tooltip_multi_content(errors_list, tooltip_title, text_lines_list,
                               check_back_button=False):
 
-        for text_line in text_lines_list:
-            assert_element_is_present(
-                pendo_tour_page, text_line, errors_list, f'Check content of {tooltip_title} tooltip')
-        if not pendo_tour_page.is_element_present(PendoTourSelectors.CLOSE_TOUR_X_BUTTON.value):
-            errors_list.append(
-                ELEMENT_NOT_FOUND_MESSAGE.format(
-                    PendoTourSelectors.CLOSE_TOUR_X_BUTTON.value,
-                    f'X (close) tour button is absent at {tooltip_title} tooltip'))
+        expected_elements = {
+            text_line: f'Check content of {tooltip_title} tooltip'
+            for text_line in text_lines_list}
+        expected_elements[PendoTourSelectors.CLOSE_TOUR_X_BUTTON.value] = \
+            f'X (close) tour button is absent at {tooltip_title} tooltip'
         if check_back_button:
-            if not pendo_tour_page.is_element_present(PendoTourSelectors.BACK_BUTTON.value):
-                errors_list.append(
-                    ELEMENT_NOT_FOUND_MESSAGE.format(
-                        PendoTourSelectors.BACK_BUTTON.value,
-                        f'"Back" button is absent at {tooltip_title} tooltip'))
+            expected_elements[PendoTourSelectors.BACK_BUTTON.value] = \
+                f'"Back" button is absent at {tooltip_title} tooltip'
+
+        assert_elements_are_present(pendo_tour_page, expected_elements, errors_list)
 
     return tooltip_multi_content
 
@@ -459,12 +548,9 @@ def close_and_reset_tour(
     ):
         # Click No thanks button
         current_page.click_element(button_element)
-        from time import sleep
-        sleep(10)
-        # TODO: delete below 5 lines once SELF-2716 is fixed
-        if current_page.is_element_present(
-                PendoTourSelectors.TOUR_CONTAINER.value, screenshot=False
-        ):
+        # TODO: delete below 4 lines once SELF-2716 is fixed
+        # checked once the page is settled, not for the whole element timeout
+        if not current_page.is_element_absent(PendoTourSelectors.TOUR_CONTAINER.value):
             current_page.click_selector(
                 PendoTourSelectors.CLOSE_TOUR_X_BUTTON.value)
         # Tour should be closed now
@@ -475,7 +561,7 @@ def close_and_reset_tour(
 
 
 @fixture
-def sign_in_user(sign_in_page):
+def ui_sign_in_user(sign_in_page):
     """Navigates to sign in page and signs in a user"""
 
     def sign_in(username, is_auth0=False):
@@ -486,6 +572,26 @@ def sign_in_user(sign_in_page):
     return sign_in
 
 
+@fixture
+def sign_in_user(sign_in_page, ui_sign_in_user, app_client, env_params):
+    """
+    Signs in a user by logging in over API and adding session cookies to browser context,
+    so that test starts already signed in.
+    Signs in from sign in page if user signs in with Auth0 (is_auth0=True or prod),
+    Auth0 session cannot be created over API.
+    test_sign_in covers sign in page flow.
+    """
+    def sign_in(username, is_auth0=False):
+
+        if is_auth0 or Envs.PROD.value in env_params[0]:
+            ui_sign_in_user(username, is_auth0=is_auth0)
+        else:
+            sign_in_page.sign_in_with_cookies(
+                username, app_client.login_cookies(username))
+
+    return sign_in
+
+
 @fixture
 def assert_element_is_present():
     """
@@ -507,6 +613,39 @@ def assert_element_is_present():
     return assert_element_is_present
 
 
+@fixture
+def assert_elements_are_present():
+    """
+    Checks all elements with one page snapshot (see BasePage.take_snapshot()).
+    Elements missing in the snapshot are waited for, all of them within ELEM_NOT_FOUND_TIMEOUT.
+    Adds error message to errors_list for every element which is not present.
+    Returns the snapshot for further checks of text and attributes.
+    """
+    def elements_are_present(page, expected_elements, errors_list,
+                             attributes=(), text=False):
+
+        snapshot = page.take_snapshot(list(expected_elements), attributes, text)
+        # an element may be rendered after the page is settled, e.g. after an XHR
+        deadline = time() + ELEM_NOT_FOUND_TIMEOUT / 1000
+        found_later = []
+        for selector in snapshot.missing():
+            timeout = max(int((deadline - time()) * 1000), 1)
+            if page.is_element_present(selector, timeout=timeout, screenshot=False):
+                found_later.append(selector)
+                continue
+            errors_list.append(
+                ELEMENT_NOT_FOUND_MESSAGE.format(selector, expected_elements[selector]))
+            LOGGER.warning('Element with selector %s is not present', selector)
+
+        if found_later:
+            snapshot.elements.update(
+                page.take_snapshot(found_later, attributes, text).elements)
+
+        return snapshot
+
+    return elements_are_present
+
+
 @fixture
 def assert_element_is_not_present():
     """
@@ -516,7 +655,7 @@ def assert_element_is_not_present():
     def element_is_not_present(page, selector, errors_list, help_text='', add_to_errors=True,
                                raise_error=False):
 
-        if page.is_element_present(selector, timeout=5000, screenshot=False):
+        if not page.is_element_absent(selector):
             if add_to_errors:
                 errors_list.append(ELEMENT_NOT_FOUND_MESSAGE.format(selector, help_text))
             else:
@@ -719,6 +858,20 @@ def create_ai_profile(ai_profile_page):
     return create_ai_profile
 
 
+@fixture
+def setup_ai_profile():
+    """
+    Creates AI profile over API (POST /account/profile),
+    so that user skips ai-profile page after signing in.
+    create_ai_profile covers ai-profile page flow.
+    """
+    def setup_ai_profile(app_client, profile=AI_PROFILE):
+
+        app_client.post_account_profile(profile)
+
+    return setup_ai_profile
+
+
 @fixture
 def assert_balance_at_home_page(home_page, assert_inner_text_equals):
     """
@@ -803,21 +956,6 @@ def go_to_drap_from_full_usage_details(home_page, env_params):
     return drap_from_full_usage_details
 
 
-@fixture
-def assert_tour_start_page_image(pendo_tour_page,
-                                 assert_attribute_value_contains):
-    """Asserts image is present at Pendo tour start page"""
-
-    def tour_start_page_image(errors_list):
-
-        assert_attribute_value_contains(
-            pendo_tour_page, PendoTourSelectors.TOUR_START_PAGE_IMAGE.value,
-            attribute_name='xlink:href', expected_value='data:image/jpeg;base64,',
-            errors_list=errors_list, help_text='Check image at tour start page')
-
-    return tour_start_page_image
-
-
 @fixture
 def assert_tour_progress(tours_guide_component):
     """Asserts Pendo tour progress bar percentage."""
@@ -6,6 +6,7 @@ from pytest import (
 )
 
 from utils.constants import ASSERT_ERRORS
+from utils.ui_constants import ELEMENT_NOT_FOUND_MESSAGE
 from utils.selectors_enums import (
     CreditsPacksPageSelectors,
     ContactSalesDialogSelectors,
@@ -168,14 +169,15 @@ def assert_card_image(credits_packs_page, assert_attribute_value_contains):
 
 @fixture
 def assert_contact_sales_card_content(credits_packs_page,
-                                      assert_element_is_present):
+                                      assert_elements_are_present):
     """Asserts Contact Us card content."""
 
     def contact_sales_card_content(errors_list, content_list):
 
-        for line in content_list:
-            assert_element_is_present(credits_packs_page, line, errors_list,
-                                      'Check Contact Sales card content')
+        assert_elements_are_present(
+            credits_packs_page,
+            {line: 'Check Contact Sales card content' for line in content_list},
+            errors_list)
 
     return contact_sales_card_content
 
@@ -239,40 +241,48 @@ def validate_accelerator_card(
 
 
 @fixture
-def validate_page_header_content(credits_packs_page, assert_element_is_present):
+def validate_page_header_content(credits_packs_page):
     """Validates image and text content of Buy Credits modal header."""
 
     def page_header_content(errors_list):
 
-        dr_image = credits_packs_page.get_attribute_value(
-            PageHeaderSelectors.DR_LOGO.value, HtmlAttribute.SRC.value, raise_error=False
-        )
+        snapshot = credits_packs_page.take_snapshot(
+            [PageHeaderSelectors.TEXT_CONTENT.value, PageHeaderSelectors.DR_LOGO.value],
+            attributes=(HtmlAttribute.SRC.value,))
+        if not snapshot.is_visible(PageHeaderSelectors.TEXT_CONTENT.value):
+            errors_list.append(
+                ELEMENT_NOT_FOUND_MESSAGE.format(
+                    PageHeaderSelectors.TEXT_CONTENT.value,
+                    'Wrong/missing text content at page header'))
+
+        dr_image = snapshot.attribute(
+            PageHeaderSelectors.DR_LOGO.value, HtmlAttribute.SRC.value)
         expected_image = '/static/assets/logo-dark.svg'
         if dr_image != expected_image:
             errors_list.append(
                 f'Expected DR logo at page header: {expected_image}, got: {dr_image}'
             )
-        assert_element_is_present(
-            credits_packs_page, PageHeaderSelectors.TEXT_CONTENT.value, errors_list,
-            'Wrong/missing text content at page header')
 
     return page_header_content
 
 
 @fixture
-def validate_page_footer_content(credits_packs_page, assert_element_is_present):
+def validate_page_footer_content(credits_packs_page):
     """Validates link and text content of Buy Credits modal footer."""
 
     def page_footer_content(errors_list):
 
-        for line in PAGE_FOOTER_CONTENT:
-            assert_element_is_present(
-                credits_packs_page, line, errors_list, 'Check content of page footer'
-            )
-        credit_allocations_link = credits_packs_page.get_attribute_value(
-            PageFooterSelectors.CREDIT_ALLOCATIONS_LINK.value, HtmlAttribute.HREF.value,
-            raise_error=False
-        )
+        expected_elements = {
+            line: 'Check content of page footer' for line in PAGE_FOOTER_CONTENT}
+        snapshot = credits_packs_page.take_snapshot(
+            list(expected_elements) + [PageFooterSelectors.CREDIT_ALLOCATIONS_LINK.value],
+            attributes=(HtmlAttribute.HREF.value,))
+        for selector in snapshot.missing(list(expected_elements)):
+            errors_list.append(
+                ELEMENT_NOT_FOUND_MESSAGE.format(selector, expected_elements[selector]))
+
+        credit_allocations_link = snapshot.attribute(
+            PageFooterSelectors.CREDIT_ALLOCATIONS_LINK.value, HtmlAttribute.HREF.value)
         if credit_allocations_link != CREDIT_ALLOCATIONS_LINK:
             errors_list.append(
                 f'Expected Credit allocation details link: {CREDIT_ALLOCATIONS_LINK},'
@@ -10,8 +10,9 @@ from utils.constants import (
 )
 from utils.selectors_enums import (
     HomePageSelectors,
-    AiProfilePageSelectors
+    TopMenuSelectors
 )
+from utils.ui_constants import AI_PROFILE
 from utils.data_enums import (
     HtmlAttribute,
     CreditsCategory,
@@ -173,27 +174,27 @@ def setup_and_sign_in_payg_user(payg_drap_user_setup_teardown,
                                 grant_credits,
                                 sign_in_user,
                                 new_page, home_page,
-                                create_ai_profile):
+                                setup_ai_profile):
     """
     Sets up PayAsYouGoUser for UI tests:
     1. Creates PayAsYouGoUser with DRAP account
     2. Grants credits to the user
-    3. Signs in user
-    4. If staging, redirects user to Home page
-    5. If prod, creates AI profile
-    6. If close_home_tour=True, closes Pendo Home tour if present
+    3. Creates AI profile over API
+    4. Signs in user
+    5. If staging, redirects user to Home page
+    6. If prod, checks user is at the app once
+    7. If close_home_tour=True, closes Pendo Home tour if present
     """
     def setup_and_sign_in_user(
             credits_amount=20000,
-            role=AiProfilePageSelectors.DEVELOPER.value,
-            industry=AiProfilePageSelectors.GAMING.value,
-            learning_track=AiProfilePageSelectors.CREATE_MODELS.value,
+            profile=AI_PROFILE,
             close_home_tour=True):
 
         app_client, user_id, username, \
         first_name, last_name = payg_drap_user_setup_teardown
 
         grant_credits(credits_amount)
+        setup_ai_profile(app_client, profile)
 
         sign_in_user(username, is_auth0=True)
         # ENABLE_PLATFORM_QUESTIONNAIRE is False for staging
@@ -203,8 +204,10 @@ def setup_and_sign_in_payg_user(payg_drap_user_setup_teardown,
             new_page.navigate_to_ai_platform_page()
         else:
             # ENABLE_PLATFORM_QUESTIONNAIRE is True for prod
-            # User needs to set up ai profile to proceed to the app
-            create_ai_profile(role, industry, learning_track)
+            # User with AI profile skips ai-profile page
+            home_page.is_element_present(
+                TopMenuSelectors.PROFILE_ICON.value, raise_error=True,
+                help_text='User with AI profile was not taken to the app')
 
         if close_home_tour:
             home_page.close_pendo_tour_if_present()
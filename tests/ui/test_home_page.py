@@ -16,8 +16,9 @@ from utils.data_enums import (
     FeatureFlags,
     Envs
 )
+from utils.ui_constants import AI_PROFILE
 from utils.selectors_enums import (
-    AiProfilePageSelectors,
+    TopMenuSelectors,
     HomePageSelectors,
     DataPageSelectors,
     DeploymentsPageSelectors
@@ -158,28 +159,27 @@ def test_ai_platform_home(setup_user, home_page,
 def setup_user(payg_drap_user_setup_teardown,
                env_params, grant_credits,
                sign_in_user, add_feature_flags,
-               create_ai_profile, home_page):
+               setup_ai_profile, home_page):
     """
     Sets up test PayAsYouGoUser:
     1. Creates PayAsYouGoUser with DRAP account
     2. Adds ENABLE_PLATFORM_QUESTIONNAIRE flag for staging env
     3. Grants user 20000 credits
-    4. Signs in user
-    5. Creates Developer AI Profile
-    5. Closes Pendo Home tour if present
+    4. Creates Developer AI Profile over API
+    5. Signs in user
+    6. Closes Pendo Home tour if present
     """
     app_client, _, username, _, _ = payg_drap_user_setup_teardown
     if Envs.STAGING.value in env_params[0]:
         add_feature_flags(
             {FeatureFlags.ENABLE_PLATFORM_QUESTIONNAIRE.value: True})
     grant_credits(20000)
+    setup_ai_profile(app_client, {**AI_PROFILE, 'industry': 'Manufacturing'})
 
     sign_in_user(username)
-    create_ai_profile(
-        AiProfilePageSelectors.DEVELOPER.value,
-        AiProfilePageSelectors.MANUFACTURING.value,
-        AiProfilePageSelectors.CREATE_MODELS.value
-    )
+    home_page.is_element_present(
+        TopMenuSelectors.PROFILE_ICON.value, raise_error=True,
+        help_text='User with AI profile was not taken to the app')
     home_page.close_pendo_tour_if_present()
 
 
@@ -6,9 +6,10 @@ from pytest import (
 )
 
 from utils.constants import ASSERT_ERRORS
+from utils.ui_constants import AI_PROFILE
 from utils.selectors_enums import (
     ToursGuideSelectors,
-    AiProfilePageSelectors,
+    TopMenuSelectors,
     TEXT,
     TOOLTIP_TEXT_CLASS_VALUE
 )
@@ -119,31 +120,32 @@ def test_home_tour(
 @fixture
 def setup_and_sign_in_payg_user(
         payg_drap_user_setup_teardown, env_params, grant_credits, sign_in_user,
-        new_page, home_page, create_ai_profile
+        new_page, home_page, setup_ai_profile
 ):
     """
     Sets up PayAsYouGoUser:
     1. Creates PayAsYouGoUser with DRAP account
     2. Grants credits to the user
-    3. Signs in user
-    4. Creates AI profile
+    3. Creates AI profile over API
+    4. Signs in user
     """
     def setup_and_sign_in_user(
             credits_amount=20000,
-            role=AiProfilePageSelectors.DEVELOPER.value,
-            industry=AiProfilePageSelectors.GAMING.value,
-            learning_track=AiProfilePageSelectors.CREATE_MODELS.value):
+            profile=AI_PROFILE):
 
         app_client, user_id, username, _, _ = payg_drap_user_setup_teardown
 
         if Envs.STAGING.value in env_params[0]:
-            app_client.v2_add_feature_flag(
-                FeatureFlags.ENABLE_PLATFORM_QUESTIONNAIRE.value
+            app_client.v2_add_feature_flags(
+                {FeatureFlags.ENABLE_PLATFORM_QUESTIONNAIRE.value: True}
             )
         grant_credits(credits_amount)
+        setup_ai_profile(app_client, profile)
 
         sign_in_user(username)
-        create_ai_profile(role, industry, learning_track)
+        home_page.is_element_present(
+            TopMenuSelectors.PROFILE_ICON.value, raise_error=True,
+            help_text='User with AI profile was not taken to the app')
 
         return user_id
 
@@ -12,7 +12,8 @@ from utils.selectors_enums import (
     AiProfilePageSelectors,
     HomePageSelectors,
     DataPageSelectors,
-    DeploymentsPageSelectors
+    DeploymentsPageSelectors,
+    TopMenuSelectors
 )
 from utils.data_enums import (
     Envs,
@@ -120,6 +121,17 @@ def test_smoke(setup_user, new_page, data_page, home_page,
     assert not errors, ASSERT_ERRORS.format('\n'.join(errors))
 
 
+@mark.ui
+def test_sign_in(payg_drap_user_setup_teardown, ui_sign_in_user, top_menu_page):
+    # The rest of UI tests are signed in with API session cookies (sign_in_user fixture)
+    _, _, username, _, _ = payg_drap_user_setup_teardown
+
+    ui_sign_in_user(username)
+
+    assert top_menu_page.is_element_present(TopMenuSelectors.DR_LOGO.value), \
+        f'User {username} was not signed in from sign in page'
+
+
 @fixture
 def setup_user(payg_drap_user_setup_teardown,
                env_params,
@@ -0,0 +1,16 @@
+"""
+Unit tests of utils: they run without --app_host and don't call any service.
+python -m pytest tests/unit -m unit
+"""
+
+from pytest import fixture
+
+
+@fixture
+def skip_test_by_env():
+    """Overrides root autouse fixture: unit tests don't depend on env."""
+
+
+@fixture
+def acquire_resources():
+    """Overrides root autouse fixture: unit tests don't use capped resources."""
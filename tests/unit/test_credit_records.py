@@ -0,0 +1,110 @@
+from pytest import mark
+
+from utils.credit_records import CreditRecords
+
+
+def usage(category, credit_usage, **fields):
+    return {'projectId': '12345678901234567890abcd',
+            'projectName': None,
+            'deploymentId': None,
+            'deploymentLabel': None,
+            'category': category,
+            'creditUsage': credit_usage,
+            **fields}
+
+
+RECORDS = [usage('ML', 1.5), usage('MM', 3.4), usage('Predictions', 3.49)]
+
+
+@mark.unit
+def test_from_pages_keeps_page_order():
+    records = CreditRecords.from_pages([{'data': RECORDS[:2]}, {'data': RECORDS[2:]}])
+
+    assert records.count == 3
+    assert list(records.columns['category']) == ['ML', 'MM', 'Predictions']
+
+
+@mark.unit
+def test_numbers_are_nan_if_not_a_number():
+    records = CreditRecords([usage('ML', 1), usage('MM', '2'), usage('P', True), usage('X', None)])
+
+    numbers = records.numbers('creditUsage')
+
+    assert numbers[0] == 1
+    assert all(number != number for number in numbers[1:])
+
+
+@mark.unit
+def test_check_keys():
+    record = usage('ML', 1.5, extra=1)
+    del record['projectName']
+    errors = []
+
+    CreditRecords([RECORDS[0], record]).check_keys(errors)
+
+    assert errors == ['"projectName" is missing in 1 records (indexes 1)',
+                      "Unexpected keys: ['extra']"]
+
+
+@mark.unit
+@mark.parametrize('nullable, expected_errors', [
+    (True, []),
+    (False, ["\"projectName\" is not <class 'str'> in 2 records (indexes 0, 1)"])
+])
+def test_check_types(nullable, expected_errors):
+    errors = []
+
+    CreditRecords(RECORDS[:2] + [usage('P', 1, projectName='name')]).check_types(
+        'projectName', str, errors, nullable=nullable)
+
+    assert errors == expected_errors
+
+
+@mark.unit
+def test_check_range():
+    errors = []
+
+    CreditRecords(RECORDS + [usage('A', -1), usage('B', 'x')]).check_range(
+        'creditUsage', errors, min_value=0)
+
+    assert errors == ['"creditUsage" is not a number in [0, None] in 2 records (indexes 3, 4)']
+
+
+@mark.unit
+def test_check_range_shows_first_indexes():
+    errors = []
+
+    CreditRecords([usage('A', -1)] * 7).check_range('creditUsage', errors, min_value=0)
+
+    assert errors == ['"creditUsage" is not a number in [0, None] '
+                      'in 7 records (indexes 0, 1, 2, 3, 4, ...)']
+
+
+@mark.unit
+def test_check_column():
+    errors = []
+    records = CreditRecords([{'key': 'a'}, {'key': 'b'}, {'key': 'c'}], fields=('key',))
+
+    records.check_column('key', ['a', 'c'], errors)
+    records.check_column('key', ['a', 'b', 'c', 'd'], errors)
+
+    assert errors == ["Expected \"key\" 'c' at index 1, got 'b'",
+                      'Expected at least 4 records, got 3']
+
+
+@mark.unit
+def test_check_equals_ignores_order():
+    errors = []
+
+    CreditRecords(list(reversed(RECORDS))).check_equals(RECORDS, errors)
+
+    assert errors == []
+
+
+@mark.unit
+def test_check_equals_reports_different_values():
+    errors = []
+
+    CreditRecords([RECORDS[0], usage('MM', 3.5), RECORDS[2]]).check_equals(RECORDS, errors)
+
+    assert errors == [f'Expected "creditUsage" 3.4 in record {RECORDS[1]}, got 3.5']
@@ -0,0 +1,87 @@
+import json
+
+from pytest import (
+    mark,
+    raises
+)
+
+from utils.json_stream import (
+    iter_json_path,
+    parse_json_path,
+    WILDCARD
+)
+
+
+DOCUMENT = json.dumps({
+    'count': 3,
+    'data': [
+        {'id': 'a1', 'amount': -2500.0, 'rate': 1.5e3, 'tiny': 2.5e-7, 'items': [1, 22, 333]},
+        {'id': 'b2', 'amount': 0, 'note': 'quote " and \\ and ü €', 'flags': [True, False, None]},
+        {'id': 'c3', 'amount': 12345.678, 'nested': {'deep': [[], {}, [0.1, -0.2]]}}
+    ],
+    'next': None,
+    'totalCount': 1000000
+}, ensure_ascii=False).encode('utf-8')
+
+JSON_PATHS = [
+    '$',
+    '$.data[*]',
+    '$.data[*].amount',
+    '$.data[1].note',
+    '$.data[*].items[*]',
+    '$.*',
+    "$['totalCount']"
+]
+
+
+def expected_values(document, json_path):
+    # the same path applied to json.loads of the whole document
+    values = [json.loads(document)]
+    for step in parse_json_path(json_path):
+        selected = []
+        for value in values:
+            if isinstance(value, dict):
+                if step == WILDCARD:
+                    selected.extend(value.values())
+                elif step in value:
+                    selected.append(value[step])
+            elif isinstance(value, list):
+                selected.extend(value if step == WILDCARD else value[step:step + 1])
+        values = selected
+    return values
+
+
+@mark.unit
+@mark.parametrize('json_path', JSON_PATHS)
+def test_split_at_every_offset(json_path):
+    expected = expected_values(DOCUMENT, json_path)
+    for offset in range(len(DOCUMENT) + 1):
+        chunks = [DOCUMENT[:offset], DOCUMENT[offset:]]
+        actual = list(iter_json_path(chunks, json_path))
+
+        assert actual == expected, f'Split at byte {offset}: {DOCUMENT[:offset][-20:]}'
+
+
+@mark.unit
+@mark.parametrize('chunks, expected', [
+    ([b'[-2500.', b'0]'], [-2500.0]),
+    ([b'[1.', b'5e', b'3]'], [1500.0]),
+    ([b'[1', b'2', b'3]'], [123]),
+    ([b'[2e', b'-', b'3, 4]'], [0.002, 4]),
+    ([b'1', b'2'], [12])
+])
+def test_number_split_between_chunks(chunks, expected):
+    assert list(iter_json_path(chunks, '$[*]' if chunks[0].startswith(b'[') else '$')) == expected
+
+
+@mark.unit
+def test_one_byte_chunks():
+    chunks = [DOCUMENT[index:index + 1] for index in range(len(DOCUMENT))]
+
+    assert list(iter_json_path(chunks, '$.data[*]')) == json.loads(DOCUMENT)['data']
+
+
+@mark.unit
+def test_invalid_document():
+    with raises(ValueError):
+        list(iter_json_path([b'[1, 2'], '$[*]'))
@@ -0,0 +1,43 @@
+from pytest import (
+    mark,
+    raises
+)
+
+from utils.operation_timings import OperationTimings
+
+
+@mark.unit
+@mark.parametrize('durations, expected_timeout_period', [
+    # 2 * p99 of fast runs is below the floor
+    ([10] * 5, 3),
+    # learned deadline is shorter than the hardcoded one
+    ([300] * 5, 10),
+    # slow history doesn't extend the hardcoded timeout
+    ([3000] * 5, 30),
+    # not enough samples
+    ([300] * 4, 30)
+])
+def test_timeout_period_is_clamped(tmp_path, durations, expected_timeout_period):
+    timings = OperationTimings(str(tmp_path / 'timings.json'), min_timeout_period=3)
+    for duration in durations:
+        timings.record('autopilot', 'staging', duration)
+
+    assert timings.start('autopilot', 'staging', 30).timeout_period == expected_timeout_period
+
+
+@mark.unit
+def test_poll_returns_result_and_records_duration(tmp_path):
+    timings = OperationTimings(str(tmp_path / 'timings.json'))
+    results = iter([None, False, 'done'])
+
+    assert timings.poll('deploy', 'staging', 1, lambda: next(results), 0, 'deploy') == 'done'
+    assert len(timings.samples('deploy', 'staging')) == 1
+
+
+@mark.unit
+def test_poll_times_out(tmp_path):
+    timings = OperationTimings(str(tmp_path / 'timings.json'))
+
+    with raises(TimeoutError):
+        timings.poll('deploy', 'staging', 0, lambda: None, 0, 'deploy')
+    assert timings.samples('deploy', 'staging') == []
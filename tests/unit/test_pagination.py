@@ -0,0 +1,62 @@
+from pytest import mark
+
+from utils.pagination import offset_pages
+from utils.tracing import TRACER
+
+
+RECORDS = list(range(10))
+
+
+def get_json(requested_offsets, total_count=True):
+    def get_json_(offset, limit):
+        with TRACER.span('get_page', offset=offset):
+            requested_offsets.append(offset)
+            resp = {'data': RECORDS[offset:offset + limit]}
+            if total_count:
+                resp['totalCount'] = len(RECORDS)
+            return resp
+    return get_json_
+
+
+@mark.unit
+def test_records_of_all_pages():
+    offsets = []
+
+    assert list(offset_pages(get_json(offsets, total_count=False), 3)) == RECORDS
+    assert offsets == [0, 3, 6, 9]
+
+
+@mark.unit
+def test_first_requests_only_needed_pages():
+    offsets = []
+
+    assert offset_pages(get_json(offsets), 3).first(4) == RECORDS[:4]
+    # the page after the last needed one may be prefetched, but no more
+    assert offsets in ([0, 3], [0, 3, 6])
+
+
+@mark.unit
+@mark.parametrize('total_count, expected_offsets', [
+    (True, [0]),
+    (False, [0, 3, 6, 9])
+])
+def test_total_count(total_count, expected_offsets):
+    offsets = []
+
+    assert offset_pages(get_json(offsets, total_count), 3).total_count() == len(RECORDS)
+    assert offsets == expected_offsets
+
+
+@mark.unit
+def test_prefetched_page_spans_have_caller_parent():
+    TRACER.enabled, TRACER.spans = True, []
+    try:
+        with TRACER.span('test') as test_span:
+            list(offset_pages(get_json([]), 3))
+        page_spans = [span for span in TRACER.spans if span.name == 'get_page']
+    finally:
+        TRACER.enabled, TRACER.spans = False, []
+
+    assert len(page_spans) == 4
+    assert all(span.parent_id == test_span.span_id for span in page_spans)
+    assert all(span.trace_id == test_span.trace_id for span in page_spans)
@@ -0,0 +1,275 @@
+"""
+UI test artifacts: Playwright trace, screenshots and video are persisted
+only for failed tests or when explicitly requested.
+Files are written by a background thread, so that tests don't wait for disk.
+"""
+
+import os
+import re
+import queue
+import shutil
+import logging
+import hashlib
+import threading
+from functools import partial
+
+from playwright._impl._api_types import Error
+
+from utils.ui_constants import (
+    SCREENSHOTS_PATH,
+    TRACES_PATH,
+    VIDEOS_PATH,
+    SCREENSHOT_QUALITY
+)
+
+
+def artifact_name(nodeid):
+    """
+    Returns file name of test artifacts unique for each test and parameter set,
+    e.g. tests_ui_test_smoke.py__test_sign_in_env1 for tests/ui/test_smoke.py::test_sign_in[env1].
+
+    Parameters
+    ----------
+    nodeid : str
+        pytest nodeid of the test
+
+    Returns
+    -------
+    name : str
+        nodeid with chars other than letters, digits, '_', '.' and '-' replaced with '_'
+    """
+    return re.sub(r'[^\w.-]', '_', nodeid).strip('_')
+
+
+class ArtifactWriter:
+    """
+    Writes and moves artifact files in a background thread.
+    Content with the same sha256 hash (e.g. identical screenshots of a stuck page)
+    is written once per process.
+
+    Attributes
+    ----------
+    logger : logging.Logger
+        Inits Logger object
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_guard = threading.Lock()
+        self._paths_by_hash = {}
+        self.logger = logging.getLogger(__name__)
+
+    def write(self, file_path, content):
+        """
+        Schedules writing content to file_path unless the same content was written.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to file
+        content : bytes
+            File content
+        """
+        self._submit(partial(self._write, file_path, content))
+
+    def move(self, source_path, file_path):
+        """Schedules moving a file written by Playwright to artifacts dir."""
+
+        self._submit(partial(self._move, source_path, file_path))
+
+    def remove(self, file_path):
+        """Schedules removing a file written by Playwright, e.g. a video of a passed test."""
+
+        self._submit(partial(self._remove, file_path))
+
+    def flush(self):
+        """Waits until all scheduled artifacts are written."""
+
+        self._queue.join()
+
+    def _submit(self, task):
+        with self._thread_guard:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='artifact-writer', daemon=True)
+                self._thread.start()
+        self._queue.put(task)
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            try:
+                task()
+            except OSError as error:
+                self.logger.error('Artifact was not written: %s', error)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, file_path, content):
+        content_hash = hashlib.sha256(content).hexdigest()
+        if content_hash in self._paths_by_hash:
+            self.logger.info(
+                'Artifact %s is the same as %s', file_path, self._paths_by_hash[content_hash])
+            return
+        self._paths_by_hash[content_hash] = file_path
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as f:
+            f.write(content)
+        self.logger.info('Saved artifact: %s', file_path)
+
+    def _move(self, source_path, file_path):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        shutil.move(source_path, file_path)
+        self.logger.info('Saved artifact: %s', file_path)
+
+    def _remove(self, file_path):
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
+class TestArtifacts:
+    """
+    Artifacts of the current UI test.
+    Playwright trace (with screenshots and DOM snapshots) is recorded in memory
+    and saved only if the test failed, so screenshots of expected timeouts cost nothing.
+    Without tracing (older Playwright), screenshots of expected timeouts are not captured:
+    the page is captured once by capture_failure() when the test fails.
+
+    Parameters
+    ----------
+    writer : ArtifactWriter
+        Background artifacts writer
+
+    Attributes
+    ----------
+    writer : ArtifactWriter
+        Background artifacts writer
+    page : playwright.sync_api._generated.Page
+        Page of the current test. None between tests
+    test_name : str
+        File name friendly name of the current test
+    keep_all : bool
+        If to save artifacts of passed tests too
+    is_tracing : bool
+        If Playwright trace is being recorded
+    logger : logging.Logger
+        Inits Logger object
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.page = None
+        self.test_name = None
+        self.keep_all = False
+        self.is_tracing = False
+        self.logger = logging.getLogger(__name__)
+
+    def start(self, page, test_name, keep_all=False):
+        """
+        Starts recording artifacts of a test.
+
+        Parameters
+        ----------
+        page : playwright.sync_api._generated.Page
+            Page of the test
+        test_name : str
+            File name friendly name of the test
+        keep_all : bool
+            If to save artifacts even if the test passes
+        """
+        self.page = page
+        self.test_name = test_name
+        self.keep_all = keep_all
+
+        tracing = getattr(page.context, 'tracing', None)
+        if tracing is not None:
+            tracing.start(screenshots=True, snapshots=True)
+            self.is_tracing = True
+
+    def screenshot(self, page, name, persist=False):
+        """
+        Makes a screenshot for the test report.
+        During a test nothing is captured unless persist=True or keep_all=True:
+        the trace has the page state, or capture_failure() captures the page
+        if the test fails.
+
+        Parameters
+        ----------
+        page : playwright.sync_api._generated.Page
+            Browser page
+        name : str
+            Screenshot file name
+        persist : bool
+            If to save the screenshot even if the test passes
+        """
+        if not (persist or self.keep_all or self.page is None):
+            if self.is_tracing:
+                self.logger.info('Page state for screenshot %s is kept in trace', name)
+            else:
+                self.logger.info('Screenshot %s is skipped, page is captured on failure', name)
+            return
+
+        content = page.screenshot(type='jpeg', quality=SCREENSHOT_QUALITY)
+        self.writer.write(os.path.join(SCREENSHOTS_PATH, _jpeg_name(name)), content)
+
+    def capture_failure(self):
+        """
+        Saves a screenshot of the page when the test fails, unless the trace has it.
+        Called from the test report hook, before fixtures tear down the page state.
+        """
+        if self.page is None or self.is_tracing:
+            return
+
+        try:
+            content = self.page.screenshot(type='jpeg', quality=SCREENSHOT_QUALITY)
+        except Error as error:
+            self.logger.error('Page of failed test %s was not captured: %s', self.test_name, error)
+            return
+        self.writer.write(os.path.join(SCREENSHOTS_PATH, f'{self.test_name}.jpeg'), content)
+
+    def finish(self, failed):
+        """
+        Saves trace and video if the test failed or keep_all=True.
+        Otherwise drops them.
+
+        Parameters
+        ----------
+        failed : bool
+            If the test failed
+        """
+        keep = failed or self.keep_all
+
+        if self.is_tracing:
+            if keep:
+                trace_path = os.path.join(TRACES_PATH, f'{self.test_name}.zip')
+                os.makedirs(TRACES_PATH, exist_ok=True)
+                self.page.context.tracing.stop(path=trace_path)
+                self.logger.info('Saved trace: %s', trace_path)
+            else:
+                self.page.context.tracing.stop()
+
+        video = getattr(self.page, 'video', None)
+        if video is not None:
+            # video file is complete once page is closed
+            self.page.close()
+            if keep:
+                self.writer.move(
+                    video.path(), os.path.join(VIDEOS_PATH, f'{self.test_name}.webm'))
+            else:
+                self.writer.remove(video.path())
+
+        self.page = None
+        self.is_tracing = False
+
+
+def _jpeg_name(name):
+    return f'{os.path.splitext(name)[0]}.jpeg'
+
+
+# One writer and one current test per process
+ARTIFACT_WRITER = ArtifactWriter()
+TEST_ARTIFACTS = TestArtifacts(ARTIFACT_WRITER)
@@ -1,4 +1,22 @@
-from utils.clients.dr_account_portal_client import DrAccountPortalClient
-from utils.clients.app_client import AppClient
-from utils.clients.auth0_client import Auth0Client
-from utils.clients.docs_client import DocsPortalClient
+"""Clients are imported on first access, so that a test run imports only the clients it uses."""
+
+from importlib import import_module
+
+
+_CLIENT_MODULES = {
+    'DrAccountPortalClient': 'utils.clients.dr_account_portal_client',
+    'AppClient': 'utils.clients.app_client',
+    'Auth0Client': 'utils.clients.auth0_client',
+    'DocsPortalClient': 'utils.clients.docs_client'
+}
+
+__all__ = list(_CLIENT_MODULES)
+
+
+def __getattr__(name):
+    if name not in _CLIENT_MODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    client = getattr(import_module(_CLIENT_MODULES[name]), name)
+    globals()[name] = client
+    return client
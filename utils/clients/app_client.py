@@ -3,8 +3,9 @@ from ntpath import basename
 from time import time
 from datetime import date
 
-from time import sleep
+from requests import Session
 
+from utils.time_accounting import sleep
 from utils.helper_funcs import (
     update_rfc3339_date,
     sign_up_payload,
@@ -28,9 +29,19 @@ from utils.constants import (
     PAYG_FLAGS,
     TRIAL_FLAGS,
     CREATE_INVOICE_PATH,
-    WHAT_IF_APP_ID
+    WHAT_IF_APP_ID,
+    ADMIN_DATASETS_SCOPE,
+    API_V2_PAGE_SIZE
 )
 from utils.http_utils import ApiClient
+from utils.tracing import TRACER
+from utils.dataset_registry import DATASET_REGISTRY
+from utils.operation_timings import OPERATION_TIMINGS
+from utils.perf_store import PERF_RECORDER
+from utils.pagination import (
+    next_link_pages,
+    offset_pages
+)
 from utils.data_enums import (
     PredictionServersKeys,
     PostApiV2UsersKeys,
@@ -52,7 +63,8 @@ from utils.data_enums import (
     BalanceSummaryKeys,
     NfKeys,
     UserType,
-    ModelingMode
+    ModelingMode,
+    Operations
 )
 from utils.data_enums import FeatureFlags
 
@@ -373,6 +385,49 @@ class AppClient(ApiClient):
 
         self.logger.info('User %s logged in', username)
 
+    def login_cookies(self, username, password=USER_PASSWORD):
+        """
+        Logs user in POST /account/login with a new HTTP session
+        and returns its cookies in Playwright BrowserContext.add_cookies() format,
+        so that a browser context is signed in without going through Sign In page.
+
+        Parameters
+        ----------
+        username : str
+            Username in name@domain.com format
+        password : str
+            User password (Testing123 by default)
+
+        Returns
+        -------
+        cookies : list
+            List of cookie dicts
+        """
+        payload = {'username': username,
+                   'password': password}
+
+        login_session = Session()
+        resp = self._response(
+            self._perform_post_request('/account/login', payload, session=login_session),
+            check_status_code=True)
+        self.get_value_from_json_response(resp, AccountLoginKeys.UID.value)
+
+        cookies = []
+        for cookie in login_session.cookies:
+            browser_cookie = {'name': cookie.name,
+                              'value': cookie.value,
+                              'domain': cookie.domain,
+                              'path': cookie.path,
+                              'secure': cookie.secure,
+                              'httpOnly': cookie.has_nonstandard_attr('HttpOnly')}
+            if cookie.expires is not None:
+                browser_cookie['expires'] = cookie.expires
+            cookies.append(browser_cookie)
+
+        self.logger.info('User %s logged in. Got %d session cookies', username, len(cookies))
+
+        return cookies
+
     def logout(self):
         """Logs user out GET /account/logout."""
 
@@ -518,6 +573,7 @@ class AppClient(ApiClient):
 
         self.logger.info('User\'s %s expirationDate is now: %s', user_id, expiration_date)
 
+    @TRACER.traced()
     def v2_create_project_from_file(self, file_path, poll_interval=3, timeout_period=10):
         """
         Creates a project from a local file POST api/v2/projects.
@@ -548,6 +604,53 @@ class AppClient(ApiClient):
             self.logger.info(
                 'Trying to start project creation for %s dataset', dataset_name)
 
+        return self._v2_poll_for_project_created(create_project_resp,
+                                                 poll_interval,
+                                                 timeout_period)
+
+    @TRACER.traced()
+    def v2_create_project_from_catalog(self, file_path, poll_interval=3, timeout_period=10):
+        """
+        Creates a project from AI Catalog dataset of a local file POST api/v2/projects.
+        The file is uploaded by admin user once per environment (see DatasetRegistry)
+        and shared with the user.
+        Polls for GET api/v2/status/{id} until the project is created.
+        Returns project_id from GET api/v2/projects/{pid}/.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to data/datasets/file.extension
+        poll_interval : int
+            Poll every n seconds
+        timeout_period : int
+            Stop polling in timeout_period minutes from now
+
+        Returns
+        -------
+        project_id : str
+            Project id
+        """
+        dataset_id = DATASET_REGISTRY.get_dataset_id(
+            file_path,
+            self.app_host,
+            ADMIN_DATASETS_SCOPE,
+            upload_dataset=lambda: self.v2_upload_dataset_from_file(file_path, is_admin=True),
+            is_dataset_available=lambda ds_id: self.v2_is_dataset_available(ds_id, is_admin=True))
+        self.v2_share_dataset(dataset_id, self.user_id, is_admin=True)
+
+        create_project_resp = self.v2_api_post_request(f'{API_V2_PATH}/projects/',
+                                                       {'datasetId': dataset_id},
+                                                       check_status_code=False)
+        self.logger.info(
+            'Trying to start project creation from %s catalog dataset %s',
+            basename(file_path), dataset_id)
+
+        return self._v2_poll_for_project_created(create_project_resp,
+                                                 poll_interval,
+                                                 timeout_period)
+
+    def _v2_poll_for_project_created(self, create_project_resp, poll_interval, timeout_period):
         self.assert_status_code(create_project_resp,
                                 expected_code=202,
                                 actual_code=self.status_code(create_project_resp),
@@ -555,33 +658,26 @@ class AppClient(ApiClient):
 
         project_status_url = self.get_location_header(create_project_resp)
 
-        timeout = time() + 60 * timeout_period
-        while True:
-            # poll GET api/v2/status/{id} till redirected to GET api/v2/projects/{pid}/
-            # allow_redirects=False to get Location response header
-            project_status_resp = self.v2_api_get_request(urlparse(project_status_url).path,
-                                                          allow_redirects=False,
-                                                          check_status_code=False)
-            self.logger.info('Project is being created: %s. Will stop polling in: %s',
-                             project_status_url, time_left(timeout))
-
-            if time() > timeout:
-                self.logger.error('Timed out creating project %s after %d minutes',
-                                  project_status_url, timeout_period)
-                raise TimeoutError(
-                    f'Timed out creating project {project_status_url} after {timeout_period} minutes')
-
-            if self.status_code(project_status_resp) == 303:
-                project_url = self.get_location_header(project_status_resp)
-                self.project_id = project_url.split('/')[6]
-                break
-
-            sleep(poll_interval)
+        # poll GET api/v2/status/{id} till redirected to GET api/v2/projects/{pid}/
+        project_status_resp = OPERATION_TIMINGS.poll(
+            Operations.CREATE_PROJECT.value, self.app_host, timeout_period,
+            lambda: self._v2_redirected_status(project_status_url),
+            poll_interval, f'project {project_status_url} to be created')
+        project_url = self.get_location_header(project_status_resp)
+        self.project_id = project_url.split('/')[6]
 
         self.logger.info('Project %s was created.', self.project_id)
 
         return self.project_id
 
+    def _v2_redirected_status(self, status_url, get_request=None):
+        # returns GET api/v2/status/{id} response once it redirects to the created entity,
+        # allow_redirects=False to get Location response header
+        status_resp = (get_request or self.v2_api_get_request)(
+            urlparse(status_url).path, allow_redirects=False, check_status_code=False)
+        return status_resp if self.status_code(status_resp) == 303 else None
+
+    @TRACER.traced()
     def setup_10k_diabetes_project(self):
         """
         Sets up 10k_diabetes project:
@@ -682,6 +778,7 @@ class AppClient(ApiClient):
 
         return self.project_id
 
+    @TRACER.traced()
     def upload_dataset(self, file_path, project_id):
         """
         Uploads dataset from a local file POST /upload/{pid}.
@@ -710,6 +807,7 @@ class AppClient(ApiClient):
         self.logger.info('Dataset %s was uploaded for project %s',
                          dataset_name, project_id)
 
+    @TRACER.traced()
     def poll_for_eda_done(self, project_id, eda_status, poll_interval=3, timeout_period=15):
         """
         Polls for GET /project/{pid}/status to return specified status.
@@ -727,30 +825,21 @@ class AppClient(ApiClient):
         timeout_period : int
             Stop polling in timeout_period minutes from now
         """
-        timeout = time() + 60 * timeout_period
-        while True:
+        def is_eda_done():
             status = self.get_value_from_json_response(
                 self.internal_api_get_request(f'/project/{project_id}/status',
                                               check_status_code=False),
                 ProjectStatusKeys.EDA_STATUS.value)
+            self.logger.info('EDA status of project %s: %d', project_id, status)
+            return status == eda_status
 
-            self.logger.info('Polling for EDA status %d for project %s. Status: %d. '
-                             'Will stop polling in %s',
-                             eda_status, project_id, status, time_left(timeout))
+        OPERATION_TIMINGS.poll(
+            f'{Operations.EDA.value}_{eda_status}', self.app_host, timeout_period, is_eda_done,
+            poll_interval, f'EDA status {eda_status} for project {project_id}')
 
-            if time() > timeout:
-                self.logger.error('Timed out polling for EDA status %d for project %s '
-                                  'after %d minutes', eda_status, project_id, timeout_period)
-                raise TimeoutError(f'Timed out polling for EDA status {eda_status} '
-                                   f'after {timeout_period} minutes')
-
-            if status == eda_status:
-
-                self.logger.info('EDA is completed for project %s. Status: %d',
-                                 project_id, status)
-                break
-            sleep(poll_interval)
+        self.logger.info('EDA is completed for project %s. Status: %d', project_id, eda_status)
 
+    @TRACER.traced()
     def set_target(self, target, project_id):
         """
         Sets project's target GET eda/profile/{pid}/{target}.
@@ -787,6 +876,7 @@ class AppClient(ApiClient):
 
         return resp
 
+    @TRACER.traced()
     def train_models(self, project_id, blueprints):
         """
         Starts to train models based on the passed list of blueprints dicts.
@@ -843,6 +933,7 @@ class AppClient(ApiClient):
 
         return blueprint_id
 
+    @TRACER.traced()
     def v2_train_model(self, project_id, blueprint_id, poll_interval=3, timeout_period=25):
         """
         Starts model training process for blueprint POST api/v2/projects/{pid}/models/.
@@ -880,32 +971,19 @@ class AppClient(ApiClient):
                                         f' was not started')
         model_job_url = self.get_location_header(model_resp)
 
-        timeout = time() + 60 * timeout_period
-        while True:
-            model_job_resp = self.v2_api_get_request(urlparse(model_job_url).path,
-                                                     allow_redirects=False,
-                                                     check_status_code=False)
-            self.logger.info('Model is being created: %s. Will stop polling in %s',
-                             model_job_url, time_left(timeout))
-
-            if time() > timeout:
-                self.logger.error('Timed out training model %s after %d minutes',
-                                  model_job_url, timeout_period)
-                raise TimeoutError(
-                    f'Timed out training model {model_job_url} after {timeout_period} minutes')
-
-            if self.status_code(model_job_resp) == 303:
-                model_url = self.get_location_header(model_job_resp)
-                model_id = self.get_value_from_json_response(
-                    self.v2_api_get_request(urlparse(model_url).path), ModelsKeys.ID.value)
-                break
-
-            sleep(poll_interval)
+        model_job_resp = OPERATION_TIMINGS.poll(
+            Operations.TRAIN_MODEL.value, self.app_host, timeout_period,
+            lambda: self._v2_redirected_status(model_job_url),
+            poll_interval, f'model {model_job_url} to be trained', variant=blueprint_id)
+        model_url = self.get_location_header(model_job_resp)
+        model_id = self.get_value_from_json_response(
+            self.v2_api_get_request(urlparse(model_url).path), ModelsKeys.ID.value)
 
         self.logger.info('Model %s was created.', model_id)
 
         return model_id
 
+    @TRACER.traced()
     def v2_start_autopilot(self,
                            project_id,
                            target,
@@ -1022,6 +1100,8 @@ class AppClient(ApiClient):
 
         return datarobot_key
 
+    @TRACER.traced()
+    @PERF_RECORDER.timed_operation(Operations.DEPLOY.value)
     def v2_deploy_from_learning_model(self, model_id):
         """
         Deploys a model from Models Leaderboard.
@@ -1130,6 +1210,7 @@ class AppClient(ApiClient):
 
         return model_id
 
+    @TRACER.traced()
     def v2_replace_deployment_model(self,
                                     deployment_id,
                                     model_id,
@@ -1263,6 +1344,7 @@ class AppClient(ApiClient):
 
         self.logger.info('Deployment %s was deleted', deployment_id)
 
+    @TRACER.traced()
     def v2_deploy_automodel(self,
                             label,
                             project_id,
@@ -1365,6 +1447,7 @@ class AppClient(ApiClient):
             'Feature flags %s were added to user %s',
             flags_dict, self.user_id)
 
+    @TRACER.traced()
     def v2_poll_for_first_available_deployment(self, poll_interval=1, timeout_period=15):
         """
         Returns first available deployment from deployments list.
@@ -1406,6 +1489,7 @@ class AppClient(ApiClient):
 
         return deployment_id
 
+    @TRACER.traced()
     def v2_poll_for_autopilot_done(self, project_id, poll_interval=5, timeout_period=40):
         """
         Wait until Automodel is finished.
@@ -1419,29 +1503,15 @@ class AppClient(ApiClient):
         timeout_period : int
             Stop polling in timeout_period minutes from now
         """
-        timeout = time() + 60 * timeout_period
-        while True:
-            resp = self.v2_api_get_request(f'{API_V2_PATH}/projects/{project_id}/status',
-                                           check_status_code=False)
-            is_done = resp.json()['autopilotDone']
-
-            self.logger.info('Polling for Autopilot for project %s to finish: %r. '
-                             'Will stop polling in %s', project_id, is_done, time_left(timeout))
-
-            if time() > timeout:
-                self.logger.error(
-                    'Timed out polling for Autopilot for project %s to finish after %d minutes',
-                    project_id, timeout_period)
-                raise TimeoutError(
-                    f'Timed out polling for Autopilot for project {project_id} to finish'
-                    f' after {timeout_period} minutes')
-
-            if is_done:
-                break
-            sleep(poll_interval)
+        OPERATION_TIMINGS.poll(
+            Operations.AUTOPILOT.value, self.app_host, timeout_period,
+            lambda: self.v2_api_get_request(f'{API_V2_PATH}/projects/{project_id}/status',
+                                            check_status_code=False).json()['autopilotDone'],
+            poll_interval, f'Autopilot for project {project_id} to finish')
 
         self.logger.info('Autopilot for project %s is done', project_id)
 
+    @TRACER.traced()
     def make_predictions(self, deployment_id, dataset_path):
         """
         Makes single predictions.
@@ -1471,6 +1541,7 @@ class AppClient(ApiClient):
                 check_status_code=False)
         return resp
 
+    @TRACER.traced()
     def make_time_series_predictions(self,
                                      deployment_id,
                                      dataset_path,
@@ -1513,6 +1584,7 @@ class AppClient(ApiClient):
                 check_status_code=False)
         return resp
 
+    @TRACER.traced()
     def make_predictions_with_explanations(self,
                                            deployment_id,
                                            dataset_path,
@@ -1557,6 +1629,7 @@ class AppClient(ApiClient):
                 check_status_code=False)
         return resp
 
+    @TRACER.traced()
     def v2_make_batch_predictions(self, deployment_id, dataset_id,
                                   skip_drift_tracking=True,
                                   prediction_warning_enabled=False,
@@ -1597,6 +1670,7 @@ class AppClient(ApiClient):
                        'type': 'dataset',
                        'datasetId': dataset_id}}
 
+        started = time()
         resp = self.v2_api_post_request(f'{API_V2_PATH}/batchPredictions/',
                                         payload,
                                         check_status_code=False)
@@ -1639,6 +1713,9 @@ class AppClient(ApiClient):
             if actual_status == COMPLETED_STATUS:
                 self.logger.info('Predictions are done. Status %s',
                                  actual_status)
+                # a timed out poll returned with raise_error=False is not a completion time
+                PERF_RECORDER.record_operation(
+                    Operations.BATCH_PREDICTIONS.value, time() - started)
                 return status_resp
 
             sleep(poll_interval)
@@ -1733,6 +1810,53 @@ class AppClient(ApiClient):
         """
         return self.v2_api_get_request(f'{API_V2_DEPLOYMENTS_PATH}/')
 
+    def v2_paginate(self, path, query_params=None, stream=False):
+        """
+        Returns records of all pages of an api/v2 list endpoint.
+        Pages are requested while records are iterated, the next one in background.
+
+        Parameters
+        ----------
+        path : str
+            Endpoint path, e.g. api/v2/deployments/
+        query_params : dict
+            Url query params, e.g. {'limit': 100}
+        stream : bool
+            If to decode records of a page while its body is read instead of parsing
+            the whole body at once. Pages are requested by offset and limit then,
+            since 'next' url may come after the records
+
+        Returns
+        -------
+        paginator : Paginator
+            Iterable of records
+        """
+        if stream:
+            return offset_pages(
+                lambda offset, limit: {'data': list(self.iter_response_json_items(
+                    self.v2_api_get_request(
+                        path, {**(query_params or {}), 'offset': offset, 'limit': limit},
+                        stream=True),
+                    '$.data[*]'))},
+                API_V2_PAGE_SIZE)
+
+        return next_link_pages(
+            lambda page_path, params: self.get_response_json(
+                self.v2_api_get_request(page_path, params)),
+            path, {'limit': API_V2_PAGE_SIZE, **(query_params or {})})
+
+    def v2_iter_deployments(self):
+        """
+        Returns user's deployments of all pages of GET api/v2/deployments/.
+        Deployment records are large, so pages are streamed.
+
+        Returns
+        -------
+        paginator : Paginator
+            Iterable of deployments
+        """
+        return self.v2_paginate(f'{API_V2_DEPLOYMENTS_PATH}/', stream=True)
+
     def v2_deployments_action_log(self, deployment_id):
         """
         Get deployment action log GET api/v2/modelDeployments/{deployment_id}/actionLog/.
@@ -1835,6 +1959,7 @@ class AppClient(ApiClient):
 
         self.logger.info('Deployment %s is now %s', deployment_id, status)
 
+    @TRACER.traced()
     def v2_create_ai_app(self,
                          app_name,
                          deployment_id,
@@ -1887,37 +2012,24 @@ class AppClient(ApiClient):
                                         f'source: "{source}", '
                                         f'deployment_id "{deployment_id}" was not deployed')
 
-        timeout = time() + 60 * timeout_period
-        while True:
-            status_resp = self.v2_api_get_request(urlparse(self.get_location_header(resp)).path,
-                                                  allow_redirects=False,
-                                                  check_status_code=False)
-            self.logger.info('Polling for app %s to be deployed from %s. Will stop polling in %s',
-                             app_name, deployment_id, time_left(timeout))
-
-            if time() > timeout:
-                self.logger.error(
-                    'Timed out polling for app %s to be deployed from %s after %d minutes',
-                    app_name, deployment_id, timeout_period)
-                raise TimeoutError(
-                    f'Timed out polling for app {app_name} to be deployed from {deployment_id}'
-                    f' after {timeout_period} minutes')
-
-            if self.status_code(status_resp) == 303:
-                app_resp = self.v2_api_get_request(
-                    urlparse(self.get_location_header(status_resp)).path)
-
-                assert self.get_value_from_json_response(
-                    app_resp,
-                    AppsKeys.DEPLOYMENT_STATE.value) == 'deployed'
-                app_id = self.get_value_from_json_response(app_resp, AppsKeys.ID.value)
-
-                self.logger.info('App %s with app_id %s has been deployed from %s deployment',
-                                 app_name, app_id, deployment_id)
-                break
-            sleep(poll_interval)
+        status_url = self.get_location_header(resp)
+        status_resp = OPERATION_TIMINGS.poll(
+            Operations.CREATE_AI_APP.value, self.app_host, timeout_period,
+            lambda: self._v2_redirected_status(status_url),
+            poll_interval, f'app {app_name} to be deployed from {deployment_id}')
+        app_resp = self.v2_api_get_request(
+            urlparse(self.get_location_header(status_resp)).path)
+
+        assert self.get_value_from_json_response(
+            app_resp,
+            AppsKeys.DEPLOYMENT_STATE.value) == 'deployed'
+        app_id = self.get_value_from_json_response(app_resp, AppsKeys.ID.value)
+
+        self.logger.info('App %s with app_id %s has been deployed from %s deployment',
+                         app_name, app_id, deployment_id)
         return app_id
 
+    @TRACER.traced()
     def v2_upload_dataset_via_url(self,
                                   url,
                                   do_snapshot=True,
@@ -1956,42 +2068,124 @@ class AppClient(ApiClient):
                                 expected_code=202,
                                 actual_code=self.status_code(resp),
                                 message=f'Dataset {url} was not uploaded')
-        status_url = urlparse(self.get_location_header(resp)).path
+        return self._v2_poll_for_dataset_uploaded(resp, url, poll_interval, timeout_period)
 
-        timeout = time() + 60 * timeout_period
-        while True:
-            status_resp = self.v2_api_get_request(status_url,
-                                                  allow_redirects=False,
-                                                  check_status_code=False)
-            self.logger.info(
-                'Uploading %s. Will stop polling in %s',
-                url, time_left(timeout))
+    @TRACER.traced()
+    def v2_upload_dataset_from_file(self, file_path, is_admin=False,
+                                    poll_interval=1, timeout_period=10):
+        """
+        Uploads a local file to AI Catalog POST api/v2/datasets/fromFile/
 
-            if time() > timeout:
-                self.logger.error(
-                    'Timed out polling for dataset %s to be uploaded'
-                    ' after %d minutes', url, timeout_period)
-                raise TimeoutError(TIMEOUT_MESSAGE.format(
-                    url,
-                    'to upload',
-                    self.get_response_text(status_resp),
-                    timeout_period))
+        Parameters
+        ----------
+        file_path : str
+            Path to data/datasets/file.extension
+        is_admin : bool
+            If to upload the file as admin user or as test user
+        poll_interval : int
+            Poll every n seconds
+        timeout_period : int
+            Stop polling in timeout_period minutes from now
 
-            if self.status_code(status_resp) == 303:
-                dataset_resp = self.v2_api_get_request(
-                    urlparse(self.get_location_header(status_resp)).path)
+        Returns
+        -------
+        dataset_id : str
+            Dataset ID
+        """
+        post_request = self.v2_api_admin_post_request if is_admin else self.v2_api_post_request
 
-                assert self.get_value_from_json_response(
-                    dataset_resp, DatasetsDatasetIdKeys.STATE.value) == COMPLETED_STATUS
+        with open(file_path, 'rb') as upload_file:
+            dataset_name = basename(file_path)
+            resp = post_request(f'{API_V2_PATH}/datasets/fromFile/',
+                                files={'file': (dataset_name, upload_file)},
+                                check_status_code=False)
+        self.assert_status_code(resp,
+                                expected_code=202,
+                                actual_code=self.status_code(resp),
+                                message=f'Dataset {dataset_name} was not uploaded')
 
-                dataset_id = self.get_value_from_json_response(
-                    dataset_resp, DatasetsDatasetIdKeys.ID.value)
-                self.logger.info(
-                    'Dataset %s is uploaded. datasetId %s', url, dataset_id)
+        return self._v2_poll_for_dataset_uploaded(
+            resp, dataset_name, poll_interval, timeout_period, is_admin)
 
-                return dataset_id
+    def v2_is_dataset_available(self, dataset_id, is_admin=False):
+        """
+        Checks if AI Catalog dataset exists and is uploaded
+        GET api/v2/datasets/{dataset_id}/
 
-            sleep(poll_interval)
+        Parameters
+        ----------
+        dataset_id : str
+            Dataset ID
+        is_admin : bool
+            If to check the dataset as admin user or as test user
+
+        Returns
+        -------
+        is_available : bool
+            True if the dataset is uploaded
+        """
+        get_request = self.v2_api_admin_get_request if is_admin else self.v2_api_get_request
+
+        resp = get_request(f'{API_V2_PATH}/datasets/{dataset_id}/', check_status_code=False)
+        if self.status_code(resp) != 200:
+            self.logger.info('Dataset %s is not available: %s',
+                             dataset_id, self.get_response_text(resp))
+            return False
+
+        return self.get_value_from_json_response(
+            resp, DatasetsDatasetIdKeys.STATE.value) == COMPLETED_STATUS
+
+    def v2_share_dataset(self, dataset_id, user_id, role='CONSUMER', is_admin=False):
+        """
+        Shares AI Catalog dataset with a user
+        PATCH api/v2/datasets/{dataset_id}/sharedRoles/
+
+        Parameters
+        ----------
+        dataset_id : str
+            Dataset ID
+        user_id : str
+            Id of a user to share dataset with
+        role : str
+            Role of the user towards shared dataset: OWNER, EDITOR, CONSUMER
+        is_admin : bool
+            If to share the dataset as admin user or as test user
+        """
+        patch_request = self.v2_api_admin_patch_request if is_admin else self.v2_api_patch_request
+        payload = {'operation': 'updateRoles',
+                   'roles': [{'shareRecipientType': 'user',
+                              'role': role,
+                              'id': user_id}]}
+
+        resp = patch_request(f'{API_V2_PATH}/datasets/{dataset_id}/sharedRoles/',
+                             payload,
+                             check_status_code=False)
+        self.assert_status_code(
+            resp,
+            expected_code=204,
+            actual_code=self.status_code(resp),
+            message=f'Dataset {dataset_id} was not shared with {user_id}')
+
+        self.logger.info('Dataset %s was shared with %s', dataset_id, user_id)
+
+    def _v2_poll_for_dataset_uploaded(self, upload_resp, dataset_name,
+                                      poll_interval, timeout_period, is_admin=False):
+        get_request = self.v2_api_admin_get_request if is_admin else self.v2_api_get_request
+        status_resp = OPERATION_TIMINGS.poll(
+            Operations.UPLOAD_DATASET.value, self.app_host, timeout_period,
+            lambda: self._v2_redirected_status(self.get_location_header(upload_resp), get_request),
+            poll_interval, f'dataset {dataset_name} to be uploaded')
+        dataset_resp = get_request(urlparse(self.get_location_header(status_resp)).path)
+
+        assert self.get_value_from_json_response(
+            dataset_resp, DatasetsDatasetIdKeys.STATE.value) == COMPLETED_STATUS
+
+        dataset_id = self.get_value_from_json_response(
+            dataset_resp, DatasetsDatasetIdKeys.ID.value)
+        self.logger.info(
+            'Dataset %s is uploaded. datasetId %s', dataset_name, dataset_id)
+
+        return dataset_id
 
     def v2_get_credit_balance_summary(self):
         """
@@ -2052,6 +2246,7 @@ class AppClient(ApiClient):
 
         return resp
 
+    @TRACER.traced()
     def poll_for_balance(self, expected_balance, timeout_period=10,
                          poll_interval=2, raise_error=True):
         """
@@ -2073,7 +2268,8 @@ class AppClient(ApiClient):
         actual_balance : int
             User's current balance
         """
-        timeout = time() + 60 * timeout_period
+        started = time()
+        timeout = started + 60 * timeout_period
 
         while True:
             actual_balance = self.v2_get_current_credit_balance()
@@ -2096,10 +2292,14 @@ class AppClient(ApiClient):
             if actual_balance == expected_balance:
                 self.logger.info('Stopped polling. Balance is %d',
                                  actual_balance)
+                # a timed out poll is not a completion time
+                PERF_RECORDER.record_operation(
+                    Operations.METERING_VISIBILITY.value, time() - started)
                 return actual_balance
 
             sleep(poll_interval)
 
+    @TRACER.traced()
     def poll_for_balance_range(self, min_balance, max_balance,
                                timeout_period=10,
                                poll_interval=2,
@@ -2125,7 +2325,8 @@ class AppClient(ApiClient):
         actual_balance : int
             User's current balance
         """
-        timeout = time() + 60 * timeout_period
+        started = time()
+        timeout = started + 60 * timeout_period
 
         while True:
             actual_balance = self.v2_get_current_credit_balance()
@@ -2147,10 +2348,13 @@ class AppClient(ApiClient):
             if min_balance <= actual_balance <= max_balance:
                 self.logger.info('Stopped polling. Balance is %d',
                                  actual_balance)
+                PERF_RECORDER.record_operation(
+                    Operations.METERING_VISIBILITY.value, time() - started)
                 return actual_balance
 
             sleep(poll_interval)
 
+    @TRACER.traced()
     def poll_for_notifications(self, expected_count, username='',
                                timeout_period=5, poll_interval=1,
                                params=None, raise_error=True):
@@ -2230,6 +2434,8 @@ class AppClient(ApiClient):
 
         self.logger.info('AI App %s has been deleted', app_id)
 
+    @TRACER.traced()
+    @PERF_RECORDER.timed_operation(Operations.AI_REPORT.value)
     def generate_ai_report(self, project_id, timeout_period=20, poll_interval=1):
         """
         Starts generation of AI Report and polls until it's generated.
@@ -2283,6 +2489,7 @@ class AppClient(ApiClient):
 
             sleep(poll_interval)
 
+    @TRACER.traced()
     def download_ai_report(self, report_url):
         """
         Calls GET /trusted/projects/{pid}/selfServeAutopilotDocs/
@@ -2327,7 +2534,7 @@ class AppClient(ApiClient):
 
         return report_title
 
-    def v2_get_user_notifications(self, query_params=None):
+    def v2_get_user_notifications(self, query_params=None, stream=False):
         """
         Get user notifications GET api/v2/userNotifications/.
 
@@ -2335,6 +2542,8 @@ class AppClient(ApiClient):
         ----------
         query_params : dict
             Url query params
+        stream : bool
+            If to read notifications on demand with ResponseHandler.iter_json_items()
 
         Returns
         -------
@@ -2342,12 +2551,28 @@ class AppClient(ApiClient):
             Response object
         """
         resp = self.v2_api_get_request(f'{API_V2_PATH}/userNotifications/',
-                                       query_params)
+                                       query_params, stream=stream)
 
         self.logger.info('Called GET %s/userNotifications/ for user %s',
                          API_V2_PATH, self.user_id)
         return resp
 
+    def v2_iter_user_notifications(self, query_params=None):
+        """
+        Returns user notifications of all pages of GET api/v2/userNotifications/.
+
+        Parameters
+        ----------
+        query_params : dict
+            Url query params, e.g. {'isRead': 'false'}
+
+        Returns
+        -------
+        paginator : Paginator
+            Iterable of notifications
+        """
+        return self.v2_paginate(f'{API_V2_PATH}/userNotifications/', query_params)
+
     def v2_update_worker_count(self, project_id, count):
         """
         Get user notifications GET api/v2/userNotifications/.
@@ -2620,6 +2845,8 @@ class AppClient(ApiClient):
 
         return package_id
 
+    @TRACER.traced()
+    @PERF_RECORDER.timed_operation(Operations.DEPLOY.value)
     def v2_deploy_from_model_package(self, package_id,
                                      label='fromModelPackage label',
                                      timeout_period=5,
@@ -2826,15 +3053,22 @@ class AppClient(ApiClient):
         self.logger.info('Called GET %s', path)
         return resp
 
+    def v2_iter_user_apps(self):
+        """
+        Returns user AI Apps of all pages of GET api/v2/applications/.
+
+        Returns
+        -------
+        paginator : Paginator
+            Iterable of apps
+        """
+        return self.v2_paginate(f'{API_V2_PATH}/applications/')
+
     def v2_delete_user_apps(self):
         """Deletes user AI Apps if any using self.v2_delete_ai_app()"""
 
-        apps = self.get_value_from_json_response(
-            self.v2_get_user_apps(), 'data')
-
-        app_ids = []
-        for app in apps:
-            app_ids.append(app['id'])
+        # ids of all pages are collected before deleting shifts pages
+        app_ids = [app['id'] for app in self.v2_iter_user_apps()]
 
         if app_ids:
             for app in app_ids:
@@ -1,7 +1,7 @@
 from os import environ
 from urllib.parse import urljoin
 
-from utils.constants import AUTH0_TOKEN_PATH
+from utils.constants import AUTH0_CLIENT_CREDENTIALS_SUBJECT
 
 from utils.http_utils import ApiClient
 from utils.helper_funcs import replace_chars_if_needed
@@ -50,11 +50,11 @@ class Auth0Client(ApiClient):
                    'client_id': auth0_client_id,
                    'client_secret': auth0_client_secret}
 
-        resp = self.auth0_post_request(AUTH0_TOKEN_PATH, payload)
-        self.auth0_api_v2_token = self.get_value_from_json_response(
-            resp, Auth0Keys.ACCESS_TOKEN.value)
+        # machine token is the same for all workers, so it's shared between them
+        self.auth0_api_v2_token = self.auth0_token(
+            payload, AUTH0_CLIENT_CREDENTIALS_SUBJECT, shared=True)
 
-        self.logger.info('Generated Auth api/v2 token: %s',
+        self.logger.info('Got Auth api/v2 token: %s',
                          self.auth0_api_v2_token)
 
         return self.auth0_api_v2_token
@@ -18,7 +18,7 @@ class DocsPortalClient(ApiClient):
     def __init__(self, env_params, session=None):
         super().__init__(env_params, session)
 
-    def search(self, query, page=0, filters=None):
+    def search(self, query, page=0, filters=None, stream=False):
         """
         Docs Portal GET /search
 
@@ -31,6 +31,8 @@ class DocsPortalClient(ApiClient):
         filters : str
             Filter search by: itemType:platform, itemType:api,
             itemType:tutorials
+        stream : bool
+            If to read hits on demand with ResponseHandler.iter_json_items()
 
         Returns
         -------
@@ -42,7 +44,7 @@ class DocsPortalClient(ApiClient):
         if filters:
             params = f'query={query}&page={page}&filters={filters}'
 
-        resp = self.docs_get_request('search', params)
+        resp = self.docs_get_request('search', params, stream=stream)
 
         self.logger.info('Called Get /%s?%s endpoint', path, params)
 
@@ -12,7 +12,6 @@ from utils.constants import (
     DR_ACCOUNT_ROLES_PATH,
     DR_ACCOUNT_CREDIT_USAGE_DETAILS_PATH,
     USER_PASSWORD,
-    AUTH0_TOKEN_PATH,
     EMAIL_QUERY_PARAM,
     DR_ACCOUNT_PORTAL_ADJUST_BALANCE_PATH,
     DR_ACCOUNT_PORTAL_CREDIT_BALANCE_PATH,
@@ -22,14 +21,16 @@ from utils.constants import (
     DRAP_PROCESS_EXPIRED_PACKS_PATH,
     DRAP_CHECKOUT_HISTORY_PATH,
     PORTAL_ID_KEY,
-    PROD_DRAP_ADMIN_USER
+    PROD_DRAP_ADMIN_USER,
+    DRAP_PAGE_SIZE
 )
 from utils.http_utils import ApiClient
+from utils.pagination import offset_pages
+from utils.token_cache import TOKEN_CACHE
 from utils.errors import FailedToRegisterDrAccountPortalUserException
 from utils.data_enums import (
     DrapRegisterUserKeys,
     CreditPackKeys,
-    Auth0Keys,
     Envs,
     EnvVars
 )
@@ -40,7 +41,7 @@ GET_EMAIL_INFO_LOG_MESSAGE = 'Called DR Account Portal GET %s endpoint. email %s
 POST_INFO_LOG_MESSAGE = 'Called POST %s endpoint. Payload: %s'
 NO_PORTAL_ID_LOG_MESSAGE = 'Trying to call DR Account Portal GET %s endpoint without portalId query param'
 DEBUG_LOG_MESSAGE = 'RESPONSE: %s'
-ACCESS_TOKEN_LOG_MESSAGE = 'Generated Auth0 access token %s for user %s'
+ACCESS_TOKEN_LOG_MESSAGE = 'Got Auth0 access token %s for user %s'
 
 
 class DrAccountPortalClient(ApiClient):
@@ -168,6 +169,8 @@ class DrAccountPortalClient(ApiClient):
 
         resp = self.dr_account_admin_post_request(DR_ACCOUNT_PORTAL_REGISTER_PATH,
                                                   payload)
+        # portalId claim of a cached user token is stale after registration
+        TOKEN_CACHE.invalidate(username)
         try:
             self.portal_id = self.get_value_from_json_response(
                 resp, DrapRegisterUserKeys.PORTAL_ID.value)
@@ -204,6 +207,8 @@ class DrAccountPortalClient(ApiClient):
 
         self.logger.info('Called POST %s endpoint. Payload: %s',
                          DR_ACCOUNT_PORTAL_REGISTER_PATH, payload)
+        if isinstance(payload, dict) and 'email' in payload:
+            TOKEN_CACHE.invalidate(payload['email'])
 
         if self.status_code(resp) == 200 and set_portal_id:
             self.portal_id = self.get_value_from_json_response(
@@ -437,6 +442,41 @@ class DrAccountPortalClient(ApiClient):
             GET_INFO_LOG_MESSAGE, DR_ACCOUNT_CREDIT_USAGE_DETAILS_PATH, str(portal_id))
         return resp
 
+    def iter_credit_usage_details(self, start_ts, end_ts,
+                                  portal_id=None,
+                                  email=None,
+                                  metering_type=None,
+                                  page_size=DRAP_PAGE_SIZE):
+        """
+        Returns user credit usage details of all pages of
+        GET /api/creditsSystem/creditUsageDetails, requested by offset and limit
+        while records are iterated. total_count() reads totalCount of the first page.
+
+        Parameters
+        ----------
+        start_ts : str
+            Billing start date in ISO format %Y-%m-%dT%H:%M:%S%z, e.g. 2020-08-07T08:00:00Z
+        end_ts : str
+            Billing end date in ISO format %Y-%m-%dT%H:%M:%S%z, e.g. 2020-08-07T08:00:00Z
+        portal_id : int
+            DR Account Portal user portalId. Ether portalId or email is required
+        email : str
+            Username (url-encoded email). Ether portalId or email is required
+        metering_type : str
+            Options: mmJob, prediction, deploymentUptime
+        page_size : int
+            Number of records per request
+
+        Returns
+        -------
+        paginator : Paginator
+            Iterable of credit usage records
+        """
+        return offset_pages(
+            lambda offset, limit: self.get_response_json(self.get_credit_usage_details(
+                start_ts, end_ts, portal_id, email, metering_type, offset, limit)),
+            page_size)
+
     def get_balance_summary(self, email=None, check_status_code=True):
         """
         Returns user credit balance summary.
@@ -471,6 +511,8 @@ class DrAccountPortalClient(ApiClient):
 
     def get_checkout_history(self,
                              email=None,
+                             offset=None,
+                             limit=None,
                              check_status_code=True):
         """
         Returns a list of user Credits System checkouts.
@@ -481,6 +523,10 @@ class DrAccountPortalClient(ApiClient):
         email : str
             Username (url-encoded email).
             Ether portalId or email is required
+        offset : int
+            Number of checkouts to skip
+        limit : int
+            Limit to N checkouts
         check_status_code : bool
             If to check status code or not
 
@@ -500,10 +546,16 @@ class DrAccountPortalClient(ApiClient):
               "productDescription": "4000 AI Platform Credits, etc,"},
             ]
         """
+        params = ''
+        if offset is not None:
+            params = f'{params}&offset={offset}'
+        if limit is not None:
+            params = f'{params}&limit={limit}'
+
         if email is not None:
             resp = self.dr_account_get_request(
                 DRAP_CHECKOUT_HISTORY_PATH,
-                query_params=EMAIL_QUERY_PARAM.format(email),
+                query_params=EMAIL_QUERY_PARAM.format(email) + params,
                 check_status_code=check_status_code
             )
             self.logger.info(GET_EMAIL_INFO_LOG_MESSAGE,
@@ -513,7 +565,7 @@ class DrAccountPortalClient(ApiClient):
 
         resp = self.dr_account_get_request(
             DRAP_CHECKOUT_HISTORY_PATH,
-            query_params=PORTAL_ID_QUERY_PARAM.format(self.portal_id),
+            query_params=PORTAL_ID_QUERY_PARAM.format(self.portal_id) + params,
             check_status_code=check_status_code
         )
         self.logger.info(GET_INFO_LOG_MESSAGE,
@@ -521,6 +573,30 @@ class DrAccountPortalClient(ApiClient):
                          str(self.portal_id))
         return resp
 
+    def iter_checkout_history(self, email=None, page_size=DRAP_PAGE_SIZE):
+        """
+        Returns user Credits System checkouts of all pages of
+        GET api/billing/getCheckoutHistory, requested by offset and limit
+        while checkouts are iterated.
+
+        Parameters
+        ----------
+        email : str
+            Username (url-encoded email). Checkouts of self.portal_id if None
+        page_size : int
+            Number of checkouts per request
+
+        Returns
+        -------
+        paginator : Paginator
+            Iterable of checkouts
+        """
+        # the endpoint returns a plain list of checkouts without totalCount
+        return offset_pages(
+            lambda offset, limit: {'data': self.get_response_json(
+                self.get_checkout_history(email, offset, limit))},
+            page_size)
+
     def update_profile(self, payload, portal_id=None, check_status_code=True):
         """
         Updates user profile info.
@@ -911,13 +987,7 @@ class DrAccountPortalClient(ApiClient):
             'client_id': auth0_client_id,
             'client_secret': auth0_client_secret
         }
-        resp = self.auth0_post_request(
-            AUTH0_TOKEN_PATH, payload
-        )
-        self.auth0_auth_token = self.get_value_from_json_response(
-            resp,
-            Auth0Keys.ACCESS_TOKEN.value
-        )
+        self.auth0_auth_token = self.auth0_token(payload, username)
         self.logger.info(ACCESS_TOKEN_LOG_MESSAGE,
                          self.auth0_auth_token, username)
 
@@ -957,13 +1027,7 @@ class DrAccountPortalClient(ApiClient):
             'grant_type': 'http://auth0.com/oauth/grant-type/password-realm',
             'realm': 'Username-Password-Authentication',
         }
-        resp = self.auth0_post_request(
-            AUTH0_TOKEN_PATH, payload
-        )
-        self.auth0_auth_token = self.get_value_from_json_response(
-            resp,
-            Auth0Keys.ACCESS_TOKEN.value
-        )
+        self.auth0_auth_token = self.auth0_token(payload, username)
         self.logger.info(ACCESS_TOKEN_LOG_MESSAGE,
                          self.auth0_auth_token, username)
 
@@ -1,6 +1,7 @@
 """Contains common variables and constants used across the project."""
 
 import os
+import tempfile
 from pathlib import Path
 
 from utils.data_enums import FeatureFlags
@@ -77,6 +78,68 @@ PORTAL_ID_KEY = 'portalId'
 PORTAL_ID_QUERY_PARAM = 'portalId={}'
 EMAIL_QUERY_PARAM = 'email={}'
 AUTH0_TOKEN_PATH = 'oauth/token'
+AUTH0_CLIENT_CREDENTIALS_SUBJECT = 'client_credentials'
+AUTH0_TOKEN_REFRESH_MARGIN = 300  # seconds
+AUTH0_TOKEN_DEFAULT_TTL = 3600  # seconds, if expires_in is not returned
+
+# records per page requested by paginators, see utils/pagination.py
+API_V2_PAGE_SIZE = 100
+DRAP_PAGE_SIZE = 500
+# bytes read at a time from streamed responses, see utils/json_stream.py
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Local files shared by pytest-xdist workers
+LOCAL_STATE_PATH = os.path.join(tempfile.gettempdir(), 'taf-python')
+AUTH0_TOKENS_CACHE_PATH = os.path.join(LOCAL_STATE_PATH, 'auth0_tokens.json')
+DATASETS_REGISTRY_PATH = os.path.join(LOCAL_STATE_PATH, 'datasets_registry.json')
+# AI Catalog datasets uploaded by admin user and shared with test users
+ADMIN_DATASETS_SCOPE = 'admin'
+OPERATION_TIMINGS_PATH = os.path.join(LOCAL_STATE_PATH, 'operation_timings.json')
+# completion times kept per operation, variant and env
+OPERATION_TIMINGS_MAX_SAMPLES = 50
+# completion times needed before timeouts are derived from history
+OPERATION_TIMINGS_MIN_SAMPLES = 5
+# operation times out after historical p99 * factor, within
+# [OPERATION_MIN_TIMEOUT_PERIOD, hardcoded timeout_period of the operation]
+OPERATION_TIMEOUT_FACTOR = 2
+OPERATION_MIN_TIMEOUT_PERIOD = 3  # minutes
+RESOURCE_SLOTS_PATH = os.path.join(LOCAL_STATE_PATH, 'resource_slots')
+RESOURCE_POLL_INTERVAL = 5  # seconds
+# default number of tests using a capped resource of an env at the same time
+RESOURCE_LIMITS = {
+    'autopilot': 2,
+    'modeling_workers': 2,
+    'deployment': 4,
+    'prediction_server': 2
+}
+
+# --time_accounting summary, see utils/plugins/time_accounting.py
+TIME_ACCOUNTING_PATH = os.path.join('reports', 'time_accounting.json')
+# number of tests and fixtures in time accounting top lists
+TIME_ACCOUNTING_TOP_COUNT = 20
+# --trace_spans files, see utils/plugins/tracing.py
+SPANS_PATH = os.path.join('reports', 'spans')
+# --json_logs files, see utils/plugins/json_logging.py
+JSON_LOGS_PATH = os.path.join('reports', 'logs')
+# --perf_store history, see utils/perf_store.py and utils/perf_report.py
+PERF_STORE_PATH = os.path.join(LOCAL_STATE_PATH, 'perf_history.sqlite')
+# number of previous runs of the same env a run is compared with
+PERF_BASELINE_RUNS = 10
+# p-value below which a slowdown is a regression
+PERF_REGRESSION_P_VALUE = 0.01
+# slowdowns smaller than that are ignored, however significant
+PERF_REGRESSION_MIN_RATIO = 1.2
+# Import time of root conftest.py and tests/api modules, see utils/import_profile.py
+IMPORT_TIME_BUDGET = 1500  # ms
+# packages API tests import on first use only
+LAZY_IMPORTS = (
+    'playwright',
+    'pages',
+    'pdfminer',
+    'docx',
+    'jsonpath_rw',
+    'numpy'
+)
 
 STAGING_SELF_SERVICE_TEST_USER = 'staging_self_service_api_tester@test.com'
 PROD_DRAP_ADMIN_USER = 'portal-admin@datarobot.com'
@@ -206,6 +269,12 @@ APP_HOST_ARG = '--app_host'
 DR_ACCOUNT_HOST_ARG = '--dr_account_host'
 AUTH0_HOST_ARG = '--auth0_host'
 REGISTER_DR_ACCOUNT_USER_ARG = '--register_dr_account_user'
+REUSE_DATASETS_ARG = '--reuse_datasets'
+NO_NETWORK_ROUTES_ARG = '--no_network_routes'
+RECORD_UI_STUBS_ARG = '--record_ui_stubs'
+WEB_PERF_ARG = '--web_perf'
+KEEP_ARTIFACTS_ARG = '--keep_artifacts'
+RECORD_VIDEO_ARG = '--record_video'
 
 # DataRobot Account Portal constants
 ADMIN_PERMISSIONS_ERROR = {'error': 'Requires admin permissions'}
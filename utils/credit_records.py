@@ -0,0 +1,242 @@
+"""
+Columnar checks of Credits System records.
+
+Records of a response ('data' of GET api/creditsSystem/creditUsageDetails,
+api/v2/creditsSystem/creditUsageSummary, etc.) are loaded once into NumPy column arrays,
+then keys, types, ranges and values of all records are checked
+by array operations instead of per record Python loops.
+Every check appends error messages to errors_list, like assert_* fixtures do.
+numpy is imported by API tests on first use, see credit_records fixture in conftest.py.
+"""
+
+import numpy as np
+
+
+# GET api/creditsSystem/creditUsageDetails
+CREDIT_USAGE_FIELDS = (
+    'projectId',
+    'projectName',
+    'deploymentId',
+    'deploymentLabel',
+    'category',
+    'creditUsage'
+)
+# indexes of failed records shown in error messages
+SHOWN_INDEXES_COUNT = 5
+
+
+def _indexes(mask):
+    indexes = np.flatnonzero(mask)
+    shown = ', '.join(str(index) for index in indexes[:SHOWN_INDEXES_COUNT])
+    if len(indexes) > SHOWN_INDEXES_COUNT:
+        shown += ', ...'
+    return f'{len(indexes)} records (indexes {shown})'
+
+
+class CreditRecords:
+    """
+    Column arrays of records.
+
+    Parameters
+    ----------
+    records : list
+        Records, dicts
+    fields : tuple
+        Expected keys of records
+
+    Attributes
+    ----------
+    count : int
+        Number of records
+    fields : tuple
+        Expected keys of records
+    keys : set
+        Keys of all records
+    present : dict
+        Bool arrays, True if record has the field, by field
+    columns : dict
+        Object arrays of field values, None if missing, by field
+    """
+
+    def __init__(self, records, fields=CREDIT_USAGE_FIELDS):
+        self.count = len(records)
+        self.fields = fields
+        self.keys = set().union(*records)
+        self.present = {}
+        self.columns = {}
+        for field in fields:
+            self.present[field] = np.fromiter(
+                (field in record for record in records), dtype=bool, count=self.count)
+            column = np.empty(self.count, dtype=object)
+            column[:] = [record.get(field) for record in records]
+            self.columns[field] = column
+
+    @classmethod
+    def from_pages(cls, pages, fields=CREDIT_USAGE_FIELDS, data_key='data'):
+        """
+        Returns records of all pages of a paginated response.
+
+        Parameters
+        ----------
+        pages : list
+            JSON responses, dicts
+        fields : tuple
+            Expected keys of records
+        data_key : str
+            Key of records in a page
+
+        Returns
+        -------
+        records : CreditRecords
+            Records of all pages in page order
+        """
+        return cls([record for page in pages for record in page[data_key]], fields)
+
+    def numbers(self, field):
+        """
+        Returns field values as a float array, NaN if a value is missing or not a number.
+
+        Parameters
+        ----------
+        field : str
+            Record key, e.g. creditUsage
+
+        Returns
+        -------
+        numbers : numpy.ndarray
+            Float array
+        """
+        column = self.columns[field]
+        is_number = np.fromiter(
+            (isinstance(value, (int, float)) and not isinstance(value, bool) for value in column),
+            dtype=bool, count=self.count)
+        numbers = np.full(self.count, np.nan)
+        numbers[is_number] = column[is_number].astype(float)
+        return numbers
+
+    def check_keys(self, errors_list, required=None):
+        """
+        Checks that records have required keys and no unexpected ones.
+
+        Parameters
+        ----------
+        errors_list : list
+            Error messages
+        required : tuple
+            Required keys. All expected fields by default
+        """
+        for field in required or self.fields:
+            missing = ~self.present[field]
+            if missing.any():
+                errors_list.append(f'"{field}" is missing in {_indexes(missing)}')
+
+        unexpected = self.keys.difference(self.fields)
+        if unexpected:
+            errors_list.append(f'Unexpected keys: {sorted(unexpected)}')
+
+    def check_types(self, field, types, errors_list, nullable=False):
+        """
+        Checks types of field values.
+
+        Parameters
+        ----------
+        field : str
+            Record key
+        types : type or tuple
+            Expected types, e.g. str
+        errors_list : list
+            Error messages
+        nullable : bool
+            If None is a valid value
+        """
+        column = self.columns[field]
+        valid = np.fromiter(
+            (isinstance(value, types) or (nullable and value is None) for value in column),
+            dtype=bool, count=self.count)
+        if not valid.all():
+            errors_list.append(f'"{field}" is not {types} in {_indexes(~valid)}')
+
+    def check_range(self, field, errors_list, min_value=None, max_value=None):
+        """
+        Checks that field values are finite numbers within [min_value, max_value].
+
+        Parameters
+        ----------
+        field : str
+            Record key, e.g. creditUsage
+        errors_list : list
+            Error messages
+        min_value : float
+            Minimal value, not checked if None
+        max_value : float
+            Maximal value, not checked if None
+        """
+        numbers = self.numbers(field)
+        invalid = ~np.isfinite(numbers)
+        if min_value is not None:
+            invalid[~invalid] |= numbers[~invalid] < min_value
+        if max_value is not None:
+            invalid[~invalid] |= numbers[~invalid] > max_value
+        if invalid.any():
+            errors_list.append(
+                f'"{field}" is not a number in [{min_value}, {max_value}] in {_indexes(invalid)}')
+
+    def check_column(self, field, expected_values, errors_list):
+        """
+        Checks field values of the first len(expected_values) records.
+
+        Parameters
+        ----------
+        field : str
+            Record key, e.g. key
+        expected_values : list
+            Expected values in record order
+        errors_list : list
+            Error messages
+        """
+        if self.count < len(expected_values):
+            errors_list.append(
+                f'Expected at least {len(expected_values)} records, got {self.count}')
+            return
+
+        expected = np.empty(len(expected_values), dtype=object)
+        expected[:] = expected_values
+        actual = self.columns[field][:len(expected_values)]
+        different = actual != expected
+        for index in np.flatnonzero(different)[:SHOWN_INDEXES_COUNT]:
+            errors_list.append(
+                f'Expected "{field}" {expected[index]!r} at index {index}, got {actual[index]!r}')
+
+    def check_equals(self, expected_records, errors_list, sort_by='category'):
+        """
+        Checks that records equal expected ones regardless of their order.
+
+        Parameters
+        ----------
+        expected_records : list
+            Expected records, dicts
+        errors_list : list
+            Error messages
+        sort_by : str
+            Record key records are matched by after sorting
+        """
+        if self.count != len(expected_records):
+            errors_list.append(f'Expected {len(expected_records)} records, got {self.count}')
+            return
+
+        expected = CreditRecords(expected_records, self.fields)
+        order = np.argsort(self.columns[sort_by].astype(str), kind='stable')
+        expected_order = np.argsort(expected.columns[sort_by].astype(str), kind='stable')
+        if self.keys != expected.keys:
+            errors_list.append(f'Expected keys {sorted(expected.keys)}, got {sorted(self.keys)}')
+
+        for field in self.fields:
+            actual_column = self.columns[field][order]
+            expected_column = expected.columns[field][expected_order]
+            different = (actual_column != expected_column) | (
+                self.present[field][order] != expected.present[field][expected_order])
+            for index in np.flatnonzero(different)[:SHOWN_INDEXES_COUNT]:
+                errors_list.append(
+                    f'Expected "{field}" {expected_column[index]!r} '
+                    f'in record {expected_records[expected_order[index]]}, '
+                    f'got {actual_column[index]!r}')
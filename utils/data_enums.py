@@ -390,3 +390,19 @@ class Auth0Keys(Enum):
     USER_ID = '[0].user_id'
     PORTAL_ID = '[0].app_metadata.portal_id'
     ACCESS_TOKEN = 'access_token'
+    EXPIRES_IN = 'expires_in'
+
+
+class Operations(Enum):
+    """Long running operations with completion times tracked by OperationTimings and PerfStore"""
+    CREATE_PROJECT = 'create_project'
+    EDA = 'eda'
+    TRAIN_MODEL = 'train_model'
+    AUTOPILOT = 'autopilot'
+    CREATE_AI_APP = 'create_ai_app'
+    UPLOAD_DATASET = 'upload_dataset'
+    DEPLOY = 'deploy'
+    BATCH_PREDICTIONS = 'batch_predictions'
+    AI_REPORT = 'ai_report'
+    # credit usage visible in balance
+    METERING_VISIBILITY = 'metering_visibility'
@@ -0,0 +1,131 @@
+import os
+import hashlib
+import logging
+import threading
+
+from utils.file_lock import (
+    FileLock,
+    read_json_file,
+    write_json_file
+)
+from utils.constants import DATASETS_REGISTRY_PATH
+
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class DatasetRegistry:
+    """
+    Keeps AI Catalog dataset ids of local dataset files by (env, scope, file sha256) key,
+    so that each file is uploaded once per environment and user scope
+    and projects are created from the catalog dataset.
+    Dataset ids are shared between pytest-xdist workers and test runs
+    through a locked local .json file.
+    Only one worker uploads a dataset, others wait for it and reuse its id.
+
+    Parameters
+    ----------
+    registry_path : str
+        Path to .json file with dataset ids
+
+    Attributes
+    ----------
+    registry_path : str
+        Path to .json file with dataset ids
+    logger : logging.Logger
+        Inits Logger object
+    """
+
+    def __init__(self, registry_path=DATASETS_REGISTRY_PATH):
+        self.registry_path = registry_path
+        self._dataset_ids = {}
+        self._file_hashes = {}
+        # guards _key_locks only, uploads hold the lock of their key
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.logger = logging.getLogger(__name__)
+
+    def get_dataset_id(self, file_path, env, scope,
+                       upload_dataset, is_dataset_available):
+        """
+        Returns AI Catalog dataset id of the file.
+        Calls upload_dataset() if the file was not uploaded to env in the scope yet
+        or its dataset is not available anymore.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to data/datasets/file.extension
+        env : str
+            App host, e.g. staging
+        scope : str
+            Owner of uploaded datasets, e.g. admin or username
+        upload_dataset : function
+            Uploads the file and returns dataset id
+        is_dataset_available : function
+            Accepts dataset id and returns True if the dataset can still be used
+
+        Returns
+        -------
+        dataset_id : str
+            AI Catalog dataset id
+        """
+        key = '|'.join((env, scope, self.file_hash(file_path)))
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # threads uploading other files or to other envs are not blocked
+        with key_lock:
+            if key in self._dataset_ids:
+                return self._dataset_ids[key]
+
+            # one upload of a dataset at a time, uploads of other datasets are not blocked
+            with FileLock(f'{self.registry_path}.{hashlib.sha1(key.encode()).hexdigest()}.lock'):
+                dataset_id = read_json_file(self.registry_path).get(key)
+
+                if dataset_id is not None and is_dataset_available(dataset_id):
+                    self.logger.info(
+                        'Reused dataset %s for %s (%s at %s)',
+                        dataset_id, os.path.basename(file_path), scope, env)
+                else:
+                    dataset_id = upload_dataset()
+                    self._save(key, dataset_id)
+
+            self._dataset_ids[key] = dataset_id
+            return dataset_id
+
+    def file_hash(self, file_path):
+        """
+        Returns sha256 of the file content.
+        Hash is computed once per file path, size and modification time.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to file
+
+        Returns
+        -------
+        file_hash : str
+            sha256 hex digest
+        """
+        stat = os.stat(file_path)
+        memo_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime)
+        if memo_key not in self._file_hashes:
+            sha256 = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    sha256.update(chunk)
+            self._file_hashes[memo_key] = sha256.hexdigest()
+
+        return self._file_hashes[memo_key]
+
+    def _save(self, key, dataset_id):
+        with FileLock(f'{self.registry_path}.lock'):
+            dataset_ids = read_json_file(self.registry_path)
+            dataset_ids[key] = dataset_id
+            write_json_file(self.registry_path, dataset_ids)
+
+
+# One registry per process
+DATASET_REGISTRY = DatasetRegistry()
@@ -0,0 +1,200 @@
+"""
+Structural diff of JSON values, e.g. an actual response and an expected one
+from data/test_data.
+
+Ignored paths are compiled once into a tree of steps, where '*' matches any key or index:
+('results', 0, 'processingTimeMS') or 'results.*.hits.*.objectID'.
+Subtrees are compared by identity and == at C speed first,
+and walked through only if they differ, to find the paths of differences.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
+
+
+WILDCARD = '*'
+# shown length of a value repr in a difference
+VALUE_REPR_LENGTH = 80
+
+
+class _Missing:
+
+    def __repr__(self):
+        return '<missing>'
+
+
+# value of a key or an index one of the compared values doesn't have
+MISSING = _Missing()
+
+
+def _short_repr(value):
+    text = repr(value)
+    if len(text) > VALUE_REPR_LENGTH:
+        return text[:VALUE_REPR_LENGTH - 3] + '...'
+    return text
+
+
+def format_path(path):
+    """
+    Returns readable path, e.g. results[0].hits[2].objectID.
+
+    Parameters
+    ----------
+    path : tuple
+        Keys and indexes
+
+    Returns
+    -------
+    path : str
+        Formatted path, '$' for the root
+    """
+    text = ''
+    for step in path:
+        text += f'[{step}]' if isinstance(step, int) else f'.{step}'
+    return text.lstrip('.') or '$'
+
+
+class Difference(namedtuple('Difference', ['path', 'actual', 'expected'])):
+    """
+    Different value at path, MISSING if actual or expected value has no such key or index.
+    Shown as path: actual != expected.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return f'{format_path(self.path)}: ' \
+               f'{_short_repr(self.actual)} != {_short_repr(self.expected)}'
+
+
+@lru_cache(maxsize=None)
+def _compile(ignored_keys):
+    tree = {}
+    for ignored_key in ignored_keys:
+        steps = ignored_key.split('.') if isinstance(ignored_key, str) else ignored_key
+        node = tree
+        for step in steps[:-1]:
+            # None marks an ignored path, nothing under it is compared
+            if node.get(str(step), {}) is None:
+                break
+            node = node.setdefault(str(step), {})
+        else:
+            node[str(steps[-1])] = None
+    return tree
+
+
+def compile_ignored(ignored_keys):
+    """
+    Returns tree of ignored paths. Same ignored keys are compiled once.
+
+    Parameters
+    ----------
+    ignored_keys : tuple
+        Paths as lists of keys and indexes, e.g. ['results', 0, 'processingTimeMS'],
+        or dotted strings, e.g. 'results.*.processingTimeMS'. '*' matches any key or index
+
+    Returns
+    -------
+    ignored : dict
+        Ignored steps by step, None for the last step of a path
+    """
+    return _compile(tuple(
+        key if isinstance(key, str) else tuple(key) for key in ignored_keys or ()))
+
+
+def _children(nodes, key):
+    # nodes of the ignored tree under key, None if the key is ignored
+    children = []
+    for node in nodes:
+        for step in (str(key), WILDCARD):
+            if step in node:
+                child = node[step]
+                if child is None:
+                    return None
+                children.append(child)
+    return children
+
+
+def iter_differences(actual, expected, ignored=None, path=()):
+    """
+    Yields differences of actual and expected values, depth first in expected key order.
+
+    Parameters
+    ----------
+    actual : object
+        Actual JSON value
+    expected : object
+        Expected JSON value
+    ignored : dict
+        Tree of ignored paths returned by compile_ignored()
+    path : tuple
+        Path of the compared values
+
+    Returns
+    -------
+    differences : generator
+        Difference tuples
+    """
+    return _iter_differences(actual, expected, [ignored] if ignored else [], path)
+
+
+def _iter_differences(actual, expected, nodes, path):
+    if actual is expected or actual == expected:
+        return
+
+    if isinstance(actual, dict) and isinstance(expected, dict):
+        for key, expected_value in expected.items():
+            children = _children(nodes, key) if nodes else nodes
+            if children is None:
+                continue
+            actual_value = actual.get(key, MISSING)
+            if actual_value is MISSING:
+                yield Difference(path + (key,), MISSING, expected_value)
+            else:
+                yield from _iter_differences(
+                    actual_value, expected_value, children, path + (key,))
+        for key, actual_value in actual.items():
+            if key not in expected and (not nodes or _children(nodes, key) is not None):
+                yield Difference(path + (key,), actual_value, MISSING)
+
+    elif isinstance(actual, list) and isinstance(expected, list):
+        for index in range(max(len(actual), len(expected))):
+            children = _children(nodes, index) if nodes else nodes
+            if children is None:
+                continue
+            if index >= len(actual):
+                yield Difference(path + (index,), MISSING, expected[index])
+            elif index >= len(expected):
+                yield Difference(path + (index,), actual[index], MISSING)
+            else:
+                yield from _iter_differences(
+                    actual[index], expected[index], children, path + (index,))
+
+    else:
+        yield Difference(path, actual, expected)
+
+
+def diff(actual, expected, ignored_keys=(), first_only=False):
+    """
+    Returns differences of actual and expected JSON values.
+
+    Parameters
+    ----------
+    actual : object
+        Actual JSON value, e.g. response dict
+    expected : object
+        Expected JSON value
+    ignored_keys : tuple or dict
+        Ignored paths, see compile_ignored(), or a tree it returned
+    first_only : bool
+        If to stop at the first difference
+
+    Returns
+    -------
+    differences : list
+        Difference tuples, empty if values are equal
+    """
+    ignored = ignored_keys if isinstance(ignored_keys, dict) else compile_ignored(ignored_keys)
+    differences = iter_differences(actual, expected, ignored)
+    return list(islice(differences, 1) if first_only else differences)
@@ -1,6 +1,3 @@
-from docx import Document
-
-
 class DocxParser:
     """
     Parses .docx files content: paragraphs, images, tables
@@ -17,6 +14,8 @@ class DocxParser:
     """
 
     def __init__(self, file_path):
+        from docx import Document
+
         self.docx = Document(file_path)
 
     def get_docx_images(self):
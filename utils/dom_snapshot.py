@@ -0,0 +1,160 @@
+"""
+Batched DOM queries for BasePage.take_snapshot().
+Visibility, inner text and attributes of many elements are read in one page.evaluate()
+instead of a driver round trip per element and property.
+"""
+
+# Resolves selectors in the page: css (with :has-text() and :text-is() in the last compound),
+# text=, xpath= and >> chains used by the repo selectors, taking the first match in document order.
+# Returns {error} for a selector it cannot resolve, so that it is resolved by Playwright:
+# an unsupported selector, an element not found in the document
+# and every selector if the page has shadow roots, which Playwright selectors pierce.
+SNAPSHOT_JS = """
+([selectors, attributes, withText]) => {
+    if (Array.from(document.querySelectorAll('*')).some(element => element.shadowRoot)) {
+        return selectors.map(() => ({error: 'Page has shadow roots'}));
+    }
+    const normalize = text => (text || '').replace(/\\s+/g, ' ').trim();
+    const isQuoted = value => /^(["']).*\\1$/.test(value);
+    const textMatcher = value => {
+        if (isQuoted(value)) {
+            const expected = value.slice(1, -1);
+            return element => normalize(element.textContent) === expected;
+        }
+        const expected = normalize(value).toLowerCase();
+        return element => normalize(element.textContent).toLowerCase().includes(expected);
+    };
+    const innermost = elements => elements.filter(
+        element => !elements.some(other => other !== element && element.contains(other)));
+    const descendants = (root, css) => Array.from(root.querySelectorAll(css));
+    const textElements = root => descendants(root, '*').filter(
+        element => !['HEAD', 'SCRIPT', 'STYLE'].includes(element.tagName));
+
+    const queryCss = (root, css) => {
+        const filters = [];
+        let innermostOnly = false;
+        const pseudo = /:(has-text|text-is)\\((["'])(.*?)\\2\\)/g;
+        const plainCss = css.replace(pseudo, (match, name, quote, value, offset) => {
+            const rest = css.slice(offset + match.length).replace(pseudo, '');
+            if (/[\\s>+~]/.test(rest)) {
+                throw new Error(`:${name}() is supported in the last compound only`);
+            }
+            if (name === 'has-text') {
+                filters.push(textMatcher(value));
+            } else {
+                filters.push(element => normalize(element.textContent) === value);
+                innermostOnly = true;
+            }
+            return offset === 0 || /[\\s>+~]/.test(css[offset - 1]) ? '*' : '';
+        });
+        const found = descendants(root, plainCss).filter(
+            element => filters.every(filter => filter(element)));
+        return innermostOnly ? innermost(found) : found;
+    };
+
+    const queryPart = (root, part) => {
+        if (part.startsWith('css=')) {
+            return queryCss(root, part.slice(4));
+        }
+        if (part.startsWith('text=') || isQuoted(part)) {
+            const matches = textMatcher(part.startsWith('text=') ? part.slice(5) : part);
+            return innermost(textElements(root).filter(matches));
+        }
+        if (part.startsWith('xpath=') || part.startsWith('//')) {
+            const xpath = part.startsWith('xpath=') ? part.slice(6) : part;
+            const result = document.evaluate(
+                xpath, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+        }
+        if (/^[a-z_-]+=/.test(part)) {
+            throw new Error(`Selector engine of ${part} is not supported`);
+        }
+        return queryCss(root, part);
+    };
+
+    const documentOrder = (a, b) =>
+        a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1;
+    const query = selector => {
+        const found = selector.split(/\\s+>>\\s+/).reduce(
+            (roots, part) => roots.flatMap(root => queryPart(root, part.trim())), [document]);
+        return Array.from(new Set(found)).sort(documentOrder)[0];
+    };
+
+    const isVisible = element => {
+        const rect = element.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0
+            && getComputedStyle(element).visibility !== 'hidden';
+    };
+
+    return selectors.map(selector => {
+        let element;
+        try {
+            element = query(selector);
+        } catch (error) {
+            return {error: error.message};
+        }
+        if (!element) {
+            return {error: 'Element is not found in the document'};
+        }
+        return {
+            present: true,
+            visible: isVisible(element),
+            text: withText ? element.innerText : null,
+            attributes: Object.fromEntries(
+                attributes.map(attribute => [attribute, element.getAttribute(attribute)]))
+        };
+    });
+}
+"""
+
+
+class DomSnapshot:
+    """
+    State of page elements read at once by BasePage.take_snapshot().
+
+    Parameters
+    ----------
+    elements : dict
+        {present, visible, text, attributes} dict by selector
+
+    Attributes
+    ----------
+    elements : dict
+        {present, visible, text, attributes} dict by selector
+    """
+
+    def __init__(self, elements):
+        self.elements = elements
+
+    def is_present(self, selector):
+        return self.elements[selector]['present']
+
+    def is_visible(self, selector):
+        return self.elements[selector]['visible']
+
+    def text(self, selector):
+        """Returns inner text of element or None if element is absent."""
+
+        return self.elements[selector]['text']
+
+    def attribute(self, selector, attribute_name):
+        """Returns attribute value of element or None if element or attribute is absent."""
+
+        return self.elements[selector]['attributes'].get(attribute_name)
+
+    def missing(self, selectors=None):
+        """
+        Returns selectors of elements which are not visible.
+
+        Parameters
+        ----------
+        selectors : list
+            Selectors to check. All snapshot selectors by default
+
+        Returns
+        -------
+        missing : list
+            Selectors of absent or hidden elements
+        """
+        return [selector for selector in (selectors or self.elements)
+                if not self.is_visible(selector)]
@@ -75,11 +75,11 @@ class WaitForElementTimeoutException(Error):
 
 
 class TourNotResetException(Error):
-    """Raised if Pendo tour was not reset in N number of rounds."""
+    """Raised if Pendo tour is not shown after it was reset."""
 
-    def __init__(self, user_id, rounds):
-        self.message = f'Pendo tour for user {user_id} ' \
-                       f'was not reset in {rounds} rounds.'
+    def __init__(self, user_id, guide_id):
+        self.message = f'Pendo tour {guide_id} for user {user_id} ' \
+                       f'is not shown after reset.'
 
 
 class ElementIsPresentException(Error):
@@ -137,3 +137,36 @@ class DownloadFileTimeoutException(Error):
         self.message = f'file was not downloaded within {timeout} ms' \
                        f' after clicking {element} element' \
                        f' which initiated download. {error}'
+
+
+class UnknownResourceException(Error):
+    """Raised if @mark.resource() has no limit and resource has no default limit."""
+
+    def __init__(self, resource, known_resources):
+        self.message = f'\nResource "{resource}" has no default limit. ' \
+                       f'Pass a limit: @mark.resource("{resource}", N) ' \
+                       f'or use one of: {known_resources}.'
+
+
+class ConditionTimeoutException(Error):
+    """Raised if page condition is not met within timeout."""
+
+    def __init__(self, condition, timeout, error):
+        self.message = f'{condition} was not met within {timeout} ms. {error}'
+
+
+class UiStubNotFoundException(Error):
+    """Raised if recorded response for @mark.stub_response is missing."""
+
+    def __init__(self, stub_name, stub_path):
+        self.message = f'\nRecorded response "{stub_name}" not found at {stub_path}. ' \
+                       f'Record it with --record_ui_stubs.'
+
+
+class WebPerformanceBudgetException(Error):
+    """Raised if page navigation exceeds web performance budgets."""
+
+    def __init__(self, page_name, breaches):
+        exceeded = ', '.join(f'{metric} {value} > {limit}'
+                             for metric, (value, limit) in breaches.items())
+        self.message = f'\n{page_name} page exceeded web performance budgets: {exceeded}.'
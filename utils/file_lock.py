@@ -0,0 +1,122 @@
+import os
+import json
+import fcntl
+import logging
+
+
+class FileLock:
+    """
+    Exclusive lock on a local file shared by pytest-xdist workers.
+    Uses fcntl.flock(), so the lock is released by OS if a worker dies.
+
+    Parameters
+    ----------
+    lock_path : str
+        Path to lock file. Parent directories are created if missing
+    blocking : bool
+        If to wait until the lock is released by another process or not
+
+    Attributes
+    ----------
+    lock_path : str
+        Path to lock file
+    blocking : bool
+        If to wait until the lock is released by another process or not
+    is_locked : bool
+        If the lock is held by this object
+    logger : logging.Logger
+        Inits Logger object
+    """
+
+    def __init__(self, lock_path, blocking=True):
+        self.lock_path = lock_path
+        self.blocking = blocking
+        self.is_locked = False
+        self._fd = None
+        self.logger = logging.getLogger(__name__)
+
+    def acquire(self):
+        """
+        Acquires the lock.
+
+        Returns
+        -------
+        is_locked : bool
+            If the lock was acquired. Always True if blocking=True
+        """
+        os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+        self._fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        flags = fcntl.LOCK_EX if self.blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(self._fd, flags)
+        except BlockingIOError:
+            os.close(self._fd)
+            self._fd = None
+            return False
+
+        self.is_locked = True
+        self.logger.debug('Acquired lock %s', self.lock_path)
+        return True
+
+    def release(self):
+        """Releases the lock if it is held."""
+
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+            self.is_locked = False
+            self.logger.debug('Released lock %s', self.lock_path)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+def read_json_file(file_path, default=None):
+    """
+    Returns deserialized content of .json file.
+    Returns default if the file does not exist or is not a valid json.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to .json file
+    default : object
+        Value to return if file cannot be read. Empty dict by default
+
+    Returns
+    -------
+    content : object
+        Deserialized file content
+    """
+    try:
+        with open(file_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {} if default is None else default
+
+
+def write_json_file(file_path, content):
+    """
+    Atomically writes content to .json file readable by the current user only:
+    writes a temporary file and replaces target file with it.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to .json file
+    content : object
+        JSON-serializable content
+    """
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    tmp_path = f'{file_path}.{os.getpid()}.tmp'
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(content, f)
+    os.replace(tmp_path, file_path)
@@ -0,0 +1,195 @@
+"""
+Expected data files of data/test_data and data/datasets.
+
+Files are resolved against the repo root, so tests may run from any directory.
+Text and parsed JSON are memoized per process by path, modification time and size,
+and JSON is handed out as read-only dicts and lists:
+a test can't change expected data of other tests. thaw() returns a mutable copy.
+"""
+
+import os
+import json
+import logging
+
+from utils.constants import THIS_FILE_PARENT_DIR
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _read_only(*args, **kwargs):
+    raise TypeError('Golden data is read-only, use thaw() to get a mutable copy')
+
+
+class FrozenDict(dict):
+    """dict that can't be changed, equal to dicts with the same items."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def __copy__(self):
+        return thaw(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return thaw, (dict(self),)
+
+
+class FrozenList(list):
+    """list that can't be changed, equal to lists with the same items."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = append = clear = extend = insert = pop = remove = _read_only
+    reverse = sort = __iadd__ = __imul__ = _read_only
+
+    def __copy__(self):
+        return thaw(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return thaw, (list(self),)
+
+
+def freeze(value):
+    """
+    Returns read-only copy of a JSON value.
+
+    Parameters
+    ----------
+    value : object
+        JSON value
+
+    Returns
+    -------
+    value : object
+        FrozenDict, FrozenList or the immutable value itself
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """
+    Returns mutable deep copy of a JSON value.
+
+    Parameters
+    ----------
+    value : object
+        JSON value, e.g. returned by GoldenData.json()
+
+    Returns
+    -------
+    value : object
+        Value with dicts and lists
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+class GoldenData:
+    """
+    Memoized reads of expected data files.
+
+    Parameters
+    ----------
+    base_dir : str
+        Directory relative paths are resolved against
+
+    Attributes
+    ----------
+    base_dir : str
+        Directory relative paths are resolved against
+    """
+
+    def __init__(self, base_dir=THIS_FILE_PARENT_DIR):
+        self.base_dir = str(base_dir)
+        self._memo = {}
+
+    def resolve(self, file_path):
+        """
+        Returns absolute path of a file.
+        Relative paths are resolved against base_dir, then against the current directory.
+
+        Parameters
+        ----------
+        file_path : str
+            Absolute path or path relative to repo root, e.g. data/test_data/docs_search_all.json
+
+        Returns
+        -------
+        path : str
+            Absolute normalized path
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no such file
+        """
+        candidates = [file_path] if os.path.isabs(file_path) else [
+            os.path.join(self.base_dir, file_path), os.path.join(os.getcwd(), file_path)]
+        for candidate in candidates:
+            path = os.path.normpath(candidate)
+            if os.path.isfile(path):
+                return path
+
+        LOGGER.error('File %s was not found', file_path)
+        raise FileNotFoundError(f'File {file_path} was not found')
+
+    def _memoized(self, file_path, kind, parse):
+        path = self.resolve(file_path)
+        key = (path, kind)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        memo_version, value = self._memo.get(key, (None, None))
+        if memo_version != version:
+            with open(path, encoding='utf-8') as f:
+                value = parse(f.read())
+            self._memo[key] = (version, value)
+        return value
+
+    def text(self, file_path):
+        """
+        Returns file content as text.
+
+        Parameters
+        ----------
+        file_path : str
+            Absolute path or path relative to repo root
+
+        Returns
+        -------
+        content : str
+            UTF-8 decoded content
+        """
+        return self._memoized(file_path, 'text', lambda text: text)
+
+    def json(self, file_path):
+        """
+        Returns parsed JSON file. Dicts and lists are read-only.
+
+        Parameters
+        ----------
+        file_path : str
+            Absolute path or path relative to repo root
+
+        Returns
+        -------
+        value : object
+            FrozenDict, FrozenList or a JSON scalar
+        """
+        return self._memoized(file_path, 'json', lambda text: freeze(json.loads(text)))
+
+
+# One store per process
+GOLDEN_DATA = GoldenData()
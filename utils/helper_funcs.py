@@ -1,6 +1,5 @@
 import os
 import re
-import json
 import logging
 from random import randint
 from time import time
@@ -9,18 +8,15 @@ from datetime import (
     timedelta
 )
 from uuid import uuid1
-from operator import itemgetter
 from urllib.parse import (
     urlparse,
     parse_qs
 )
 
-from pdfminer.high_level import extract_text
-import dictdiffer
-from jsonpath_rw import parse as json_parser
-
 from utils.errors import UnsupportedEnvException
 from utils import rfc3339
+from utils.dict_diff import diff
+from utils.golden_data import GOLDEN_DATA
 from utils.constants import (
     USER_PASSWORD,
     TEST_USER_EMAIL,
@@ -30,7 +26,7 @@ from utils.data_enums import Envs
 
 
 LOGGER = logging.getLogger(__name__)
-# disable logging for 3rd party pdfminer module
+# disable logging for 3rd party pdfminer module, imported on first use
 logging.getLogger('pdfminer').setLevel(logging.ERROR)
 
 
@@ -103,6 +99,8 @@ def get_value_by_json_path(actual_json, json_path, idx=0):
     value : str
         Key value
     """
+    from jsonpath_rw import parse as json_parser
+
     try:
         return [match.value for match in json_parser(
             json_path
@@ -120,52 +118,42 @@ def get_value_by_json_path(actual_json, json_path, idx=0):
 def file_content(file_path):
     """
     Return file content based on provided file path.
+    Content is read once per file modification, see utils/golden_data.py.
 
     Parameters
     ----------
     file_path : str
-        Relative path to file
+        Path to file, absolute or relative to repo root
 
     Returns
     -------
     file content : str
         File content
     """
-    file_ = os.path.join(os.getcwd(), file_path)
-    if os.path.isfile(file_):
-        with open(file_) as f:
-            return f.read()
-    else:
-        LOGGER.error('File %s was not found', file_)
-        raise FileNotFoundError
+    return GOLDEN_DATA.text(file_path)
 
 
 def convert_json_to_dict(file_path):
     """
-    Deserializes file-like object containing a JSON document to a dict
+    Deserializes file-like object containing a JSON document to a dict.
+    File is parsed once per file modification, see utils/golden_data.py.
 
     Parameters
     ----------
     file_path : str
-        Relative path to .json file
+        Path to .json file, absolute or relative to repo root
 
     Returns
     -------
     dictionary : dict
-        Python dictionary
+        Read-only Python dictionary, use golden_data.thaw() to get a mutable copy
     """
-    file_ = os.path.join(os.getcwd(), file_path)
-    if os.path.isfile(file_):
-        with open(file_) as f:
-            return json.load(f)
-    else:
-        LOGGER.error('File %s was not found', file_)
-        raise FileNotFoundError
+    return GOLDEN_DATA.json(file_path)
 
 
-def compare_dicts(actual_dict, expected_dict, ignored_keys):
+def compare_dicts(actual_dict, expected_dict, ignored_keys, first_only=False):
     """
-    Compare 2 dicts are equal using dictdiffer module, logs diff.
+    Compare 2 dicts are equal using utils.dict_diff, logs diff.
     Pass the keys to be ignored to ignore_keys param.
 
     Parameters
@@ -175,18 +163,20 @@ def compare_dicts(actual_dict, expected_dict, ignored_keys):
     expected_dict : dict
         Expected dict
     ignored_keys : tuple
-        Keys to be ignored
+        Keys to be ignored, e.g. ['results', 0, 'processingTimeMS']
+        or 'results.*.processingTimeMS'
+    first_only : bool
+        If to stop at the first difference
 
     Returns
     -------
     bool : bool
         If two dicts are equal
     """
-    difference = list(dictdiffer.diff(first=actual_dict,
-                                      second=expected_dict,
-                                      ignore=ignored_keys))
+    difference = diff(actual_dict, expected_dict, ignored_keys, first_only)
     if difference:
-        LOGGER.error('Responses do not match:\n %s', difference)
+        LOGGER.error('Responses do not match:\n %s',
+                     '\n '.join(map(repr, difference)))
         return False
 
     return True
@@ -557,36 +547,6 @@ def get_id_from_url(url, index):
     return re.findall('/(.+?)/', url)[index]
 
 
-def sort_list_of_dicts(list_of_dicts, key='category'):
-    """
-    Sorts list of dicts by dict key
-
-    Parameters
-    ----------
-    list_of_dicts : list
-        List of dicts
-    key : str
-        Dict key to be sorted by
-
-    Returns
-    -------
-    sorted list of dicts : list
-        Returns a sorted list of dicts by passed key
-    """
-    return sorted(list_of_dicts, key=itemgetter(key))
-
-
-def sort_credits_system_data_dicts(json_resp, key='category'):
-    """
-    Sorts dicts from 'data' list returned by
-    GET api/creditsSystem/creditUsageDetails
-    """
-    resp_data = {'data': sort_list_of_dicts(json_resp['data'], key)}
-    resp_total_count = {'totalCount': json_resp['totalCount']}
-
-    return {**resp_data, **resp_total_count}
-
-
 def replace_chars_if_needed(string, replace_me='+', replace_with='%2B'):
     """
     If the passed char (replace_me) is present in a string,
@@ -630,6 +590,8 @@ def screenshot_name(selector):
 def extract_text_from_pdf(file_path):
     """Returns string content of .pdf file using pdfminer.six library"""
 
+    from pdfminer.high_level import extract_text
+
     return extract_text(file_path)
 
 
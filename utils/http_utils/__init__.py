@@ -1,3 +1,21 @@
-from utils.http_utils.request import Request
-from utils.http_utils.response_handler import ResponseHandler
-from utils.http_utils.api_client import ApiClient
+"""HTTP utils are imported on first access, e.g. UI tests use Request only."""
+
+from importlib import import_module
+
+
+_UTIL_MODULES = {
+    'Request': 'utils.http_utils.request',
+    'ResponseHandler': 'utils.http_utils.response_handler',
+    'ApiClient': 'utils.http_utils.api_client'
+}
+
+__all__ = list(_UTIL_MODULES)
+
+
+def __getattr__(name):
+    if name not in _UTIL_MODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    util = getattr(import_module(_UTIL_MODULES[name]), name)
+    globals()[name] = util
+    return util
@@ -6,10 +6,17 @@ from utils.http_utils import (
     Request
 )
 from utils.helper_funcs import auth_header
-from utils.constants import LOG_SEPARATOR
+from utils.token_cache import TOKEN_CACHE
+from utils.tracing import TRACER
+from utils.constants import (
+    LOG_SEPARATOR,
+    AUTH0_TOKEN_PATH,
+    AUTH0_TOKEN_DEFAULT_TTL
+)
 from utils.data_enums import (
     EnvVars,
-    Envs
+    Envs,
+    Auth0Keys
 )
 
 
@@ -115,7 +122,7 @@ class ApiClient:
 
     def v2_api_get_request(
             self, path='', query_params=None, allow_redirects=True,
-            check_status_code=True
+            check_status_code=True, stream=False
     ):
         """
         Performs a test user GET request using api/v2.
@@ -131,6 +138,9 @@ class ApiClient:
             If to allow http redirects or not. True by default
         check_status_code : bool
             If to check status code or not. True by default
+        stream : bool
+            If to read response body on demand, see ResponseHandler.iter_json_items().
+            False by default
 
         Returns
         -------
@@ -138,9 +148,10 @@ class ApiClient:
             Response returned by GET request
         """
         resp = self._perform_get_request(
-            path, query_params, allow_redirects
+            path, query_params, allow_redirects,
+            stream=stream
         )
-        return self._response(resp, check_status_code)
+        return self._response(resp, check_status_code, stream)
 
     def v2_api_admin_post_request(
             self, path='', request_body=None, files=None,
@@ -463,9 +474,42 @@ class ApiClient:
         )
         return self._response(resp, check_status_code)
 
+    def auth0_token(self, payload, subject, shared=False):
+        """
+        Returns Auth0 access token from TOKEN_CACHE.
+        Calls POST oauth/token only if there is no cached token
+        for (client_id, audience, subject) or the token is about to expire.
+
+        Parameters
+        ----------
+        payload : dict
+            POST oauth/token request body with client_id and audience
+        subject : str
+            Token owner: username or client credentials grant
+        shared : bool
+            If to share the token between pytest-xdist workers
+
+        Returns
+        -------
+        access_token : str
+            Auth0 access token
+        """
+        def create_token():
+            resp = self.auth0_post_request(AUTH0_TOKEN_PATH, payload)
+            expires_in = self.get_response_json(resp).get(
+                Auth0Keys.EXPIRES_IN.value, AUTH0_TOKEN_DEFAULT_TTL)
+
+            return self.get_value_from_json_response(
+                resp, Auth0Keys.ACCESS_TOKEN.value), expires_in
+
+        return TOKEN_CACHE.get_token(
+            (payload['client_id'], payload['audience'], subject),
+            create_token, shared=shared)
+
     def dr_account_get_request(
             self, path='',
-            query_params=None, allow_redirects=True, check_status_code=True
+            query_params=None, allow_redirects=True, check_status_code=True,
+            stream=False
     ):
         """
         Performs non-admin GET request using DataRobot Account Portal API.
@@ -481,6 +525,9 @@ class ApiClient:
             If to allow http redirects or not. True by default
         check_status_code : bool
             If to check status code or not. True by default
+        stream : bool
+            If to read response body on demand, see ResponseHandler.iter_json_items().
+            False by default
 
         Returns
         -------
@@ -488,9 +535,10 @@ class ApiClient:
             Response returned by GET request
         """
         resp = self._perform_get_request(
-            path, query_params, allow_redirects, is_dr_account=True
+            path, query_params, allow_redirects, is_dr_account=True,
+            stream=stream
         )
-        return self._response(resp, check_status_code)
+        return self._response(resp, check_status_code, stream)
 
     def dr_account_admin_get_request(
             self, path='',
@@ -747,7 +795,7 @@ class ApiClient:
 
     def docs_get_request(
             self, path='', query_params=None, allow_redirects=True,
-            check_status_code=True
+            check_status_code=True, stream=False
     ):
         """
         Performs GET request using Docs Portal API.
@@ -763,6 +811,9 @@ class ApiClient:
             If to allow http redirects or not. True by default
         check_status_code : bool
             If to check status code or not. True by default
+        stream : bool
+            If to read response body on demand, see ResponseHandler.iter_json_items().
+            False by default
 
         Returns
         -------
@@ -770,9 +821,10 @@ class ApiClient:
             Response returned by GET request
         """
         resp = self._perform_get_request(
-            path, query_params, allow_redirects, is_docs=True
+            path, query_params, allow_redirects, is_docs=True,
+            stream=stream
         )
-        return self._response(resp, check_status_code)
+        return self._response(resp, check_status_code, stream)
 
     def predictions_api_post_request(
             self, host='', path='', datarobot_key=None, data=None,
@@ -846,6 +898,10 @@ class ApiClient:
     def get_response_json(resp):
         return ResponseHandler(resp).get_json()
 
+    @staticmethod
+    def iter_response_json_items(resp, json_path):
+        return ResponseHandler(resp).iter_json_items(json_path)
+
     @staticmethod
     def _assert_http_status_code(resp, code):
         response_handler = ResponseHandler(resp)
@@ -854,22 +910,26 @@ class ApiClient:
             f'Non-200 status code returned: {status_code}. ' \
             f'Response: {response_handler.get_text()}'
 
-    def _log_http_response(self, resp):
+    def _log_http_response(self, resp, stream=False):
         response_handler = ResponseHandler(resp)
         self.logger.debug(
             'RESPONSE HEADERS: %s', response_handler.get_response_headers())
+        if stream:
+            # logging the body would read it all
+            self.logger.debug('RESPONSE BODY: streamed%s', LOG_SEPARATOR)
+            return
         self.logger.debug(
             'RESPONSE BODY: %s%s', response_handler.get_text(), LOG_SEPARATOR)
 
-    def _check_and_log_response(self, resp, status_code):
+    def _check_and_log_response(self, resp, status_code, stream=False):
         self._assert_http_status_code(resp, status_code)
-        self._log_http_response(resp)
+        self._log_http_response(resp, stream)
 
-    def _response(self, resp, check_status_code):
+    def _response(self, resp, check_status_code, stream=False):
         if check_status_code:
-            self._check_and_log_response(resp, status_code=200)
+            self._check_and_log_response(resp, status_code=200, stream=stream)
             return resp
-        self._log_http_response(resp)
+        self._log_http_response(resp, stream)
         return resp
 
     def _set_auth_header(
@@ -889,31 +949,33 @@ class ApiClient:
 
         return auth_header(self.user_api_key)
 
+    @TRACER.traced('http GET', 'path')
     def _perform_get_request(
             self, path, query_params, allow_redirects,
             session=None, is_admin=False,
             is_dr_account=False, is_dr_account_admin=False,
             is_auth0=False,
-            is_docs=False
+            is_docs=False, stream=False
     ):
         headers = self._set_auth_header(
             is_admin, is_dr_account, is_dr_account_admin, is_auth0, is_docs
         )
         if is_dr_account:
             return self.dr_account_request.get_request(
-                session, path, query_params, headers, allow_redirects
+                session, path, query_params, headers, allow_redirects, stream
             )
         if is_auth0:
             return self.auth0_request.get_request(
-                session, path, query_params, headers, allow_redirects
+                session, path, query_params, headers, allow_redirects, stream
             )
         if is_docs:
             return self.docs_request.get_request(
-                session, path, query_params, headers, allow_redirects)
+                session, path, query_params, headers, allow_redirects, stream)
 
         return self.app_request.get_request(
-            session, path, query_params, headers, allow_redirects)
+            session, path, query_params, headers, allow_redirects, stream)
 
+    @TRACER.traced('http POST', 'path')
     def _perform_post_request(
             self, path, request_body,
             session=None, files=None, is_admin=False,
@@ -935,6 +997,7 @@ class ApiClient:
         return self.app_request.post_request(
             session, path, request_body, headers, files)
 
+    @TRACER.traced('http PATCH', 'path')
     def _perform_patch_request(
             self, path, request_body, session=None, is_admin=False,
             is_dr_account=False, is_dr_account_admin=False,
@@ -954,6 +1017,7 @@ class ApiClient:
         return self.app_request.patch_request(
             session, path, request_body, headers)
 
+    @TRACER.traced('http PUT', 'path')
     def _perform_put_request(
             self, path, request_body, session=None, is_admin=False,
             is_dr_account=False, is_dr_account_admin=False,
@@ -973,6 +1037,7 @@ class ApiClient:
         return self.app_request.put_request(
             session, path, request_body, headers)
 
+    @TRACER.traced('http DELETE', 'path')
     def _perform_delete_request(
             self, path, query_params, request_body, session=None,
             is_admin=False,
@@ -4,6 +4,12 @@ import logging
 import requests
 
 from utils.constants import LOG_SEPARATOR
+from utils.perf_store import PERF_RECORDER
+from utils.json_logging import LOG_CONTEXT
+from utils.time_accounting import (
+    TIME_ACCOUNT,
+    HTTP
+)
 
 
 class Request:
@@ -27,12 +33,16 @@ class Request:
         self.host = host
         self.logger = logging.getLogger(__name__)
 
+    @LOG_CONTEXT.new_request
+    @PERF_RECORDER.recorded_response
+    @TIME_ACCOUNT.timed(HTTP)
     def get_request(self,
                     session=None,
                     path='',
                     query_params=None,
                     headers=None,
-                    allow_redirects=True):
+                    allow_redirects=True,
+                    stream=False):
         """
         Performs HTTP GET request.
 
@@ -49,6 +59,9 @@ class Request:
             Request headers, e.g. {'key': 'value'}. None by default
         allow_redirects : bool
             If to allow http redirects or not. True by default
+        stream : bool
+            If to read response body on demand, see ResponseHandler.iter_json_items().
+            False by default
 
         Returns
         -------
@@ -62,14 +75,19 @@ class Request:
                 params=query_params,
                 headers=headers,
                 allow_redirects=allow_redirects,
-                verify=False)
+                verify=False,
+                stream=stream)
         return requests.get(
             url=urljoin(self.host, path),
             params=query_params,
             headers=headers,
             allow_redirects=allow_redirects,
-            verify=False)
+            verify=False,
+            stream=stream)
 
+    @LOG_CONTEXT.new_request
+    @PERF_RECORDER.recorded_response
+    @TIME_ACCOUNT.timed(HTTP)
     def post_request(self,
                      session=None,
                      path='',
@@ -122,6 +140,9 @@ class Request:
                              data=data,
                              params=query_params)
 
+    @LOG_CONTEXT.new_request
+    @PERF_RECORDER.recorded_response
+    @TIME_ACCOUNT.timed(HTTP)
     def patch_request(self,
                       session=None,
                       path='',
@@ -156,6 +177,9 @@ class Request:
                               json=request_body,
                               headers=headers)
 
+    @LOG_CONTEXT.new_request
+    @PERF_RECORDER.recorded_response
+    @TIME_ACCOUNT.timed(HTTP)
     def put_request(self,
                     session=None,
                     path='',
@@ -190,6 +214,9 @@ class Request:
                               json=request_body,
                               headers=headers)
 
+    @LOG_CONTEXT.new_request
+    @PERF_RECORDER.recorded_response
+    @TIME_ACCOUNT.timed(HTTP)
     def delete_request(self,
                        session=None,
                        path='',
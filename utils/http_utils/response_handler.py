@@ -2,6 +2,8 @@ from utils.helper_funcs import (
     get_value_by_json_path,
     file_content
 )
+from utils.json_stream import iter_json_path
+from utils.constants import STREAM_CHUNK_SIZE
 
 
 class ResponseHandler:
@@ -98,6 +100,58 @@ class ResponseHandler:
         """
         return get_value_by_json_path(self.resp.json(), json_path)
 
+    def iter_json_items(self, json_path, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Yields JSON values selected by json path, parsing response body incrementally.
+        Body of a response requested with stream=True is read by chunks on demand,
+        so memory stays flat and values before the end of the body are yielded
+        without downloading the rest. The response is closed when iteration ends.
+
+        Parameters
+        ----------
+        json_path : str
+            Path to JSON values, e.g. $.data[*] or results[0].hits[*].objectID
+        chunk_size : int
+            Bytes read at a time
+
+        Returns
+        -------
+        values : generator
+            Selected values in response order
+        """
+        try:
+            yield from iter_json_path(
+                self.resp.iter_content(chunk_size), json_path, self.resp.encoding or 'utf-8')
+        finally:
+            self.resp.close()
+
+    def get_first_json_item(self, json_path):
+        """
+        Returns the first JSON value selected by json path without parsing the rest of response.
+
+        Parameters
+        ----------
+        json_path : str
+            Path to JSON values, e.g. $.data[*]
+
+        Returns
+        -------
+        value : object
+            JSON value
+
+        Raises
+        ------
+        ValueError
+            If nothing is found by json path
+        """
+        items = self.iter_json_items(json_path)
+        try:
+            return next(items)
+        except StopIteration:
+            raise ValueError(f'Nothing is found by json path "{json_path}"') from None
+        finally:
+            items.close()
+
     def response_equals(self, expected_response):
         """
         Compares actual plain text response with expected response from file.
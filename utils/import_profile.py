@@ -0,0 +1,131 @@
+"""
+Import-time profile of API test runs.
+
+Every pytest-xdist worker imports conftest.py files and test modules before running a test.
+API tests must not import UI (pages, Playwright) and heavy file parsing packages at start-up:
+they are imported on first use.
+
+Run from repo root:
+python -m utils.import_profile
+
+Imports root conftest.py and tests/api modules in a new Python process with -X importtime,
+prints the slowest imports and exits with code 1 if imports take longer than IMPORT_TIME_BUDGET,
+a module from LAZY_IMPORTS is imported or a module fails to import.
+run_in_jenkins.sh runs it as a report only: the tests are run anyway.
+"""
+
+import os
+import sys
+import subprocess
+
+from utils.constants import (
+    THIS_FILE_PARENT_DIR,
+    IMPORT_TIME_BUDGET,
+    LAZY_IMPORTS
+)
+
+
+API_TESTS_PATH = os.path.join('tests', 'api')
+SLOWEST_IMPORTS_COUNT = 15
+
+
+def api_test_modules(root=THIS_FILE_PARENT_DIR):
+    """
+    Returns names of root conftest.py, tests/api conftest.py files and test modules.
+
+    Parameters
+    ----------
+    root : str
+        Repo root directory
+
+    Returns
+    -------
+    modules : list
+        Module names, e.g. ['conftest', 'tests.api.test_automodel']
+    """
+    modules = ['conftest']
+    for dir_path, dir_names, file_names in os.walk(os.path.join(root, API_TESTS_PATH)):
+        dir_names[:] = sorted(name for name in dir_names if name != '__pycache__')
+        package = os.path.relpath(dir_path, root).replace(os.sep, '.')
+        for file_name in sorted(file_names):
+            if file_name == 'conftest.py' or (
+                    file_name.startswith('test_') and file_name.endswith('.py')):
+                modules.append(f'{package}.{file_name[:-3]}')
+
+    return modules
+
+
+def profile_imports(modules, root=THIS_FILE_PARENT_DIR):
+    """
+    Imports modules in a new Python process with -X importtime.
+
+    Parameters
+    ----------
+    modules : list
+        Module names
+    root : str
+        Repo root directory
+
+    Returns
+    -------
+    imports : list
+        (module name, cumulative import time in us, nesting level) tuples in import order
+
+    Raises
+    ------
+    ImportError
+        If a module fails to import, with the traceback of the Python process
+    """
+    code = '; '.join(f'import {module}' for module in modules)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        universal_newlines=True)
+
+    lines = result.stderr.splitlines()
+    if result.returncode != 0:
+        raise ImportError('\n'.join(
+            line for line in lines if not line.startswith('import time:')))
+
+    imports = []
+    for line in lines:
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        level = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(cumulative), level))
+
+    return imports
+
+
+def main():
+    try:
+        imports = profile_imports(api_test_modules())
+    except ImportError as error:
+        print(f'Failed to import API test modules:\n{error}')
+        return 1
+
+    total = sum(cumulative for _, cumulative, level in imports if level == 0) / 1000
+    lazy_imported = sorted({
+        name for name, _, _ in imports if name.split('.')[0] in LAZY_IMPORTS})
+
+    print(f'Slowest of {len(imports)} imports, cumulative ms:')
+    for name, cumulative, _ in sorted(imports, key=lambda imp: imp[1],
+                                      reverse=True)[:SLOWEST_IMPORTS_COUNT]:
+        print(f'{cumulative / 1000:10.1f}  {name}')
+    print(f'Total: {total:.1f} ms, budget: {IMPORT_TIME_BUDGET} ms')
+
+    failed = False
+    if total > IMPORT_TIME_BUDGET:
+        print(f'Import time {total:.1f} ms exceeds budget {IMPORT_TIME_BUDGET} ms')
+        failed = True
+    if lazy_imported:
+        print(f'Must be imported on first use: {", ".join(lazy_imported)}')
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
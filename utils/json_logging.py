@@ -0,0 +1,221 @@
+"""
+Structured JSON logs.
+
+With --json_logs, every log record of a pytest process is written as a JSON line
+with correlation ids: test nodeid, pytest-xdist worker id, id of the latest HTTP request
+of the thread (see Request) and id of the open tracing span (see utils/tracing.py).
+Records are put to a queue by the logging thread and written by a background thread
+to a gzip file per worker, one gzip member per test, so a test is read without
+decompressing the whole file. Offsets of members by test and request are saved
+next to the file, see utils/log_index.py.
+"""
+
+import os
+import gzip
+import json
+import queue
+import logging
+import threading
+from uuid import uuid4
+from datetime import (
+    datetime,
+    timezone
+)
+from functools import wraps
+from logging.handlers import (
+    QueueHandler,
+    QueueListener
+)
+
+from utils.tracing import TRACER
+from utils.file_lock import write_json_file
+
+
+INDEX_SUFFIX = '.index.json'
+# records logged outside of tests
+SESSION_KEY = ''
+
+
+class LogContext:
+    """
+    Correlation ids added to log records.
+
+    Attributes
+    ----------
+    nodeid : str
+        Nodeid of the running test. None between tests
+    worker_id : str
+        pytest-xdist worker id, e.g. 'gw0', or 'main' without pytest-xdist
+    """
+
+    def __init__(self):
+        self.nodeid = None
+        self.worker_id = None
+        self._local = threading.local()
+
+    @property
+    def request_id(self):
+        """Id of the latest HTTP request of the calling thread."""
+
+        return getattr(self._local, 'request_id', None)
+
+    def reset_request_id(self):
+        """Forgets the latest HTTP request of the calling thread."""
+
+        self._local.request_id = None
+
+    def new_request(self, func):
+        """
+        Decorator giving a new request id to every call of an HTTP request function.
+        Records logged while handling the response get the id too.
+        """
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            self._local.request_id = uuid4().hex[:16]
+            return func(*args, **kwargs)
+
+        return wrapper
+
+
+LOG_CONTEXT = LogContext()
+
+
+class ContextFilter(logging.Filter):
+    """Adds correlation ids to log records in the thread they are logged by."""
+
+    def filter(self, record):
+        span = TRACER.current_span()
+        record.nodeid = LOG_CONTEXT.nodeid
+        record.worker_id = LOG_CONTEXT.worker_id
+        record.request_id = LOG_CONTEXT.request_id
+        record.span_id = span.span_id if span is not None else None
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats log records as JSON lines.
+    QueueHandler appends traceback of a logged exception to the message.
+    """
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'nodeid': getattr(record, 'nodeid', None),
+            'worker': getattr(record, 'worker_id', None),
+            'request_id': getattr(record, 'request_id', None),
+            'span_id': getattr(record, 'span_id', None),
+            'thread': record.threadName
+        }
+        return json.dumps(entry, default=str)
+
+
+class GzipMemberHandler(logging.Handler):
+    """
+    Writes records to a gzip file, starting a new gzip member when the test changes.
+    Offsets of members by test nodeid and request id are saved
+    to file_path + INDEX_SUFFIX on close.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to .jsonl.gz file
+
+    Attributes
+    ----------
+    file_path : str
+        Path to .jsonl.gz file
+    index : dict
+        [start, end] offsets of gzip members by test nodeid and by request id
+    """
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.index = {'tests': {}, 'requests': {}}
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        self._file = open(file_path, 'wb')
+        self._member = None
+        self._member_key = None
+        self._member_start = None
+        self._member_requests = set()
+
+    def emit(self, record):
+        try:
+            line = self.format(record)
+            key = getattr(record, 'nodeid', None) or SESSION_KEY
+            if self._member is None or key != self._member_key:
+                self._end_member()
+                self._member_key = key
+                self._member_start = self._file.tell()
+                self._member = gzip.GzipFile(fileobj=self._file, mode='wb')
+
+            self._member.write(line.encode() + b'\n')
+            request_id = getattr(record, 'request_id', None)
+            if request_id is not None:
+                self._member_requests.add(request_id)
+        except Exception:
+            self.handleError(record)
+
+    def _end_member(self):
+        if self._member is None:
+            return
+
+        # closes gzip member only, not the file
+        self._member.close()
+        offsets = [self._member_start, self._file.tell()]
+        self.index['tests'].setdefault(self._member_key, []).append(offsets)
+        for request_id in self._member_requests:
+            self.index['requests'].setdefault(request_id, []).append(offsets)
+        self._member = None
+        self._member_requests = set()
+
+    def close(self):
+        self.acquire()
+        try:
+            if not self._file.closed:
+                self._end_member()
+                self._file.close()
+                write_json_file(self.file_path + INDEX_SUFFIX, self.index)
+        finally:
+            self.release()
+        super().close()
+
+
+def start_json_logging(file_path, level=logging.DEBUG):
+    """
+    Starts writing records of the root logger to file_path in a background thread.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to .jsonl.gz file
+    level : int
+        Lowest level of written records
+
+    Returns
+    -------
+    stop : function
+        Writes queued records, closes the file and saves its index
+    """
+    file_handler = GzipMemberHandler(file_path)
+    file_handler.setFormatter(JsonFormatter())
+    records = queue.Queue()
+    queue_handler = QueueHandler(records)
+    queue_handler.setLevel(level)
+    queue_handler.addFilter(ContextFilter())
+    listener = QueueListener(records, file_handler)
+
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    listener.start()
+
+    def stop():
+        root.removeHandler(queue_handler)
+        listener.stop()
+        file_handler.close()
+
+    return stop
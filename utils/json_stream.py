@@ -0,0 +1,308 @@
+"""
+Incremental JSON parsing.
+
+Values selected by a JSONPath are decoded from a stream of byte chunks,
+e.g. requests Response.iter_content(), one by one:
+containers on the path that are longer than the buffer are walked through,
+shorter ones are decoded by json at once, other values are skipped,
+and consumed text is dropped, so memory holds one selected value and one chunk at a time.
+The first value is returned as soon as its chunks are read.
+Supported JSONPath subset: $.data[*], results[0].hits[*].objectID, $['totalCount'], $.*.id
+"""
+
+import re
+import json
+import codecs
+
+from utils.constants import STREAM_CHUNK_SIZE
+
+
+WILDCARD = '*'
+WHITESPACE = ' \t\n\r'
+# chars a number may go on with after a chunk boundary
+NUMBER_CHARS = '0123456789.eE+-'
+# .name, ['name'], [0], [*], .*
+PATH_STEP = re.compile(r"\.?([A-Za-z_$][\w$-]*)|\[\s*'([^']*)'\s*\]|\[\s*(\d+)\s*\]|\[\s*\*\s*\]|\.\*")
+
+_DECODER = json.JSONDecoder()
+
+
+def parse_json_path(json_path):
+    """
+    Returns steps of a JSONPath.
+
+    Parameters
+    ----------
+    json_path : str
+        JSONPath, e.g. $.data[*].id
+
+    Returns
+    -------
+    steps : list
+        Object keys, array indexes and WILDCARD, e.g. ['data', WILDCARD, 'id']
+
+    Raises
+    ------
+    ValueError
+        If the path is not in the supported subset
+    """
+    path = json_path.strip()
+    if path.startswith('$'):
+        path = path[1:]
+
+    steps = []
+    position = 0
+    while position < len(path):
+        match = PATH_STEP.match(path, position)
+        if match is None:
+            raise ValueError(f'Unsupported JSONPath "{json_path}" at "{path[position:]}"')
+        name, quoted_name, index = match.groups()
+        if name is not None:
+            steps.append(name)
+        elif quoted_name is not None:
+            steps.append(quoted_name)
+        elif index is not None:
+            steps.append(int(index))
+        else:
+            steps.append(WILDCARD)
+        position = match.end()
+
+    return steps
+
+
+def select_value(value, steps):
+    """
+    Yields values at steps from a decoded JSON value.
+
+    Parameters
+    ----------
+    value : object
+        JSON value
+    steps : list
+        Steps returned by parse_json_path()
+    """
+    if not steps:
+        yield value
+        return
+
+    step, rest = steps[0], steps[1:]
+    if isinstance(value, dict) and isinstance(step, str):
+        items = value.values() if step == WILDCARD else [value[step]] if step in value else []
+    elif isinstance(value, list) and (step == WILDCARD or isinstance(step, int)):
+        items = value if step == WILDCARD else value[step:step + 1]
+    else:
+        return
+
+    for item in items:
+        yield from select_value(item, rest)
+
+
+class JsonStream:
+    """
+    Reads JSON text from byte chunks on demand.
+
+    Parameters
+    ----------
+    chunks : iterable
+        Byte chunks of JSON document
+    encoding : str
+        Text encoding
+    """
+
+    def __init__(self, chunks, encoding='utf-8'):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        self._buffer = ''
+        self._position = 0
+        self._is_eof = False
+
+    def _read(self, min_length=1):
+        # drops consumed text and reads chunks until min_length more chars are buffered
+        self._buffer = self._buffer[self._position:]
+        self._position = 0
+        target = len(self._buffer) + min_length
+        while len(self._buffer) < target and not self._is_eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._is_eof = True
+                self._buffer += self._decoder.decode(b'', final=True)
+            else:
+                self._buffer += self._decoder.decode(chunk)
+        return len(self._buffer) > self._position
+
+    def peek(self):
+        """Returns the next char that is not whitespace, '' at the end of the document."""
+
+        while True:
+            while self._position < len(self._buffer) and \
+                    self._buffer[self._position] in WHITESPACE:
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read():
+                return ''
+
+    def expect(self, char):
+        """
+        Consumes char that must be the next one.
+
+        Raises
+        ------
+        ValueError
+            If the next char is different
+        """
+        actual = self.peek()
+        if actual != char:
+            raise ValueError(f'Expected "{char}" in JSON stream, got "{actual}"')
+        self._position += 1
+
+    def next_is(self, char):
+        """Consumes char if it is the next one, returns if it was consumed."""
+
+        if self.peek() == char:
+            self._position += 1
+            return True
+        return False
+
+    def value(self):
+        """
+        Decodes the next value.
+
+        Raises
+        ------
+        ValueError
+            If the value is not valid JSON
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._is_eof:
+                    raise
+                # value is incomplete: re-decode when twice as much text is buffered
+                self._read(max(len(self._buffer) - self._position, STREAM_CHUNK_SIZE))
+                continue
+            # a number may go on in the next chunk: '1' of '12', '1' of '1.5' or '1.5' of '1.5e3'
+            if not self._is_eof and self._is_number(value) and (
+                    end == len(self._buffer) or self._buffer[end] in NUMBER_CHARS):
+                self._read(max(len(self._buffer) - self._position, STREAM_CHUNK_SIZE))
+                continue
+
+            self._position = end
+            return value
+
+    @staticmethod
+    def _is_number(value):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+    def _buffered_container(self):
+        # decodes the next container at C speed if it is all in the buffer already
+        try:
+            value, end = _DECODER.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            return False, None
+        self._position = end
+        return True, value
+
+    def skip(self):
+        """Skips the next value, walking through containers longer than the buffer."""
+
+        char = self.peek()
+        if char in ('{', '[') and self._buffered_container()[0]:
+            return
+        if char == '{':
+            self._position += 1
+            if self.next_is('}'):
+                return
+            while True:
+                self.value()
+                self.expect(':')
+                self.skip()
+                if not self.next_is(','):
+                    self.expect('}')
+                    return
+        elif char == '[':
+            self._position += 1
+            if self.next_is(']'):
+                return
+            while True:
+                self.skip()
+                if not self.next_is(','):
+                    self.expect(']')
+                    return
+        else:
+            self.value()
+
+    def select(self, steps):
+        """
+        Yields values at steps from the next value, skipping everything else.
+
+        Parameters
+        ----------
+        steps : list
+            Steps returned by parse_json_path()
+        """
+        if not steps:
+            yield self.value()
+            return
+
+        char = self.peek()
+        if char in ('{', '['):
+            is_buffered, value = self._buffered_container()
+            if is_buffered:
+                yield from select_value(value, steps)
+                return
+
+        step, rest = steps[0], steps[1:]
+        if char == '{' and isinstance(step, str):
+            self._position += 1
+            if self.next_is('}'):
+                return
+            while True:
+                key = self.value()
+                self.expect(':')
+                if step == WILDCARD or key == step:
+                    yield from self.select(rest)
+                else:
+                    self.skip()
+                if not self.next_is(','):
+                    self.expect('}')
+                    return
+        elif char == '[' and (step == WILDCARD or isinstance(step, int)):
+            self._position += 1
+            if self.next_is(']'):
+                return
+            index = 0
+            while True:
+                if step == WILDCARD or index == step:
+                    yield from self.select(rest)
+                else:
+                    self.skip()
+                index += 1
+                if not self.next_is(','):
+                    self.expect(']')
+                    return
+        else:
+            self.skip()
+
+
+def iter_json_path(chunks, json_path, encoding='utf-8'):
+    """
+    Yields values selected by JSONPath from JSON document read by chunks.
+
+    Parameters
+    ----------
+    chunks : iterable
+        Byte chunks of JSON document, e.g. Response.iter_content()
+    json_path : str
+        JSONPath, e.g. $.data[*]
+    encoding : str
+        Text encoding
+
+    Returns
+    -------
+    values : generator
+        Selected values in document order
+    """
+    return JsonStream(chunks, encoding).select(parse_json_path(json_path))
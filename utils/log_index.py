@@ -0,0 +1,147 @@
+"""
+Slices --json_logs files by test or request.
+
+Run from repo root:
+python -m utils.log_index --test test_credits_usage.py::test_balance
+python -m utils.log_index --request 3f2a9c1e5b7d4a60
+python -m utils.log_index --list
+
+Only gzip members of matching tests or requests are read and decompressed,
+their offsets are taken from index files written next to log files (see utils/json_logging.py).
+Records are printed as JSON lines, or as text with --text, in time order.
+"""
+
+import os
+import sys
+import json
+import zlib
+import glob
+import argparse
+
+from utils.json_logging import INDEX_SUFFIX
+from utils.constants import JSON_LOGS_PATH
+
+
+# zlib window bits of gzip format
+GZIP_WBITS = 31
+
+
+def load_indexes(logs_path=JSON_LOGS_PATH, run_id=None):
+    """
+    Returns indexes of log files.
+
+    Parameters
+    ----------
+    logs_path : str
+        Directory of log files
+    run_id : str
+        Only files of the test run if passed
+
+    Returns
+    -------
+    indexes : dict
+        Index by log file path
+    """
+    indexes = {}
+    pattern = os.path.join(logs_path, f'{run_id or ""}*.jsonl.gz{INDEX_SUFFIX}')
+    for index_path in sorted(glob.glob(pattern)):
+        with open(index_path) as index_file:
+            indexes[index_path[:-len(INDEX_SUFFIX)]] = json.load(index_file)
+
+    return indexes
+
+
+def read_members(file_path, offsets):
+    """
+    Returns records of gzip members of a log file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to .jsonl.gz file
+    offsets : list
+        [start, end] offsets of members
+
+    Returns
+    -------
+    records : list
+        Log records
+    """
+    records = []
+    with open(file_path, 'rb') as log_file:
+        for start, end in sorted(set(map(tuple, offsets))):
+            log_file.seek(start)
+            member = zlib.decompress(log_file.read(end - start), GZIP_WBITS)
+            records.extend(json.loads(line) for line in member.splitlines())
+
+    return records
+
+
+def select_records(indexes, test=None, request_id=None):
+    """
+    Returns records of tests with nodeid containing test or of a request.
+
+    Parameters
+    ----------
+    indexes : dict
+        Index by log file path, see load_indexes()
+    test : str
+        Part of test nodeid
+    request_id : str
+        Request id
+
+    Returns
+    -------
+    records : list
+        Log records in time order
+    """
+    records = []
+    for file_path, index in indexes.items():
+        if request_id is not None:
+            offsets = index['requests'].get(request_id, [])
+        else:
+            offsets = [member for nodeid, members in index['tests'].items()
+                       if nodeid and test in nodeid for member in members]
+        if offsets:
+            records.extend(read_members(file_path, offsets))
+
+    if request_id is not None:
+        records = [record for record in records if record['request_id'] == request_id]
+    else:
+        records = [record for record in records if test in (record['nodeid'] or '')]
+
+    return sorted(records, key=lambda record: record['time'])
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Slice --json_logs files by test or request')
+    parser.add_argument('--logs', default=JSON_LOGS_PATH, help='Directory of log files')
+    parser.add_argument('--run', help='Test run id, all runs by default')
+    parser.add_argument('--text', action='store_true', help='Print records as text')
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--test', help='Part of test nodeid')
+    group.add_argument('--request', help='Request id')
+    group.add_argument('--list', action='store_true', help='List logged tests')
+    args = parser.parse_args(args)
+
+    indexes = load_indexes(args.logs, args.run)
+    if args.list:
+        for file_path, index in indexes.items():
+            for nodeid in index['tests']:
+                if nodeid:
+                    print(f'{os.path.basename(file_path)}  {nodeid}')
+        return 0
+
+    records = select_records(indexes, args.test, args.request)
+    for record in records:
+        if args.text:
+            print(f'{record["time"]} [{record["level"]}] {record["worker"]} '
+                  f'{record["request_id"] or "-"} {record["message"]}')
+        else:
+            print(json.dumps(record))
+
+    return 0 if records else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
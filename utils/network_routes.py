@@ -0,0 +1,248 @@
+import os
+import re
+import logging
+import hashlib
+from time import time
+from fnmatch import fnmatch
+from urllib.parse import urlparse
+
+from playwright._impl._api_types import Error
+
+from utils.file_lock import (
+    read_json_file,
+    write_json_file
+)
+from utils.ui_constants import (
+    BLOCKED_HOSTS,
+    NOT_CACHED_HOSTS,
+    CACHED_RESOURCE_TYPES,
+    ASSETS_CACHE_PATH,
+    ASSETS_CACHE_MAX_AGE,
+    UI_STUBS_PATH
+)
+from utils.errors import UiStubNotFoundException
+
+
+# these headers don't describe the decoded body the response is fulfilled with
+DROPPED_RESPONSE_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+# file name with a content hash added by the bundler, e.g. main.3f2a9c1b.chunk.js,
+# changes with the content, so a cached copy is never stale
+CONTENT_HASHED_PATH = re.compile(r'[.\-_~][0-9a-fA-F]{8,}(\.chunk)?\.\w+$')
+# response is not stored if Cache-Control has any of these directives
+NOT_STORED_DIRECTIVES = ('no-store', 'no-cache', 'private')
+
+
+class NetworkRoutes:
+    """
+    Routes browser page requests with page.route():
+    1. Aborts requests to third-party hosts not needed by UI assertions
+       (analytics, fonts, video embeds) unless a host is allowed for the test
+    2. Serves static assets (scripts, styles, fonts, images) with content hashed urls
+       from a local disk cache shared by pytest-xdist workers and test runs.
+       A missed asset is loaded by the browser and stored by store_responses()
+    3. Fulfills requests with recorded responses (see stub())
+    Only requests to blocked hosts and content hashed assets are routed,
+    other requests are continued without calling a route handler.
+    Response bodies are not read in event handlers, where sync Playwright calls block
+    event dispatch: responses are kept and read by store_responses() after the test
+
+    Parameters
+    ----------
+    page : playwright.sync_api._generated.Page
+        Browser page
+    allowed_hosts : list
+        Hosts which are not blocked for the test, e.g. ['youtube.com']
+    blocked_hosts : tuple
+        Hosts blocked together with their subdomains
+    cache_path : str
+        Path to static assets cache dir
+
+    Attributes
+    ----------
+    page : playwright.sync_api._generated.Page
+        Browser page
+    allowed_hosts : list
+        Hosts which are not blocked for the test
+    blocked_hosts : tuple
+        Hosts blocked together with their subdomains
+    cache_path : str
+        Path to static assets cache dir
+    blocked_count : int
+        Number of aborted requests
+    cache_hits : int
+        Number of assets served from disk cache
+    logger : logging.Logger
+        Inits Logger object
+    """
+
+    def __init__(self, page, allowed_hosts=(), blocked_hosts=BLOCKED_HOSTS,
+                 cache_path=ASSETS_CACHE_PATH):
+        self.page = page
+        self.allowed_hosts = list(allowed_hosts)
+        self.blocked_hosts = blocked_hosts
+        self.cache_path = cache_path
+        self.blocked_count = 0
+        self.cache_hits = 0
+        self.logger = logging.getLogger(__name__)
+        # (response, stub path or None for an asset) to store after the test
+        self._responses = []
+
+    def start(self):
+        """
+        Routes requests to blocked hosts and content hashed assets,
+        keeps missed assets to store them to the cache.
+        Routes added later by stub() take precedence.
+        """
+        self.page.route(self._is_blocked_url, self._abort)
+        self.page.route(self._is_asset_url, self._fulfill_from_cache)
+        self.page.on('response', self._keep_missed_asset)
+
+    def stub(self, url_pattern, stub_name, record=False):
+        """
+        Fulfills requests matching url_pattern with response recorded
+        to data/ui_stubs/{stub_name}.json, e.g. for a test checking page rendering only.
+        If record=True, requests go to backend and the last matching response is recorded
+        by store_responses().
+
+        Parameters
+        ----------
+        url_pattern : str
+            Glob pattern of request url, e.g. '**/api/v2/projects/*'
+        stub_name : str
+            Recorded response file name without extension
+        record : bool
+            If to record the response instead of stubbing it
+        """
+        stub_path = os.path.join(UI_STUBS_PATH, f'{stub_name}.json')
+        if record:
+            self.page.on(
+                'response',
+                lambda response: self._keep_recorded(response, url_pattern, stub_path))
+            self.logger.info('Recording %s responses to %s', url_pattern, stub_path)
+            return
+
+        recorded = read_json_file(stub_path)
+        if not recorded:
+            raise UiStubNotFoundException(stub_name, stub_path)
+
+        self.page.route(
+            url_pattern,
+            lambda route, request: route.fulfill(
+                status=recorded['status'],
+                headers=recorded['headers'],
+                body=recorded['body']))
+        self.logger.info('Stubbed %s with %s', url_pattern, stub_path)
+
+    def store_responses(self):
+        """
+        Stores missed assets to the cache and recorded stub responses.
+        Called before the page is closed, while response bodies are available.
+        """
+        responses, self._responses = self._responses, []
+        for response, stub_path in responses:
+            try:
+                if stub_path is None:
+                    self._store_asset(response)
+                else:
+                    self._record(response, stub_path)
+            except Error as error:
+                self.logger.debug('Response %s is not stored: %s', response.url, error)
+
+    def log_stats(self):
+        self.logger.info(
+            'Network routes: blocked %d requests, served %d assets from cache',
+            self.blocked_count, self.cache_hits)
+
+    def _is_blocked_url(self, url):
+        host = urlparse(url).hostname or ''
+        return _matches_host(host, self.blocked_hosts) \
+            and not _matches_host(host, self.allowed_hosts)
+
+    def _abort(self, route, request):
+        self.blocked_count += 1
+        self.logger.debug('Blocked %s', request.url)
+        route.abort('blockedbyclient')
+
+    def _is_asset_url(self, url):
+        # blocked urls are aborted whichever of the two routes is matched first
+        return CONTENT_HASHED_PATH.search(urlparse(url).path) is not None \
+            and not self._is_blocked_url(url)
+
+    def _is_cached(self, request):
+        return request.method == 'GET' \
+            and request.resource_type in CACHED_RESOURCE_TYPES \
+            and self._is_asset_url(request.url) \
+            and not _matches_host(urlparse(request.url).hostname or '', NOT_CACHED_HOSTS)
+
+    def _cache_paths(self, url):
+        body_path = os.path.join(self.cache_path, hashlib.sha256(url.encode()).hexdigest())
+        return body_path, f'{body_path}.json'
+
+    @staticmethod
+    def _is_fresh(body_path):
+        return os.path.exists(body_path) \
+            and time() - os.path.getmtime(body_path) < ASSETS_CACHE_MAX_AGE
+
+    def _fulfill_from_cache(self, route, request):
+        if not self._is_cached(request):
+            route.continue_()
+            return
+
+        body_path, meta_path = self._cache_paths(request.url)
+        meta = read_json_file(meta_path)
+        if not meta or not self._is_fresh(body_path):
+            # the browser loads the asset, store_responses() caches it
+            route.continue_()
+            return
+
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        self.cache_hits += 1
+        route.fulfill(status=meta['status'], headers=meta['headers'], body=body)
+
+    def _keep_missed_asset(self, response):
+        # only attributes of the response event are read here, the body is read later
+        if response.status != 200 or not self._is_cached(response.request):
+            return
+
+        cache_control = response.headers.get('cache-control', '').lower()
+        if not any(directive in cache_control for directive in NOT_STORED_DIRECTIVES):
+            self._responses.append((response, None))
+
+    def _keep_recorded(self, response, url_pattern, stub_path):
+        if fnmatch(response.url, url_pattern):
+            self._responses.append((response, stub_path))
+
+    def _store_asset(self, response):
+        body_path, meta_path = self._cache_paths(response.url)
+        if self._is_fresh(body_path):
+            return
+
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in DROPPED_RESPONSE_HEADERS}
+        _write_file(body_path, response.body())
+        write_json_file(meta_path, {'status': response.status, 'headers': headers})
+
+    def _record(self, response, stub_path):
+        write_json_file(stub_path, {
+            'url': response.url,
+            'status': response.status,
+            'headers': {'content-type': response.headers.get('content-type', '')},
+            'body': response.text()
+        })
+        self.logger.info('Recorded %s response to %s', response.url, stub_path)
+
+
+def _matches_host(host, hosts):
+    return any(host == known_host or host.endswith(f'.{known_host}')
+               for known_host in hosts)
+
+
+def _write_file(file_path, content):
+    """Atomically writes bytes: pytest-xdist workers may cache the same asset."""
+
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    tmp_path = f'{file_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, file_path)
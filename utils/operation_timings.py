@@ -0,0 +1,326 @@
+import math
+import logging
+import threading
+from time import time
+
+from utils.time_accounting import sleep
+from utils.perf_store import PERF_RECORDER
+from utils.helper_funcs import time_left
+from utils.file_lock import (
+    FileLock,
+    read_json_file,
+    write_json_file
+)
+from utils.constants import (
+    OPERATION_TIMINGS_PATH,
+    OPERATION_TIMINGS_MAX_SAMPLES,
+    OPERATION_TIMINGS_MIN_SAMPLES,
+    OPERATION_TIMEOUT_FACTOR,
+    OPERATION_MIN_TIMEOUT_PERIOD
+)
+
+
+class OperationTimings:
+    """
+    Keeps completion times in seconds of long running operations
+    (e.g. Autopilot, model training) by operation, variant (e.g. blueprint) and env
+    in a locked local .json file.
+    Times out an operation after historical p99 * timeout_factor,
+    but not earlier than min_timeout_period and not later than its hardcoded timeout_period,
+    and derives a delay before the first poll from the fastest completion.
+
+    Parameters
+    ----------
+    store_path : str
+        Path to .json file with completion times
+    max_samples : int
+        Number of last completion times kept per operation and env
+    min_samples : int
+        Number of completion times needed to derive timeout
+    timeout_factor : float
+        Operation times out after p99 * timeout_factor seconds
+    min_timeout_period : float
+        Lower limit of a timeout derived from history in minutes
+
+    Attributes
+    ----------
+    store_path : str
+        Path to .json file with completion times
+    max_samples : int
+        Number of last completion times kept per operation and env
+    min_samples : int
+        Number of completion times needed to derive timeout
+    timeout_factor : float
+        Operation times out after p99 * timeout_factor seconds
+    min_timeout_period : float
+        Lower limit of a timeout derived from history in minutes
+    logger : logging.Logger
+        Inits Logger object
+    """
+
+    def __init__(self, store_path=OPERATION_TIMINGS_PATH,
+                 max_samples=OPERATION_TIMINGS_MAX_SAMPLES,
+                 min_samples=OPERATION_TIMINGS_MIN_SAMPLES,
+                 timeout_factor=OPERATION_TIMEOUT_FACTOR,
+                 min_timeout_period=OPERATION_MIN_TIMEOUT_PERIOD):
+        self.store_path = store_path
+        self.max_samples = max_samples
+        self.min_samples = min_samples
+        self.timeout_factor = timeout_factor
+        self.min_timeout_period = min_timeout_period
+        self._samples = None
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def start(self, operation, env, timeout_period, variant=None):
+        """
+        Starts timing an operation run.
+
+        Parameters
+        ----------
+        operation : str
+            Operation name, see Operations in utils.data_enums
+        env : str
+            App host, e.g. staging
+        timeout_period : int
+            Hardcoded operation timeout in minutes
+        variant : str
+            What completion time depends on, e.g. blueprint id of model training
+
+        Returns
+        -------
+        timer : OperationTimer
+            Timer with operation deadline
+        """
+        return OperationTimer(self, operation, env, timeout_period,
+                              self.samples(operation, env, variant), variant)
+
+    def poll(self, operation, env, timeout_period, is_done, poll_interval, description,
+             variant=None):
+        """
+        Calls is_done every poll_interval seconds until it returns a truthy result.
+        The first call waits for OperationTimer.wait_for_first_poll(),
+        completion time is saved when the operation is done.
+
+        Parameters
+        ----------
+        operation : str
+            Operation name, see Operations in utils.data_enums
+        env : str
+            App host, e.g. staging
+        timeout_period : int
+            Hardcoded operation timeout in minutes
+        is_done : function
+            Polls the operation once, returns a falsy value while it is running
+        poll_interval : int
+            Poll every n seconds
+        description : str
+            What is polled for in log messages, e.g. 'Autopilot for project {pid} to finish'
+        variant : str
+            What completion time depends on, e.g. blueprint id
+
+        Returns
+        -------
+        result : object
+            Truthy result of is_done, e.g. a response
+
+        Raises
+        ------
+        TimeoutError
+            If the operation is not done before the timer deadline
+        """
+        timer = self.start(operation, env, timeout_period, variant)
+        timer.wait_for_first_poll()
+
+        while True:
+            result = is_done()
+            if result:
+                timer.done()
+                return result
+
+            self.logger.info('Polling for %s. Will stop polling in %s',
+                             description, time_left(timer.deadline))
+            timer.check_anomaly()
+            if time() > timer.deadline:
+                self.logger.error('Timed out polling for %s after %s minutes',
+                                  description, timer.timeout_period)
+                raise TimeoutError(
+                    f'Timed out polling for {description} after {timer.timeout_period} minutes')
+
+            sleep(poll_interval)
+
+    def samples(self, operation, env, variant=None):
+        """
+        Returns completion times in seconds of previous operation runs at env.
+        Completion times are read from store_path file once per process.
+
+        Parameters
+        ----------
+        operation : str
+            Operation name
+        env : str
+            App host, e.g. staging
+        variant : str
+            What completion time depends on, e.g. blueprint id
+
+        Returns
+        -------
+        samples : list
+            Completion times in seconds
+        """
+        with self._lock:
+            if self._samples is None:
+                self._samples = read_json_file(self.store_path)
+            return list(self._samples.get(self._key(operation, env, variant), []))
+
+    def record(self, operation, env, duration, variant=None):
+        """
+        Saves completion time of an operation run.
+
+        Parameters
+        ----------
+        operation : str
+            Operation name
+        env : str
+            App host, e.g. staging
+        duration : float
+            Completion time in seconds
+        variant : str
+            What completion time depends on, e.g. blueprint id
+        """
+        key = self._key(operation, env, variant)
+
+        with self._lock, FileLock(f'{self.store_path}.lock'):
+            stored_samples = read_json_file(self.store_path)
+            samples = stored_samples.get(key, []) + [round(duration, 1)]
+            stored_samples[key] = samples[-self.max_samples:]
+            write_json_file(self.store_path, stored_samples)
+            self._samples = stored_samples
+
+    @staticmethod
+    def _key(operation, env, variant):
+        if variant:
+            return f'{env}|{operation}|{variant}'
+        return f'{env}|{operation}'
+
+
+class OperationTimer:
+    """
+    One run of a long running operation.
+
+    Parameters
+    ----------
+    timings : OperationTimings
+        Store of completion times
+    operation : str
+        Operation name
+    env : str
+        App host, e.g. staging
+    timeout_period : int
+        Hardcoded operation timeout in minutes
+    samples : list
+        Completion times in seconds of previous runs
+    variant : str
+        What completion time depends on, e.g. blueprint id
+
+    Attributes
+    ----------
+    operation : str
+        Operation name
+    env : str
+        App host, e.g. staging
+    started_at : float
+        Time the operation was started at
+    p99 : float
+        p99 of previous completion times in seconds. None if there are not enough samples
+    timeout_period : float
+        Operation timeout in minutes: p99 * timeout_factor within
+        [min_timeout_period, hardcoded timeout_period]
+    deadline : float
+        Time to stop waiting for the operation at
+    first_poll_delay : float
+        Seconds to wait before the first poll: half of the fastest previous completion time
+    """
+
+    def __init__(self, timings, operation, env, timeout_period, samples, variant=None):
+        self._timings = timings
+        self.operation = operation
+        self.env = env
+        self.variant = variant
+        self.started_at = time()
+        self.p99 = None
+        self.timeout_period = timeout_period
+        self.first_poll_delay = 0
+        self._is_anomaly_reported = False
+
+        if len(samples) >= timings.min_samples:
+            self.p99 = percentile(samples, 99)
+            # a stuck run times out after the learned deadline, but not later than hardcoded one
+            learned_timeout_period = round(self.p99 * timings.timeout_factor / 60, 1)
+            self.timeout_period = min(
+                timeout_period, max(timings.min_timeout_period, learned_timeout_period))
+            self.first_poll_delay = min(samples) / 2
+            timings.logger.info(
+                '%s at %s: p99 of %d previous runs is %d seconds. Timeout is %s minutes',
+                operation, env, len(samples), self.p99, self.timeout_period)
+
+        self.deadline = self.started_at + 60 * self.timeout_period
+
+    def wait_for_first_poll(self):
+        """Sleeps until the operation could be done judging by previous runs."""
+
+        if self.first_poll_delay:
+            sleep(self.first_poll_delay)
+
+    def check_anomaly(self):
+        """
+        Logs a warning once if the operation runs longer than p99 of previous runs.
+
+        Returns
+        -------
+        is_anomaly : bool
+            True if the operation runs longer than p99 of previous runs
+        """
+        elapsed = time() - self.started_at
+        if self.p99 is None or elapsed <= self.p99:
+            return False
+
+        if not self._is_anomaly_reported:
+            self._timings.logger.warning(
+                '%s at %s runs for %d seconds, longer than 99%% of previous runs (%d seconds). '
+                'Times out after %s minutes',
+                self.operation, self.env, elapsed, self.p99, self.timeout_period)
+            self._is_anomaly_reported = True
+        return True
+
+    def done(self):
+        """Saves completion time of the operation."""
+
+        duration = time() - self.started_at
+        self._timings.record(self.operation, self.env, duration, self.variant)
+        PERF_RECORDER.record_operation(self.operation, duration)
+
+
+def percentile(values, percent):
+    """
+    Returns nearest-rank percentile of values.
+
+    Parameters
+    ----------
+    values : list
+        Numbers
+    percent : int
+        Percentile, e.g. 99
+
+    Returns
+    -------
+    percentile : float
+        Smallest value greater than or equal to percent % of values
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+# One store per process
+OPERATION_TIMINGS = OperationTimings()
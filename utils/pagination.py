@@ -0,0 +1,185 @@
+"""
+Paginated list endpoints.
+
+Paginator yields records of all pages lazily: the next page is requested in a background thread
+while records of the current page are processed, and no more pages are requested
+once the caller stops iterating. Pages are fetched by a function of a page token:
+- api/v2 lists (deployments, userNotifications, applications, etc.) return 'next' page url
+- DRAP lists (creditUsageDetails, getCheckoutHistory) and streamed api/v2 lists
+  are read by offset and limit, 'totalCount' is returned if the endpoint has it
+The next page is requested under the tracing span open when iteration started.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.tracing import TRACER
+
+
+# records : list, next_token : next page token, None for the last page,
+# total_count : number of records of all pages, None if not returned
+Page = namedtuple('Page', ['records', 'next_token', 'total_count'])
+
+
+class Paginator:
+    """
+    Iterates records of a paginated list endpoint.
+
+    Parameters
+    ----------
+    fetch_page : function
+        Returns Page by page token
+    first_token : object
+        Token of the first page
+    prefetch : bool
+        If to request the next page while the current one is processed
+    """
+
+    def __init__(self, fetch_page, first_token=None, prefetch=True):
+        self.fetch_page = fetch_page
+        self.first_token = first_token
+        self.prefetch = prefetch
+
+    def pages(self, prefetch=None):
+        """
+        Yields pages. With prefetch, the next page is requested before the current one is yielded.
+
+        Parameters
+        ----------
+        prefetch : bool
+            Overrides self.prefetch if passed
+        """
+        if not (self.prefetch if prefetch is None else prefetch):
+            token = self.first_token
+            while True:
+                page = self.fetch_page(token)
+                yield page
+                if page.next_token is None or not page.records:
+                    return
+                token = page.next_token
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='paginator')
+        # spans of prefetch requests nest under the span of the caller, e.g. the test
+        parent_span = TRACER.current_span()
+        next_page = None
+        try:
+            page = self.fetch_page(self.first_token)
+            while True:
+                has_next = page.next_token is not None and page.records
+                next_page = executor.submit(
+                    self._fetch_page_in_span, parent_span, page.next_token) if has_next else None
+                yield page
+                if next_page is None:
+                    return
+                page = next_page.result()
+                next_page = None
+        finally:
+            # iteration stopped early: a prefetched page is dropped, but a request in flight
+            # is waited for, so that the caller doesn't share the HTTP session with it
+            if next_page is not None:
+                next_page.cancel()
+            executor.shutdown(wait=True)
+
+    def _fetch_page_in_span(self, parent_span, token):
+        with TRACER.parent_span(parent_span):
+            return self.fetch_page(token)
+
+    def __iter__(self):
+        for page in self.pages():
+            yield from page.records
+
+    def first(self, count):
+        """
+        Returns the first count records, requesting only pages they are on.
+
+        Parameters
+        ----------
+        count : int
+            Number of records
+
+        Returns
+        -------
+        records : list
+            Up to count records
+        """
+        records = []
+        if count <= 0:
+            return records
+
+        for record in self:
+            records.append(record)
+            if len(records) == count:
+                break
+        return records
+
+    def total_count(self):
+        """
+        Returns number of records of all pages without keeping them:
+        from the first page if the endpoint returns totalCount, by counting page records otherwise.
+
+        Returns
+        -------
+        total_count : int
+            Number of records
+        """
+        count = 0
+        for page in self.pages(prefetch=False):
+            if page.total_count is not None:
+                return page.total_count
+            count += len(page.records)
+        return count
+
+
+def next_link_pages(get_json, path, query_params=None):
+    """
+    Returns Paginator of an api/v2 list endpoint with 'data' and 'next' page url in responses.
+
+    Parameters
+    ----------
+    get_json : function
+        Returns JSON response of GET request by path and query params
+    path : str
+        Endpoint path, e.g. api/v2/deployments/
+    query_params : dict
+        Query params of the first page, e.g. {'limit': 100}
+
+    Returns
+    -------
+    paginator : Paginator
+        Records of all pages
+    """
+    def fetch_page(next_url):
+        # next url has query params of the next page
+        resp = get_json(next_url, None) if next_url else get_json(path, query_params)
+        return Page(resp['data'], resp.get('next'), resp.get('totalCount'))
+
+    return Paginator(fetch_page)
+
+
+def offset_pages(get_json, page_size):
+    """
+    Returns Paginator of a list endpoint read by offset and limit,
+    with 'data' and 'totalCount' in responses.
+
+    Parameters
+    ----------
+    get_json : function
+        Returns JSON response by offset and limit
+    page_size : int
+        Number of records per request
+
+    Returns
+    -------
+    paginator : Paginator
+        Records of all pages
+    """
+    def fetch_page(offset):
+        resp = get_json(offset, page_size)
+        records = resp['data']
+        total_count = resp.get('totalCount')
+        next_offset = offset + len(records)
+        is_last = len(records) < page_size or (
+            total_count is not None and next_offset >= total_count)
+        return Page(records, None if is_last else next_offset, total_count)
+
+    return Paginator(fetch_page, first_token=0)
@@ -0,0 +1,332 @@
+"""
+Performance regressions of a run.
+
+Run from repo root:
+python -m utils.perf_report [--run RUN_ID] [--env ENV] [--baseline RUNS]
+
+Compares a run saved with --perf_store (the latest one by default) with the previous
+PERF_BASELINE_RUNS runs against the same env and exits with code 1 on regressions:
+- environment: HTTP latencies of an endpoint or completion times of an operation
+  are slower than in the baseline by one-sided Mann-Whitney U test
+- framework: a test or resource wait time is an outlier of its baseline values
+  by robust z-score (median and median absolute deviation), or a resource is used more
+Slowdowns under PERF_REGRESSION_MIN_RATIO are ignored.
+Slow tests of a run with environment regressions may be slow because of the environment.
+"""
+
+import sys
+import math
+import argparse
+from statistics import median
+
+from utils.perf_store import PerfStore
+from utils.constants import (
+    PERF_STORE_PATH,
+    PERF_BASELINE_RUNS,
+    PERF_REGRESSION_P_VALUE,
+    PERF_REGRESSION_MIN_RATIO
+)
+
+
+ENVIRONMENT = 'environment'
+FRAMEWORK = 'framework'
+# samples needed in both the run and the baseline to test latencies and operation times
+MIN_SAMPLES = 5
+# baseline runs needed to test durations of tests and resource wait times
+MIN_BASELINE_VALUES = 3
+# robust z-score of an outlier
+OUTLIER_Z_SCORE = 3.5
+# MAD of normal distribution is 0.6745 of its standard deviation
+MAD_SCALE = 1.4826
+
+
+def mann_whitney_p_value(samples, baseline):
+    """
+    Returns p-value of one-sided Mann-Whitney U test that samples are greater than baseline,
+    normal approximation with tie and continuity corrections.
+
+    Parameters
+    ----------
+    samples : list
+        Numbers of the run
+    baseline : list
+        Numbers of the baseline
+
+    Returns
+    -------
+    p_value : float
+        Probability to get samples that large if they came from baseline distribution
+    """
+    values = sorted([(value, True) for value in samples] + [(value, False) for value in baseline])
+    count = len(values)
+    samples_rank_sum = 0.0
+    ties_sum = 0
+    start = 0
+    while start < count:
+        end = start
+        while end + 1 < count and values[end + 1][0] == values[start][0]:
+            end += 1
+        tied = end - start + 1
+        ties_sum += tied ** 3 - tied
+        # average of 1-based ranks start + 1 .. end + 1
+        rank = (start + end) / 2 + 1
+        samples_rank_sum += rank * sum(1 for _, is_sample in values[start:end + 1] if is_sample)
+        start = end + 1
+
+    samples_count, baseline_count = len(samples), len(baseline)
+    u_statistic = samples_rank_sum - samples_count * (samples_count + 1) / 2
+    mean = samples_count * baseline_count / 2
+    variance = samples_count * baseline_count / 12 * (
+        count + 1 - ties_sum / (count * (count - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z_score = (u_statistic - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z_score / math.sqrt(2))
+
+
+def robust_z_score(value, baseline):
+    """
+    Returns distance of value from baseline median in scaled median absolute deviations.
+
+    Parameters
+    ----------
+    value : float
+        Number of the run
+    baseline : list
+        Numbers of the baseline
+
+    Returns
+    -------
+    z_score : float
+        Robust z-score, inf if value differs from baseline without deviation
+    """
+    center = median(baseline)
+    deviation = MAD_SCALE * median(abs(item - center) for item in baseline)
+    if deviation == 0:
+        return 0.0 if value == center else math.copysign(math.inf, value - center)
+    return (value - center) / deviation
+
+
+def ratio(value, baseline_value):
+    return value / baseline_value if baseline_value > 0 else math.inf
+
+
+def sample_regressions(store, table, key_column, value_column, run_id, baseline_ids):
+    """
+    Returns keys with samples slower than in baseline runs by Mann-Whitney U test.
+
+    Parameters
+    ----------
+    store : PerfStore
+        Performance history
+    table : str
+        endpoint_latencies or operation_times
+    key_column : str
+        endpoint or operation
+    value_column : str
+        latency or duration
+    run_id : str
+        Id of the run
+    baseline_ids : list
+        Ids of baseline runs
+
+    Returns
+    -------
+    regressions : list
+        (key, run median, baseline median, description) tuples
+    """
+    samples = store.samples(table, key_column, value_column, [run_id])
+    baseline = store.samples(table, key_column, value_column, baseline_ids)
+
+    regressions = []
+    for key, values in sorted(samples.items()):
+        baseline_values = baseline.get(key, [])
+        if len(values) < MIN_SAMPLES or len(baseline_values) < MIN_SAMPLES:
+            continue
+
+        run_median, baseline_median = median(values), median(baseline_values)
+        p_value = mann_whitney_p_value(values, baseline_values)
+        if p_value < PERF_REGRESSION_P_VALUE and \
+                ratio(run_median, baseline_median) >= PERF_REGRESSION_MIN_RATIO:
+            regressions.append((key, run_median, baseline_median,
+                                f'p={p_value:.2g}, n={len(values)}/{len(baseline_values)}'))
+
+    return regressions
+
+
+def duration_regressions(store, run_id, baseline_ids):
+    """
+    Returns passed tests slower than in baseline runs.
+
+    Parameters
+    ----------
+    store : PerfStore
+        Performance history
+    run_id : str
+        Id of the run
+    baseline_ids : list
+        Ids of baseline runs
+
+    Returns
+    -------
+    regressions : list
+        (nodeid, run duration, baseline median, description) tuples
+    """
+    durations = store.samples('test_durations', 'nodeid', 'duration', [run_id])
+    baseline = store.samples('test_durations', 'nodeid', 'duration', baseline_ids)
+
+    regressions = []
+    for nodeid, (duration, *_) in sorted(durations.items()):
+        baseline_durations = baseline.get(nodeid, [])
+        if len(baseline_durations) < MIN_BASELINE_VALUES:
+            continue
+
+        z_score = robust_z_score(duration, baseline_durations)
+        baseline_median = median(baseline_durations)
+        if z_score > OUTLIER_Z_SCORE and \
+                ratio(duration, baseline_median) >= PERF_REGRESSION_MIN_RATIO:
+            regressions.append((nodeid, duration, baseline_median, f'z={z_score:.1f}'))
+
+    return regressions
+
+
+def resource_regressions(store, run_id, baseline_ids):
+    """
+    Returns resources used more or waited for longer than in baseline runs.
+
+    Parameters
+    ----------
+    store : PerfStore
+        Performance history
+    run_id : str
+        Id of the run
+    baseline_ids : list
+        Ids of baseline runs
+
+    Returns
+    -------
+    regressions : list
+        (resource metric, run value, baseline median, description) tuples
+    """
+    def run_totals(ids):
+        uses = store.samples('resource_uses', 'resource', 'uses', ids)
+        wait_times = store.samples('resource_uses', 'resource', 'wait_time', ids)
+        return {resource: (sum(uses[resource]), sum(wait_times[resource]))
+                for resource in uses}
+
+    totals = run_totals([run_id])
+    baseline = [run_totals([baseline_id]) for baseline_id in baseline_ids]
+
+    regressions = []
+    for resource, (uses, wait_time) in sorted(totals.items()):
+        baseline_totals = [run[resource] for run in baseline if resource in run]
+        if len(baseline_totals) < MIN_BASELINE_VALUES:
+            continue
+
+        baseline_uses = median(run_uses for run_uses, _ in baseline_totals)
+        if ratio(uses, baseline_uses) >= PERF_REGRESSION_MIN_RATIO:
+            regressions.append((f'{resource} uses', uses, baseline_uses, 'more uses'))
+
+        baseline_wait_times = [run_wait_time for _, run_wait_time in baseline_totals]
+        z_score = robust_z_score(wait_time, baseline_wait_times)
+        baseline_wait_time = median(baseline_wait_times)
+        if z_score > OUTLIER_Z_SCORE and \
+                ratio(wait_time, baseline_wait_time) >= PERF_REGRESSION_MIN_RATIO:
+            regressions.append((f'{resource} wait time', wait_time, baseline_wait_time,
+                                f'z={z_score:.1f}'))
+
+    return regressions
+
+
+def find_regressions(store, run_id=None, env=None, baseline_runs=PERF_BASELINE_RUNS):
+    """
+    Compares a run with previous runs against the same env.
+
+    Parameters
+    ----------
+    store : PerfStore
+        Performance history
+    run_id : str
+        Id of the run. The latest run by default
+    env : str
+        Env of the latest run. Env of run_id by default
+    baseline_runs : int
+        Number of previous runs to compare with
+
+    Returns
+    -------
+    run_id : str
+        Id of the compared run
+    baseline_ids : list
+        Ids of baseline runs
+    regressions : dict
+        Lists of regressions by section, e.g. 'environment: endpoints'
+
+    Raises
+    ------
+    ValueError
+        If there are no runs or run_id is not found
+    """
+    runs = store.runs(env)
+    if run_id is not None:
+        runs = store.runs(next((run_env for run, run_env, _ in runs if run == run_id), None))
+    if not runs:
+        raise ValueError('No runs are saved, run tests with --perf_store')
+
+    ids = [run for run, _, _ in runs]
+    run_id = run_id or ids[-1]
+    if run_id not in ids:
+        raise ValueError(f'Run {run_id} is not found in {store.db_path}')
+
+    index = ids.index(run_id)
+    baseline_ids = ids[max(index - baseline_runs, 0):index]
+    if not baseline_ids:
+        return run_id, baseline_ids, {}
+
+    return run_id, baseline_ids, {
+        f'{ENVIRONMENT}: endpoints': sample_regressions(
+            store, 'endpoint_latencies', 'endpoint', 'latency', run_id, baseline_ids),
+        f'{ENVIRONMENT}: operations': sample_regressions(
+            store, 'operation_times', 'operation', 'duration', run_id, baseline_ids),
+        f'{FRAMEWORK}: tests': duration_regressions(store, run_id, baseline_ids),
+        f'{FRAMEWORK}: resources': resource_regressions(store, run_id, baseline_ids)
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Compare a run with previous runs')
+    parser.add_argument('--db', default=PERF_STORE_PATH, help='Path to performance history')
+    parser.add_argument('--run', help='Run id, the latest run by default')
+    parser.add_argument('--env', help='Compare the latest run against env')
+    parser.add_argument('--baseline', type=int, default=PERF_BASELINE_RUNS,
+                        help='Number of previous runs to compare with')
+    args = parser.parse_args(args)
+
+    try:
+        run_id, baseline_ids, regressions = find_regressions(
+            PerfStore(args.db), args.run, args.env, args.baseline)
+    except ValueError as error:
+        print(error)
+        return 1
+
+    if not baseline_ids:
+        print(f'Run {run_id} has no previous runs to compare with')
+        return 0
+
+    print(f'Run {run_id} compared with {len(baseline_ids)} previous runs')
+    for section, section_regressions in regressions.items():
+        if not section_regressions:
+            continue
+        print(f'Regressions of {section}:')
+        for name, value, baseline_value, description in section_regressions:
+            print(f'  {name}: {value:.2f} vs {baseline_value:.2f} ({description})')
+
+    if not any(regressions.values()):
+        print('No regressions')
+        return 0
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,355 @@
+"""
+Historical performance store.
+
+Every run with --perf_store saves to a SQLite file:
+- duration and outcome of every test
+- latency of every HTTP request by endpoint (method, host and path with ids replaced by {id})
+- completion times of long running operations (Operations in utils.data_enums)
+- number of uses and wait time of capped resources (see utils/resource_broker.py)
+Samples are collected in memory by PERF_RECORDER of every pytest process
+and written in one transaction at the end of the run.
+utils/perf_report.py compares a run with previous runs of the same env.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from time import (
+    time,
+    perf_counter
+)
+from functools import wraps
+from contextlib import closing
+from urllib.parse import urlparse
+
+from utils.constants import PERF_STORE_PATH
+
+
+# path segments replaced by {id}: numbers, ObjectIds, UUIDs, emails and tokens
+ID_SEGMENT = re.compile(
+    r'^(\d+|[0-9a-f]{24}|[0-9a-f-]{36}|[^/]*@[^/]*|(?=[^/]*\d)[\w-]{16,})$', re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    env TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS test_durations (
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS endpoint_latencies (
+    run_id TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    latency REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS operation_times (
+    run_id TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resource_uses (
+    run_id TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    uses INTEGER NOT NULL,
+    wait_time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_env ON runs (env, started_at);
+CREATE INDEX IF NOT EXISTS test_durations_run ON test_durations (run_id);
+CREATE INDEX IF NOT EXISTS endpoint_latencies_run ON endpoint_latencies (run_id);
+CREATE INDEX IF NOT EXISTS operation_times_run ON operation_times (run_id);
+CREATE INDEX IF NOT EXISTS resource_uses_run ON resource_uses (run_id);
+"""
+
+
+def endpoint_name(method, url):
+    """
+    Returns endpoint name with ids in path replaced by {id},
+    e.g. 'GET app.datarobot.com/api/v2/projects/{id}/models/'.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method, e.g. GET
+    url : str
+        Request url
+
+    Returns
+    -------
+    endpoint : str
+        Endpoint name
+    """
+    url = urlparse(url)
+    segments = ['{id}' if ID_SEGMENT.match(segment) else segment
+                for segment in url.path.split('/')]
+    return f'{method} {url.netloc}{"/".join(segments)}'
+
+
+class PerfRecorder:
+    """
+    Collects performance samples of this pytest process in memory.
+
+    Attributes
+    ----------
+    enabled : bool
+        If to collect samples
+    latencies : list
+        (endpoint, seconds) tuples
+    operations : list
+        (operation, seconds) tuples
+    resources : dict
+        [uses, wait seconds] by resource name
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.latencies = []
+        self.operations = []
+        self.resources = {}
+        self._lock = threading.Lock()
+
+    def record_response(self, response):
+        """
+        Saves latency of an HTTP request: time from sending the request
+        to receiving response headers.
+
+        Parameters
+        ----------
+        response : requests.models.Response
+            Response of the request
+        """
+        if self.enabled:
+            endpoint = endpoint_name(response.request.method, response.url)
+            with self._lock:
+                self.latencies.append((endpoint, response.elapsed.total_seconds()))
+
+    def recorded_response(self, func):
+        """Decorator saving latency of the response returned by the function."""
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            response = func(*args, **kwargs)
+            self.record_response(response)
+            return response
+
+        return wrapper
+
+    def record_operation(self, operation, duration):
+        """
+        Saves completion time of a long running operation.
+
+        Parameters
+        ----------
+        operation : str
+            Operation name, see Operations in utils.data_enums
+        duration : float
+            Completion time in seconds
+        """
+        if self.enabled:
+            with self._lock:
+                self.operations.append((operation, duration))
+
+    def record_resource(self, resource, wait_time):
+        """
+        Saves a use of a capped resource.
+
+        Parameters
+        ----------
+        resource : str
+            Resource name, e.g. autopilot
+        wait_time : float
+            Seconds waited for a free slot
+        """
+        if self.enabled:
+            with self._lock:
+                uses = self.resources.setdefault(resource, [0, 0.0])
+                uses[0] += 1
+                uses[1] += wait_time
+
+    def timed_operation(self, operation):
+        """
+        Decorator saving duration of the function call as completion time of operation
+        if the function does not raise.
+
+        Parameters
+        ----------
+        operation : str
+            Operation name, see Operations in utils.data_enums
+        """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                start = perf_counter()
+                result = func(*args, **kwargs)
+                self.record_operation(operation, perf_counter() - start)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def pop_samples(self):
+        """
+        Returns collected samples and forgets them.
+
+        Returns
+        -------
+        samples : tuple
+            latencies, operations and resources
+        """
+        with self._lock:
+            samples = self.latencies, self.operations, self.resources
+            self.latencies, self.operations, self.resources = [], [], {}
+        return samples
+
+
+class PerfStore:
+    """
+    SQLite file with performance samples of runs.
+    Every pytest-xdist worker writes its samples in its own transaction.
+
+    Parameters
+    ----------
+    db_path : str
+        Path to SQLite file
+
+    Attributes
+    ----------
+    db_path : str
+        Path to SQLite file
+    """
+
+    def __init__(self, db_path=PERF_STORE_PATH):
+        self.db_path = db_path
+
+    def connect(self):
+        """
+        Returns connection to the store, creates tables if needed.
+
+        Returns
+        -------
+        connection : sqlite3.Connection
+            Connection, closed by caller
+        """
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # workers write at the end of the run at the same time
+        connection = sqlite3.connect(self.db_path, timeout=60)
+        connection.executescript(SCHEMA)
+        return connection
+
+    def save_run(self, run_id, env, started_at, test_durations):
+        """
+        Saves a run and durations of its tests.
+
+        Parameters
+        ----------
+        run_id : str
+            Id of the run
+        env : str
+            App host the run was run against, e.g. staging
+        started_at : float
+            Time the run started at
+        test_durations : dict
+            (duration in seconds, outcome) by test nodeid
+        """
+        with closing(self.connect()) as connection, connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?)',
+                (run_id, env, started_at, time()))
+            connection.executemany(
+                'INSERT INTO test_durations VALUES (?, ?, ?, ?)',
+                [(run_id, nodeid, duration, outcome)
+                 for nodeid, (duration, outcome) in test_durations.items()])
+
+    def save_samples(self, run_id, recorder):
+        """
+        Saves samples collected by recorder and forgets them.
+
+        Parameters
+        ----------
+        run_id : str
+            Id of the run
+        recorder : PerfRecorder
+            Samples of this pytest process
+        """
+        latencies, operations, resources = recorder.pop_samples()
+        if not (latencies or operations or resources):
+            return
+
+        with closing(self.connect()) as connection, connection:
+            connection.executemany(
+                'INSERT INTO endpoint_latencies VALUES (?, ?, ?)',
+                [(run_id, endpoint, latency) for endpoint, latency in latencies])
+            connection.executemany(
+                'INSERT INTO operation_times VALUES (?, ?, ?)',
+                [(run_id, operation, duration) for operation, duration in operations])
+            connection.executemany(
+                'INSERT INTO resource_uses VALUES (?, ?, ?, ?)',
+                [(run_id, resource, uses, wait_time)
+                 for resource, (uses, wait_time) in resources.items()])
+
+    def runs(self, env=None):
+        """
+        Returns runs, oldest first.
+
+        Parameters
+        ----------
+        env : str
+            Only runs against env if passed
+
+        Returns
+        -------
+        runs : list
+            (run_id, env, started_at) tuples
+        """
+        query = 'SELECT run_id, env, started_at FROM runs'
+        params = ()
+        if env is not None:
+            query += ' WHERE env = ?'
+            params = (env,)
+
+        with closing(self.connect()) as connection:
+            return connection.execute(f'{query} ORDER BY started_at', params).fetchall()
+
+    def samples(self, table, key_column, value_column, run_ids):
+        """
+        Returns samples of runs by key, e.g. latencies by endpoint.
+        Durations of passed tests only are returned from test_durations.
+
+        Parameters
+        ----------
+        table : str
+            Table name, e.g. endpoint_latencies
+        key_column : str
+            Column samples are grouped by, e.g. endpoint
+        value_column : str
+            Sample column, e.g. latency
+        run_ids : list
+            Ids of runs
+
+        Returns
+        -------
+        samples : dict
+            Lists of samples by key
+        """
+        query = (f'SELECT {key_column}, {value_column} FROM {table} '
+                 f'WHERE run_id IN ({", ".join("?" * len(run_ids))})')
+        if table == 'test_durations':
+            # failed and skipped tests don't run to the end
+            query += " AND outcome = 'passed'"
+
+        samples = {}
+        with closing(self.connect()) as connection:
+            for key, value in connection.execute(query, list(run_ids)):
+                samples.setdefault(key, []).append(value)
+
+        return samples
+
+
+# One recorder per process
+PERF_RECORDER = PerfRecorder()
@@ -0,0 +1,70 @@
+"""
+Structured JSON logs of tests.
+
+With --json_logs, every pytest process writes its log records as JSON lines with test nodeid,
+worker id, request id and span id to JSON_LOGS_PATH/{test run id}-{worker id}.jsonl.gz
+(see utils/json_logging.py). Slice them by test or request with python -m utils.log_index
+"""
+
+import os
+from uuid import uuid4
+
+from pytest import hookimpl
+
+from utils.json_logging import (
+    LOG_CONTEXT,
+    start_json_logging
+)
+from utils.constants import JSON_LOGS_PATH
+
+
+JSON_LOGS_ARG = '--json_logs'
+
+
+class JsonLoggingPlugin:
+    """
+    Sets test nodeid of log records and closes the log file at the end of the run.
+
+    Parameters
+    ----------
+    stop : function
+        Stops JSON logging, returned by start_json_logging()
+    """
+
+    def __init__(self, stop):
+        self._stop = stop
+
+    @hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        LOG_CONTEXT.nodeid = item.nodeid
+        LOG_CONTEXT.reset_request_id()
+        yield
+        LOG_CONTEXT.nodeid = None
+        LOG_CONTEXT.reset_request_id()
+
+    def pytest_unconfigure(self, config):
+        self._stop()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        JSON_LOGS_ARG, action='store_true', default=False,
+        help=f'Write log records with test, worker, request and span ids '
+             f'to {JSON_LOGS_PATH} as gzipped JSON lines, a file per worker')
+
+
+def pytest_configure(config):
+    if not config.getoption(JSON_LOGS_ARG):
+        return
+
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput is not None:
+        run_id, worker_id = workerinput['testrunuid'], workerinput['workerid']
+    else:
+        run_id, worker_id = getattr(config.option, 'testrunuid', None) or uuid4().hex, 'main'
+        # pytest-xdist passes it to workers
+        config.option.testrunuid = run_id
+
+    LOG_CONTEXT.worker_id = worker_id
+    stop = start_json_logging(os.path.join(JSON_LOGS_PATH, f'{run_id}-{worker_id}.jsonl.gz'))
+    config.pluginmanager.register(JsonLoggingPlugin(stop), 'taf_json_logging')
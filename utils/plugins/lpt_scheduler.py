@@ -0,0 +1,312 @@
+"""
+Duration-aware pytest-xdist scheduling.
+
+Test durations of every run are saved to pytest cache (.pytest_cache).
+With --lpt_schedule, tests are sent to workers longest-processing-time-first
+using durations of previous runs, so 30-40 minute Autopilot tests start first
+and don't set the tail of the run.
+Tests sharing module or class scoped fixtures are sent to the same worker as one work unit.
+Work units using a resource (@mark.resource) whose limit is reached by running units
+are skipped for now, so idle workers pick runnable tests instead of waiting for a slot.
+"""
+
+import logging
+from time import time
+from statistics import median
+from collections import OrderedDict
+
+from pytest import hookimpl
+from xdist.scheduler import LoadScopeScheduling
+
+from utils.resource_broker import marker_resources
+
+
+LPT_SCHEDULE_ARG = '--lpt_schedule'
+DURATIONS_CACHE_KEY = 'taf/durations'
+TEST_GROUPS_CACHE_KEY = 'taf/test_groups'
+TEST_RESOURCES_CACHE_KEY = 'taf/test_resources'
+# weight of the last run duration in the stored duration
+DURATION_SMOOTHING = 0.5
+# duration for tests without history when there is no history at all
+DEFAULT_DURATION = 60  # seconds
+
+LOGGER = logging.getLogger(__name__)
+
+
+class LongestProcessingTimeScheduling(LoadScopeScheduling):
+    """
+    Sends work units to idle workers in descending order of their predicted duration.
+    Work unit is a single test or a group of tests sharing module or class scoped fixtures.
+
+    Parameters
+    ----------
+    config : Config
+        Access to configuration values, plugin manager and plugin hooks
+    log : Producer
+        xdist log producer
+    durations : dict
+        Durations in seconds of previous runs by test nodeid
+    test_groups : dict
+        Work unit name by test nodeid for tests sharing fixtures.
+        Read from pytest cache when work queue is built if not given
+    test_resources : dict
+        Resource limit by resource name by test nodeid.
+        Read from pytest cache when work queue is built if not given
+
+    Attributes
+    ----------
+    durations : dict
+        Durations in seconds of previous runs by test nodeid
+    test_groups : dict
+        Work unit name by test nodeid for tests sharing fixtures
+    test_resources : dict
+        Resource limit by resource name by test nodeid
+    predicted_makespan : float
+        Predicted run time in seconds of the longest loaded worker
+    tests_without_history : int
+        Number of tests with no duration from previous runs
+    """
+
+    def __init__(self, config, log=None, durations=None,
+                 test_groups=None, test_resources=None):
+        super().__init__(config, log)
+        self.durations = durations or {}
+        self.test_groups = test_groups
+        self.test_resources = test_resources
+        self.predicted_makespan = None
+        self.tests_without_history = 0
+        self._is_sorted = False
+
+    def _split_scope(self, nodeid):
+        if self.test_groups is None:
+            # saved by the first worker when it finished collection
+            self.test_groups = self.config.cache.get(TEST_GROUPS_CACHE_KEY, {})
+            self.test_resources = self.config.cache.get(TEST_RESOURCES_CACHE_KEY, {})
+        return self.test_groups.get(nodeid, nodeid)
+
+    def _assign_work_unit(self, node):
+        if not self._is_sorted:
+            self._sort_workqueue()
+
+        scope = self._next_scope(node)
+        if scope is None:
+            return
+        work_unit = self.workqueue.pop(scope)
+
+        assigned_to_node = self.assigned_work.setdefault(node, OrderedDict())
+        assigned_to_node[scope] = work_unit
+
+        worker_collection = self.registered_collections[node]
+        nodeids_indexes = [
+            worker_collection.index(nodeid)
+            for nodeid, completed in work_unit.items()
+            if not completed
+        ]
+        node.send_runtest_some(nodeids_indexes)
+
+    def _next_scope(self, node):
+        """
+        Returns the longest work unit waiting in the queue
+        whose resources are below their limits.
+        If there is no such unit, returns None while the worker has tests to run,
+        so that it is asked again when a test is done.
+        Otherwise returns the longest work unit:
+        the worker then waits for a resource slot in acquire_resources fixture.
+        """
+        resources_in_use = self._resources_in_use()
+        for scope, work_unit in self.workqueue.items():
+            unit_resources = self._unit_resources(work_unit)
+            if all(resources_in_use.get(resource, 0) < limit
+                   for resource, limit in unit_resources.items()):
+                return scope
+
+        # pytest-xdist worker does not run its last pending test until it gets more
+        if self._pending_of(self.assigned_work.get(node, {})) > 1:
+            return None
+        return next(iter(self.workqueue))
+
+    def _unit_resources(self, work_unit):
+        # tests of a unit run one by one, so a unit holds one slot of each resource
+        unit_resources = {}
+        for nodeid in work_unit:
+            for resource, limit in (self.test_resources or {}).get(nodeid, {}).items():
+                unit_resources[resource] = min(limit, unit_resources.get(resource, limit))
+        return unit_resources
+
+    def _resources_in_use(self):
+        """Returns number of assigned and not completed work units by resource name."""
+
+        resources_in_use = {}
+        for assigned_to_node in self.assigned_work.values():
+            for work_unit in assigned_to_node.values():
+                if all(work_unit.values()):
+                    continue
+                for resource in self._unit_resources(work_unit):
+                    resources_in_use[resource] = resources_in_use.get(resource, 0) + 1
+        return resources_in_use
+
+    def _sort_workqueue(self):
+        default_duration = median(self.durations.values()) \
+            if self.durations else DEFAULT_DURATION
+
+        unit_durations = {}
+        for scope, work_unit in self.workqueue.items():
+            unit_durations[scope] = sum(
+                self.durations.get(nodeid, default_duration) for nodeid in work_unit)
+            self.tests_without_history += sum(
+                nodeid not in self.durations for nodeid in work_unit)
+
+        self.workqueue = OrderedDict(sorted(
+            self.workqueue.items(),
+            key=lambda unit: unit_durations[unit[0]], reverse=True))
+        self.predicted_makespan = self._simulate_makespan(
+            unit_durations, len(self.nodes))
+        self._is_sorted = True
+
+        LOGGER.info(
+            'LPT schedule: %d work units on %d workers. Predicted makespan: %d seconds',
+            len(self.workqueue), len(self.nodes), self.predicted_makespan)
+
+    @staticmethod
+    def _simulate_makespan(unit_durations, workers_count):
+        workers_load = [0] * max(workers_count, 1)
+        for duration in sorted(unit_durations.values(), reverse=True):
+            workers_load[workers_load.index(min(workers_load))] += duration
+
+        return max(workers_load)
+
+
+class DurationsPlugin:
+    """
+    Collects test durations and saves them to pytest cache at the end of the run.
+    Reports predicted vs actual makespan if tests were scheduled with --lpt_schedule.
+
+    Parameters
+    ----------
+    config : Config
+        Access to configuration values, plugin manager and plugin hooks
+
+    Attributes
+    ----------
+    config : Config
+        Access to configuration values, plugin manager and plugin hooks
+    durations : dict
+        Durations in seconds of this run by test nodeid
+    scheduler : LongestProcessingTimeScheduling
+        Scheduler if tests run with --lpt_schedule and pytest-xdist
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.durations = {}
+        self.scheduler = None
+        self._session_start = time()
+
+    @hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        if not config.getoption(LPT_SCHEDULE_ARG):
+            return None
+
+        self.scheduler = LongestProcessingTimeScheduling(
+            config, log,
+            durations=config.cache.get(DURATIONS_CACHE_KEY, {}))
+        return self.scheduler
+
+    def pytest_runtest_logreport(self, report):
+        # setup + call + teardown
+        self.durations[report.nodeid] = \
+            self.durations.get(report.nodeid, 0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        if not self.durations:
+            return
+
+        stored_durations = self.config.cache.get(DURATIONS_CACHE_KEY, {})
+        for nodeid, duration in self.durations.items():
+            if nodeid in stored_durations:
+                duration = DURATION_SMOOTHING * duration + \
+                           (1 - DURATION_SMOOTHING) * stored_durations[nodeid]
+            stored_durations[nodeid] = round(duration, 3)
+
+        self.config.cache.set(DURATIONS_CACHE_KEY, stored_durations)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.scheduler is None or self.scheduler.predicted_makespan is None:
+            return
+
+        terminalreporter.write_sep('-', 'LPT schedule')
+        terminalreporter.write_line(
+            f'predicted makespan: {self.scheduler.predicted_makespan:.0f}s, '
+            f'actual: {time() - self._session_start:.0f}s, '
+            f'tests without duration history: {self.scheduler.tests_without_history}')
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        LPT_SCHEDULE_ARG, action='store_true', default=False,
+        help='Schedule tests across pytest-xdist workers longest first '
+             'using durations of previous runs')
+
+
+def pytest_configure(config):
+    # durations are reported to pytest-xdist controller, workers do nothing
+    if not hasattr(config, 'workerinput'):
+        config.pluginmanager.register(DurationsPlugin(config), 'taf_durations')
+
+
+@hookimpl(tryfirst=True)
+def pytest_collection_finish(session):
+    """
+    First worker saves groups of tests sharing module or class scoped fixtures
+    and resources used by tests, so that controller can schedule each group as one work unit
+    and skip units whose resources are at their limits.
+    Runs before the worker reports collection to controller.
+    """
+    config = session.config
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput is None or workerinput['workerid'] != 'gw0' \
+            or not config.getoption(LPT_SCHEDULE_ARG):
+        return
+
+    config.cache.set(TEST_GROUPS_CACHE_KEY, shared_fixture_groups(session.items))
+    test_resources = {}
+    for item in session.items:
+        resources = marker_resources(item)
+        if resources:
+            test_resources[item.nodeid] = resources
+    config.cache.set(TEST_RESOURCES_CACHE_KEY, test_resources)
+
+
+def shared_fixture_groups(items):
+    """
+    Returns work unit name by test nodeid for tests
+    using package, module or class scoped fixtures.
+
+    Parameters
+    ----------
+    items : list
+        Collected test items
+
+    Returns
+    -------
+    groups : dict
+        Work unit name (package, module or class nodeid) by test nodeid
+    """
+    groups = {}
+    for item in items:
+        fixture_info = getattr(item, '_fixtureinfo', None)
+        if fixture_info is None:
+            continue
+
+        scopes = {fixture_defs[-1].scope
+                  for fixture_defs in fixture_info.name2fixturedefs.values()
+                  if fixture_defs}
+        module_nodeid = item.nodeid.split('::')[0]
+        if 'package' in scopes:
+            groups[item.nodeid] = module_nodeid.rsplit('/', 1)[0]
+        elif 'module' in scopes:
+            groups[item.nodeid] = module_nodeid
+        elif 'class' in scopes and item.cls is not None:
+            groups[item.nodeid] = item.nodeid.rsplit('::', 1)[0]
+
+    return groups
@@ -0,0 +1,121 @@
+"""
+Performance history of runs.
+
+With --perf_store, test durations, HTTP latencies by endpoint, completion times of
+long running operations and resource uses of the run are saved to PERF_STORE_PATH
+(see utils/perf_store.py). Compare the run with previous runs by
+python -m utils.perf_report
+"""
+
+import logging
+from time import time
+from uuid import uuid4
+
+from utils.perf_store import (
+    PerfStore,
+    PERF_RECORDER
+)
+from utils.constants import (
+    PERF_STORE_PATH,
+    APP_HOST_ARG
+)
+
+
+PERF_STORE_ARG = '--perf_store'
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PerfSamplesPlugin:
+    """
+    Saves samples collected by this pytest process at the end of the run.
+
+    Parameters
+    ----------
+    store : PerfStore
+        Performance history
+    run_id : str
+        Id of the test run, the same for all pytest-xdist workers
+    """
+
+    def __init__(self, store, run_id):
+        self.store = store
+        self.run_id = run_id
+
+    def pytest_sessionfinish(self, session):
+        self.store.save_samples(self.run_id, PERF_RECORDER)
+
+
+class PerfRunPlugin:
+    """
+    Collects test durations from reports of this process or pytest-xdist workers
+    and saves the run at the end.
+
+    Parameters
+    ----------
+    store : PerfStore
+        Performance history
+    run_id : str
+        Id of the test run
+    env : str
+        App host the run is run against
+
+    Attributes
+    ----------
+    tests : dict
+        (duration in seconds, outcome) by test nodeid
+    """
+
+    def __init__(self, store, run_id, env):
+        self.store = store
+        self.run_id = run_id
+        self.env = env
+        self.started_at = time()
+        self.tests = {}
+
+    def pytest_runtest_logreport(self, report):
+        duration, outcome = self.tests.get(report.nodeid, (0.0, 'passed'))
+        if report.failed:
+            outcome = 'failed'
+        elif report.skipped and outcome == 'passed':
+            outcome = 'skipped'
+        self.tests[report.nodeid] = (duration + report.duration, outcome)
+
+    def pytest_sessionfinish(self, session):
+        if not self.tests:
+            return
+
+        self.store.save_run(self.run_id, self.env, self.started_at, self.tests)
+        LOGGER.info('Saved performance of run %s to %s', self.run_id, self.store.db_path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.tests:
+            terminalreporter.write_line(
+                f'Performance history: run {self.run_id} saved to {self.store.db_path}. '
+                f'Compare with previous runs by python -m utils.perf_report --run {self.run_id}')
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        PERF_STORE_ARG, action='store_true', default=False,
+        help=f'Save test durations, HTTP latencies, operation completion times '
+             f'and resource uses of the run to {PERF_STORE_PATH}')
+
+
+def pytest_configure(config):
+    if not config.getoption(PERF_STORE_ARG):
+        return
+
+    store = PerfStore()
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput is not None:
+        run_id = workerinput['testrunuid']
+    else:
+        run_id = getattr(config.option, 'testrunuid', None) or uuid4().hex
+        # pytest-xdist passes it to workers
+        config.option.testrunuid = run_id
+        config.pluginmanager.register(
+            PerfRunPlugin(store, run_id, config.getoption(APP_HOST_ARG) or ''), 'taf_perf_run')
+
+    PERF_RECORDER.enabled = True
+    config.pluginmanager.register(PerfSamplesPlugin(store, run_id), 'taf_perf_samples')
@@ -0,0 +1,214 @@
+"""
+Where test time goes.
+
+With --time_accounting, wall time of every test is split into HTTP requests, deliberate sleeps,
+Playwright waits and pure Python time (see utils/time_accounting.py),
+with setup and teardown time of every fixture the test set up or tore down.
+Times are added to junit XML as test properties (time_wall, time_http, etc.)
+and saved to TIME_ACCOUNTING_PATH with suite-wide totals and top lists.
+Setup of a module or session scoped fixture is accounted to the first test using it.
+"""
+
+import json
+import logging
+from time import perf_counter
+from collections import defaultdict
+
+from pytest import hookimpl
+
+from utils.file_lock import write_json_file
+from utils.time_accounting import (
+    TIME_ACCOUNT,
+    CATEGORIES
+)
+from utils.constants import (
+    TIME_ACCOUNTING_PATH,
+    TIME_ACCOUNTING_TOP_COUNT
+)
+
+
+TIME_ACCOUNTING_ARG = '--time_accounting'
+PROPERTY_PREFIX = 'time_'
+FIXTURES_PROPERTY = 'time_fixtures'
+PYTHON = 'python'
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TimeAccountingPlugin:
+    """
+    Accounts time of tests run by this pytest process
+    and adds it to test reports as user properties.
+    """
+
+    def __init__(self):
+        self._test_start = None
+        self._teardown_mark = None
+        self._fixtures = None
+
+    @hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self._test_start = perf_counter()
+        self._teardown_mark = None
+        self._fixtures = defaultdict(lambda: {'setup': 0.0, 'teardown': 0.0})
+        TIME_ACCOUNT.start()
+        yield
+        TIME_ACCOUNT.stop()
+
+    @hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        start = perf_counter()
+        yield
+        if self._fixtures is not None:
+            self._fixtures[fixturedef.argname]['setup'] += perf_counter() - start
+
+    @hookimpl(tryfirst=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        self._teardown_mark = perf_counter()
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        # finalizers of a fixture run right before this hook,
+        # so teardown took the time since the previous fixture was torn down
+        if self._teardown_mark is None or self._fixtures is None:
+            return
+
+        now = perf_counter()
+        self._fixtures[fixturedef.argname]['teardown'] += now - self._teardown_mark
+        self._teardown_mark = now
+
+    @hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        # properties are copied to the report created by this hook
+        if call.when == 'teardown' and self._test_start is not None:
+            item.user_properties.extend(self._test_properties())
+        yield
+
+    def _test_properties(self):
+        wall = perf_counter() - self._test_start
+        times = dict(TIME_ACCOUNT.times)
+        times[PYTHON] = max(wall - sum(times.values()), 0)
+        fixtures = {
+            name: {phase: round(seconds, 3) for phase, seconds in fixture_times.items()}
+            for name, fixture_times in self._fixtures.items()}
+
+        properties = [(f'{PROPERTY_PREFIX}wall', round(wall, 3))]
+        properties.extend(
+            (f'{PROPERTY_PREFIX}{category}', round(seconds, 3))
+            for category, seconds in times.items())
+        properties.append((FIXTURES_PROPERTY, json.dumps(fixtures, sort_keys=True)))
+        return properties
+
+
+class TimeAccountingSummary:
+    """
+    Collects times of tests from reports of this process or pytest-xdist workers
+    and saves them with totals and top lists at the end of the run.
+
+    Parameters
+    ----------
+    summary_path : str
+        Path to .json file with times
+
+    Attributes
+    ----------
+    summary_path : str
+        Path to .json file with times
+    tests : dict
+        Times of tests by nodeid
+    """
+
+    def __init__(self, summary_path=TIME_ACCOUNTING_PATH):
+        self.summary_path = summary_path
+        self.tests = {}
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != 'teardown':
+            return
+
+        times = {}
+        for name, value in report.user_properties:
+            if name == FIXTURES_PROPERTY:
+                times['fixtures'] = json.loads(value)
+            elif name.startswith(PROPERTY_PREFIX):
+                times[name[len(PROPERTY_PREFIX):]] = value
+        if times:
+            self.tests[report.nodeid] = times
+
+    def summary(self, top_count=TIME_ACCOUNTING_TOP_COUNT):
+        """
+        Returns suite-wide totals in seconds, top lists and times of every test.
+
+        Parameters
+        ----------
+        top_count : int
+            Number of tests and fixtures in top lists
+
+        Returns
+        -------
+        summary : dict
+            Summary of test times
+        """
+        totals = defaultdict(float)
+        fixtures = defaultdict(float)
+        for times in self.tests.values():
+            for category in ('wall', *CATEGORIES, PYTHON):
+                totals[category] += times.get(category, 0)
+            for name, fixture_times in times.get('fixtures', {}).items():
+                fixtures[name] += sum(fixture_times.values())
+
+        def top_tests(category):
+            return [{'nodeid': nodeid, category: times.get(category, 0)} for nodeid, times in
+                    sorted(self.tests.items(), key=lambda test: test[1].get(category, 0),
+                           reverse=True)[:top_count]]
+
+        return {
+            'totals': {category: round(seconds, 3) for category, seconds in totals.items()},
+            'top': {
+                'tests': top_tests('wall'),
+                **{category: top_tests(category) for category in (*CATEGORIES, PYTHON)},
+                'fixtures': [{'fixture': name, 'setup_teardown': round(seconds, 3)}
+                             for name, seconds in sorted(fixtures.items(), key=lambda f: f[1],
+                                                         reverse=True)[:top_count]]
+            },
+            'tests': self.tests
+        }
+
+    def pytest_sessionfinish(self, session):
+        if not self.tests:
+            return
+
+        write_json_file(self.summary_path, self.summary())
+        LOGGER.info('Saved time accounting of %d tests to %s',
+                    len(self.tests), self.summary_path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.tests:
+            return
+
+        summary = self.summary()
+        totals = summary['totals']
+        terminalreporter.write_sep('-', 'time accounting')
+        terminalreporter.write_line(', '.join(
+            f'{category}: {seconds:.0f}s' for category, seconds in totals.items()))
+        for test in summary['top']['tests']:
+            times = self.tests[test['nodeid']]
+            terminalreporter.write_line(
+                f'{times["wall"]:8.1f}s {test["nodeid"]} (' + ', '.join(
+                    f'{category} {times.get(category, 0):.1f}s'
+                    for category in (*CATEGORIES, PYTHON)) + ')')
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        TIME_ACCOUNTING_ARG, action='store_true', default=False,
+        help='Split test time into fixtures, HTTP, sleeps, Playwright waits and Python time')
+
+
+def pytest_configure(config):
+    if not config.getoption(TIME_ACCOUNTING_ARG):
+        return
+
+    config.pluginmanager.register(TimeAccountingPlugin(), 'taf_time_accounting')
+    # times are reported to pytest-xdist controller
+    if not hasattr(config, 'workerinput'):
+        config.pluginmanager.register(TimeAccountingSummary(), 'taf_time_accounting_summary')
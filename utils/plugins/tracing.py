@@ -0,0 +1,112 @@
+"""
+Tracing spans of tests.
+
+With --trace_spans, every test is recorded as a trace (see utils/tracing.py):
+test span -> setup, call and teardown phase spans -> fixture setup spans -> spans of
+HTTP requests, AppClient flows and page object actions.
+Every pytest process saves its spans to SPANS_PATH/{test run id}-{worker id}.json at the end of the run.
+"""
+
+import os
+import logging
+from uuid import uuid4
+
+from pytest import hookimpl
+
+from utils.tracing import TRACER
+from utils.constants import SPANS_PATH
+
+
+TRACE_SPANS_ARG = '--trace_spans'
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TracingPlugin:
+    """
+    Records test, phase and fixture spans and exports all spans at the end of the run.
+
+    Parameters
+    ----------
+    spans_path : str
+        Directory of exported spans files
+    run_id : str
+        Id of the test run, the same for all pytest-xdist workers
+    worker_id : str
+        pytest-xdist worker id, e.g. 'gw0', or 'main' without pytest-xdist
+    """
+
+    def __init__(self, spans_path, run_id, worker_id):
+        self.spans_path = spans_path
+        self.run_id = run_id
+        self.worker_id = worker_id
+        self._test_span = None
+
+    @hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        with TRACER.span(item.nodeid, **{'test.worker': self.worker_id}) as span:
+            self._test_span = span
+            yield
+        self._test_span = None
+
+    @hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        with TRACER.span('setup'):
+            yield
+
+    @hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        with TRACER.span('call'):
+            yield
+
+    @hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        with TRACER.span('teardown'):
+            yield
+
+    @hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        with TRACER.span(f'fixture {fixturedef.argname}',
+                         **{'fixture.scope': fixturedef.scope}):
+            yield
+
+    @hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if self._test_span is None:
+            return
+
+        if report.when == 'call' or report.failed:
+            self._test_span.attributes[f'test.{report.when}'] = report.outcome
+        if report.failed and self._test_span.error is None:
+            self._test_span.error = f'Test failed at {report.when}'
+
+    def pytest_sessionfinish(self, session):
+        spans_count = len(TRACER.spans)
+        file_path = os.path.join(self.spans_path, f'{self.run_id}-{self.worker_id}.json')
+        TRACER.export(file_path, {'test.run_id': self.run_id, 'test.worker': self.worker_id})
+        if spans_count:
+            LOGGER.info('Saved %d spans to %s', spans_count, file_path)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        TRACE_SPANS_ARG, action='store_true', default=False,
+        help=f'Save tracing spans of tests, HTTP requests, AppClient flows '
+             f'and page object actions to {SPANS_PATH} in OTLP/JSON format')
+
+
+def pytest_configure(config):
+    if not config.getoption(TRACE_SPANS_ARG):
+        return
+
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput is not None:
+        run_id, worker_id = workerinput['testrunuid'], workerinput['workerid']
+    else:
+        run_id, worker_id = uuid4().hex, 'main'
+
+    TRACER.enabled = True
+    config.pluginmanager.register(
+        TracingPlugin(SPANS_PATH, run_id, worker_id), 'taf_tracing')
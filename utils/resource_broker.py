@@ -0,0 +1,144 @@
+import os
+import logging
+from time import time
+
+from utils.time_accounting import sleep
+from utils.file_lock import FileLock
+from utils.perf_store import PERF_RECORDER
+from utils.errors import UnknownResourceException
+from utils.constants import (
+    RESOURCE_SLOTS_PATH,
+    RESOURCE_POLL_INTERVAL,
+    RESOURCE_LIMITS
+)
+
+
+RESOURCE_MARKER = 'resource'
+
+
+class ResourceBroker:
+    """
+    Cross-process semaphore for resources capped per account or environment,
+    e.g. concurrent Autopilots, modeling workers, deployments or prediction servers.
+    A resource with limit N has N slots. Each slot is a lock file,
+    so a slot is freed by OS if pytest-xdist worker dies.
+
+    Parameters
+    ----------
+    slots_path : str
+        Path to directory with slot lock files
+    poll_interval : int
+        Seconds to wait before trying to get a slot again
+
+    Attributes
+    ----------
+    slots_path : str
+        Path to directory with slot lock files
+    poll_interval : int
+        Seconds to wait before trying to get a slot again
+    logger : logging.Logger
+        Inits Logger object
+    """
+
+    def __init__(self, slots_path=RESOURCE_SLOTS_PATH,
+                 poll_interval=RESOURCE_POLL_INTERVAL):
+        self.slots_path = slots_path
+        self.poll_interval = poll_interval
+        self.logger = logging.getLogger(__name__)
+
+    def try_acquire(self, resource, limit, env):
+        """
+        Returns a held slot of the resource or None if all slots are taken.
+
+        Parameters
+        ----------
+        resource : str
+            Resource name, e.g. autopilot
+        limit : int
+            Number of slots of the resource
+        env : str
+            Environment the resource belongs to, e.g. staging
+
+        Returns
+        -------
+        slot : FileLock
+            Held slot lock or None
+        """
+        for slot_number in range(limit):
+            slot = FileLock(
+                os.path.join(self.slots_path, env, f'{resource}.{slot_number}.lock'),
+                blocking=False)
+            if slot.acquire():
+                return slot
+        return None
+
+    def acquire(self, resource, limit, env):
+        """
+        Waits until a slot of the resource is free and returns it.
+
+        Parameters
+        ----------
+        resource : str
+            Resource name, e.g. autopilot
+        limit : int
+            Number of slots of the resource
+        env : str
+            Environment the resource belongs to, e.g. staging
+
+        Returns
+        -------
+        slot : FileLock
+            Held slot lock. Call slot.release() when the resource is not used anymore
+        """
+        start_time = time()
+        slot = self.try_acquire(resource, limit, env)
+        if slot is None:
+            self.logger.info(
+                'All %d "%s" slots at %s are taken. Waiting for a free one',
+                limit, resource, env)
+        while slot is None:
+            sleep(self.poll_interval)
+            slot = self.try_acquire(resource, limit, env)
+
+        wait_time = time() - start_time
+        self.logger.info(
+            'Got "%s" slot %s in %.1f seconds',
+            resource, os.path.basename(slot.lock_path), wait_time)
+        PERF_RECORDER.record_resource(resource, wait_time)
+        return slot
+
+
+def marker_resources(node):
+    """
+    Returns resources declared by @mark.resource(name, limit) markers of a test.
+    limit is taken from RESOURCE_LIMITS if not passed.
+
+    Parameters
+    ----------
+    node : Item
+        Test item
+
+    Returns
+    -------
+    resources : dict
+        Resource limit by resource name
+
+    Raises
+    ------
+    UnknownResourceException
+        If a marker has no limit and the resource has no default limit
+    """
+    resources = {}
+    for marker in node.iter_markers(RESOURCE_MARKER):
+        resource = marker.args[0]
+        limit = marker.args[1] if len(marker.args) > 1 else RESOURCE_LIMITS.get(resource)
+        if limit is None:
+            raise UnknownResourceException(resource, list(RESOURCE_LIMITS))
+        # the strictest limit wins if a resource is declared several times
+        resources[resource] = min(limit, resources.get(resource, limit))
+
+    return resources
+
+
+# One broker per process
+RESOURCE_BROKER = ResourceBroker()
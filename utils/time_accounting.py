@@ -0,0 +1,113 @@
+"""
+Per-test time accounting.
+
+Wall time of a running test is split into HTTP requests (Request), deliberate sleeps (sleep()),
+Playwright waits (BasePage actions) and the rest, pure Python time.
+Only time of the thread running the test is accounted: background threads don't block the test.
+Nested measurements are accounted once, by the outer one,
+e.g. click_element() called by BasePage.wait_for_condition().
+Fixture setup and teardown times are collected by utils/plugins/time_accounting.py.
+"""
+
+import time
+import threading
+from functools import wraps
+from contextlib import contextmanager
+
+
+HTTP = 'http'
+SLEEP = 'sleep'
+PLAYWRIGHT = 'playwright'
+CATEGORIES = (HTTP, SLEEP, PLAYWRIGHT)
+
+
+class TimeAccount:
+    """
+    Accumulates time of the running test by category.
+
+    Attributes
+    ----------
+    times : dict
+        Seconds spent by category of the running test
+    """
+
+    def __init__(self):
+        self.times = dict.fromkeys(CATEGORIES, 0.0)
+        self._thread_id = None
+        self._category = None
+
+    def start(self):
+        """Starts accounting time of a test run by the calling thread."""
+
+        self.times = dict.fromkeys(CATEGORIES, 0.0)
+        self._thread_id = threading.get_ident()
+        self._category = None
+
+    def stop(self):
+        """
+        Stops accounting time of the test.
+
+        Returns
+        -------
+        times : dict
+            Seconds spent by category
+        """
+        self._thread_id = None
+        return self.times
+
+    @contextmanager
+    def measure(self, category):
+        """
+        Adds time spent in the with block to category of the running test.
+
+        Parameters
+        ----------
+        category : str
+            One of CATEGORIES
+        """
+        if self._thread_id != threading.get_ident() or self._category is not None:
+            yield
+            return
+
+        self._category = category
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[category] += time.perf_counter() - start
+            self._category = None
+
+    def timed(self, category):
+        """
+        Decorator adding time spent in the function to category of the running test.
+
+        Parameters
+        ----------
+        category : str
+            One of CATEGORIES
+        """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.measure(category):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+TIME_ACCOUNT = TimeAccount()
+
+
+def sleep(seconds):
+    """
+    time.sleep() accounted as deliberate sleep of the running test.
+
+    Parameters
+    ----------
+    seconds : float
+        Seconds to sleep
+    """
+    with TIME_ACCOUNT.measure(SLEEP):
+        time.sleep(seconds)
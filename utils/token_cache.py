@@ -0,0 +1,142 @@
+import logging
+import threading
+from time import time
+
+from utils.file_lock import (
+    FileLock,
+    read_json_file,
+    write_json_file
+)
+from utils.constants import (
+    AUTH0_TOKENS_CACHE_PATH,
+    AUTH0_TOKEN_REFRESH_MARGIN
+)
+
+
+class TokenCache:
+    """
+    Caches Auth0 access tokens by (client_id, audience, subject) key
+    until token expires_in minus refresh_margin seconds.
+    Machine (client credentials) tokens can be shared between pytest-xdist workers
+    and test runs through a locked local .json file.
+    Only one thread per process and one worker per shared token refreshes an expired token,
+    others wait for it and reuse the refreshed token.
+
+    Parameters
+    ----------
+    cache_path : str
+        Path to .json file with shared tokens
+    refresh_margin : int
+        Refresh a token N seconds before it expires
+
+    Attributes
+    ----------
+    cache_path : str
+        Path to .json file with shared tokens
+    refresh_margin : int
+        Refresh a token N seconds before it expires
+    logger : logging.Logger
+        Inits Logger object
+    """
+
+    def __init__(self, cache_path=AUTH0_TOKENS_CACHE_PATH,
+                 refresh_margin=AUTH0_TOKEN_REFRESH_MARGIN):
+        self.cache_path = cache_path
+        self.refresh_margin = refresh_margin
+        self._tokens = {}
+        self._key_locks = {}
+        self._key_locks_guard = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def get_token(self, key, create_token, shared=False):
+        """
+        Returns a cached access token by key.
+        If there is no token or it is about to expire, calls create_token() to get a new one.
+
+        Parameters
+        ----------
+        key : tuple
+            (client_id, audience, subject) tuple
+        create_token : function
+            Returns a tuple of access token and its expires_in seconds
+        shared : bool
+            If to share the token between pytest-xdist workers through cache_path file
+
+        Returns
+        -------
+        access_token : str
+            Access token
+        """
+        token = self._valid_token(self._tokens.get(key))
+        if token is not None:
+            return token
+
+        with self._key_lock(key):
+            # another thread could have refreshed the token while we waited
+            token = self._valid_token(self._tokens.get(key))
+            if token is not None:
+                return token
+
+            if shared:
+                entry = self._shared_entry(key, create_token)
+            else:
+                entry = self._new_entry(key, create_token)
+            self._tokens[key] = entry
+
+            return entry['access_token']
+
+    def invalidate(self, subject):
+        """
+        Drops in-process tokens of the subject,
+        e.g. when DR Account Portal user is (re)registered and token claims change.
+
+        Parameters
+        ----------
+        subject : str
+            Token owner, e.g. username
+        """
+        for key in [key for key in self._tokens if key[2] == subject]:
+            self._tokens.pop(key, None)
+            self.logger.debug('Invalidated Auth0 token for %s', subject)
+
+    def _shared_entry(self, key, create_token):
+        cache_key = '|'.join(key)
+
+        with FileLock(f'{self.cache_path}.lock'):
+            shared_tokens = read_json_file(self.cache_path)
+            entry = shared_tokens.get(cache_key)
+            if self._valid_token(entry) is not None:
+                self.logger.info(
+                    'Reused shared Auth0 token for %s. Expires in %d seconds',
+                    key[2], entry['expires_at'] - time())
+                return entry
+
+            entry = self._new_entry(key, create_token)
+            shared_tokens[cache_key] = entry
+            write_json_file(self.cache_path, shared_tokens)
+
+        return entry
+
+    def _new_entry(self, key, create_token):
+        access_token, expires_in = create_token()
+        self.logger.info(
+            'Created Auth0 token for %s, audience %s. Expires in %d seconds',
+            key[2], key[1], expires_in)
+
+        return {'access_token': access_token,
+                'expires_at': time() + expires_in}
+
+    def _valid_token(self, entry):
+        if entry is None:
+            return None
+        if entry['expires_at'] - self.refresh_margin <= time():
+            return None
+        return entry['access_token']
+
+    def _key_lock(self, key):
+        with self._key_locks_guard:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+
+# One cache per process: clients created by different fixtures share tokens
+TOKEN_CACHE = TokenCache()
@@ -0,0 +1,246 @@
+"""
+Local tracing spans.
+
+Spans of HTTP requests (ApiClient), long running AppClient flows and BasePage actions
+nest under pytest test, phase and fixture spans (see utils/plugins/tracing.py).
+Every test is a trace. Spans are kept in memory and exported to an OTLP/JSON file,
+the format of OpenTelemetry collector file exporter, which any OTLP collector (e.g. Jaeger)
+can import to show a test as a timeline.
+Nothing is recorded unless tracing is enabled.
+"""
+
+import os
+import inspect
+import threading
+from time import time_ns
+from functools import wraps
+from contextlib import contextmanager
+
+from utils.file_lock import write_json_file
+
+
+SERVICE_NAME = 'taf-python'
+# OTLP span kind and status codes
+SPAN_KIND_INTERNAL = 1
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+
+class Span:
+    """
+    Timed operation of a trace.
+
+    Parameters
+    ----------
+    name : str
+        Span name, e.g. 'AppClient.v2_start_autopilot'
+    trace_id : str
+        32 hex digits trace id
+    parent_id : str
+        16 hex digits id of parent span. None for root span
+    attributes : dict
+        Span attributes
+
+    Attributes
+    ----------
+    name : str
+        Span name
+    trace_id : str
+        32 hex digits trace id
+    span_id : str
+        16 hex digits span id
+    parent_id : str
+        16 hex digits id of parent span. None for root span
+    attributes : dict
+        Span attributes
+    start_ns : int
+        Start time in ns since epoch
+    end_ns : int
+        End time in ns since epoch. None until span ends
+    error : str
+        Exception raised in the span. None if span succeeded
+    """
+
+    def __init__(self, name, trace_id, parent_id=None, attributes=None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = attributes or {}
+        self.start_ns = time_ns()
+        self.end_ns = None
+        self.error = None
+
+    def to_otlp(self):
+        """Returns span in OTLP/JSON format."""
+
+        span = {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': SPAN_KIND_INTERNAL,
+            'startTimeUnixNano': str(self.start_ns),
+            'endTimeUnixNano': str(self.end_ns),
+            'attributes': [{'key': key, 'value': {'stringValue': str(value)}}
+                           for key, value in self.attributes.items()],
+            'status': {'code': STATUS_CODE_OK} if self.error is None
+            else {'code': STATUS_CODE_ERROR, 'message': self.error}
+        }
+        if self.parent_id is not None:
+            span['parentSpanId'] = self.parent_id
+
+        return span
+
+
+class Tracer:
+    """
+    Records spans of operations. A span started while another span of the same thread is open
+    becomes its child.
+
+    Attributes
+    ----------
+    enabled : bool
+        If to record spans
+    spans : list
+        Ended spans
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.spans = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name, **attributes):
+        """
+        Records time spent in the with block as a span.
+        Span gets error status if an exception is raised in the block.
+
+        Parameters
+        ----------
+        name : str
+            Span name
+        attributes : dict
+            Span attributes
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        span = Span(name,
+                    trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+                    parent_id=parent.span_id if parent else None,
+                    attributes=attributes)
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.error = f'{type(error).__name__}: {error}'
+            raise
+        finally:
+            span.end_ns = time_ns()
+            stack.pop()
+            with self._lock:
+                self.spans.append(span)
+
+    def traced(self, name=None, *attribute_args):
+        """
+        Decorator recording function calls as spans.
+
+        Parameters
+        ----------
+        name : str
+            Span name. Function qualified name by default, e.g. 'AppClient.v2_start_autopilot'
+        attribute_args : str
+            Names of function arguments recorded as span attributes, e.g. 'path'
+        """
+        def decorator(func):
+            span_name = name or func.__qualname__
+            signature = inspect.signature(func) if attribute_args else None
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+
+                attributes = {}
+                if signature is not None:
+                    arguments = signature.bind_partial(*args, **kwargs).arguments
+                    attributes = {arg: arguments[arg] for arg in attribute_args
+                                  if arg in arguments}
+                with self.span(span_name, **attributes):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @contextmanager
+    def parent_span(self, span):
+        """
+        Makes spans started in the with block children of a span open in another thread,
+        e.g. spans of requests run by a thread pool. The span itself is not recorded again.
+
+        Parameters
+        ----------
+        span : Span
+            Span returned by current_span() in the other thread. Nothing is done if None
+        """
+        if span is None:
+            yield
+            return
+
+        stack = self._stack()
+        stack.append(span)
+        try:
+            yield
+        finally:
+            stack.pop()
+
+    def current_span(self):
+        """Returns open span of the calling thread, None if there is none."""
+
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def export(self, file_path, resource_attributes=None):
+        """
+        Writes ended spans to OTLP/JSON file and forgets them.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to .json file
+        resource_attributes : dict
+            Attributes of this process, e.g. {'worker': 'gw0'}
+        """
+        with self._lock:
+            spans, self.spans = self.spans, []
+        if not spans:
+            return
+
+        attributes = {'service.name': SERVICE_NAME, **(resource_attributes or {})}
+        write_json_file(file_path, {
+            'resourceSpans': [{
+                'resource': {
+                    'attributes': [{'key': key, 'value': {'stringValue': str(value)}}
+                                   for key, value in attributes.items()]
+                },
+                'scopeSpans': [{
+                    'scope': {'name': SERVICE_NAME},
+                    'spans': [span.to_otlp() for span in spans]
+                }]
+            }]
+        })
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+TRACER = Tracer()
@@ -0,0 +1,122 @@
+"""
+Declarative page state conditions for BasePage.wait_for_condition().
+A condition is checked in the browser every time DOM changes (MutationObserver),
+so page state is detected the moment it changes, without polling from Python.
+"""
+
+from collections import namedtuple
+
+
+Condition = namedtuple('Condition', ['selector', 'attribute', 'operator', 'value'])
+
+DETACHED = 'detached'
+TIMED_OUT = 'timed out'
+
+# Resolves with true as soon as condition is met: checked on every DOM mutation.
+# Resolves with 'detached' if element was removed from DOM (e.g. re-rendered by React),
+# so that it is found by selector again, or with 'timed out' after timeout ms.
+CONDITION_JS = """
+([element, attribute, operator, value, timeout]) => new Promise(resolve => {
+    const check = () => {
+        if (!element.isConnected) {
+            return 'detached';
+        }
+        const actual = element.getAttribute(attribute);
+        switch (operator) {
+            case 'contains':
+                return actual !== null && actual.includes(value);
+            case 'not_contains':
+                return actual === null || !actual.includes(value);
+            case 'equals':
+                return actual === value;
+            case 'present':
+                return actual !== null;
+            case 'absent':
+                return actual === null;
+        }
+        throw new Error(`Unknown condition operator ${operator}`);
+    };
+    const observer = new MutationObserver(() => {
+        const result = check();
+        if (result) {
+            finish(result);
+        }
+    });
+    const timer = setTimeout(() => finish('timed out'), timeout);
+    const finish = result => {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(result);
+    };
+
+    const result = check();
+    if (result) {
+        finish(result);
+    } else {
+        observer.observe(document, {attributes: true, childList: true, subtree: true});
+    }
+})
+"""
+
+# Resolves with true when page has had no DOM mutations for quietPeriod ms
+# (React finished rendering) and Pendo agent, if loaded, is ready,
+# or with false after timeout ms
+PAGE_SETTLED_JS = """
+([quietPeriod, timeout]) => new Promise(resolve => {
+    const isPendoReady = () => typeof window.pendo === 'undefined'
+        || (typeof window.pendo.isReady === 'function' && window.pendo.isReady());
+    let quietTimer;
+    const restartQuietTimer = () => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(
+            () => isPendoReady() ? finish(true) : restartQuietTimer(), quietPeriod);
+    };
+    const observer = new MutationObserver(restartQuietTimer);
+    const timer = setTimeout(() => finish(false), timeout);
+    const finish = isSettled => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(timer);
+        resolve(isSettled);
+    };
+
+    observer.observe(
+        document, {attributes: true, childList: true, characterData: true, subtree: true});
+    restartQuietTimer();
+})
+"""
+
+# Returns true when there are no running CSS animations and transitions
+ANIMATIONS_FINISHED_JS = """
+() => document.getAnimations().every(animation => animation.playState !== 'running')
+"""
+
+
+def attribute_contains(selector, attribute, value):
+    """Element attribute value contains value, e.g. class contains 'selected'."""
+
+    return Condition(selector, attribute, 'contains', value)
+
+
+def attribute_not_contains(selector, attribute, value):
+    """Element attribute value does not contain value or element has no such attribute."""
+
+    return Condition(selector, attribute, 'not_contains', value)
+
+
+def attribute_equals(selector, attribute, value):
+    """Element attribute value equals value."""
+
+    return Condition(selector, attribute, 'equals', value)
+
+
+def attribute_present(selector, attribute):
+    """Element has attribute."""
+
+    return Condition(selector, attribute, 'present', None)
+
+
+def attribute_absent(selector, attribute):
+    """Element has no attribute, e.g. button has no 'disabled' attribute."""
+
+    return Condition(selector, attribute, 'absent', None)
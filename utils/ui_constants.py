@@ -1,13 +1,78 @@
 """Contains common variables and constants used across UI tests"""
 
+import os
+
+from utils.constants import LOCAL_STATE_PATH
+from utils.data_enums import (
+    UserRole,
+    ProductUsagePurpose,
+    LearningTrack
+)
+
 # Timeouts
 DEFAULT_TIMEOUT = 60000  # ms
 ELEM_NOT_FOUND_TIMEOUT = 10000
-PENDO_TOUR_CONTAINER_TIMEOUT = 5000
+# Pendo agent fetches guides of the visitor after page load
+PENDO_TOUR_RESET_TIMEOUT = 20000
 WAIT_FOR_MODEL_TIMEOUT = 400000
+FOCUS_TIMEOUT = 5000
+PAGE_SETTLED_TIMEOUT = 10000
+# page is settled when DOM is not changed for N ms
+RENDER_QUIET_PERIOD = 500
 
 SCREENSHOTS_PATH = 'ui/screenshots'
 DOWNLOADS_PATH = 'ui/downloads'
+WEB_PERF_RESULTS_PATH = 'ui/web_performance'
+TRACES_PATH = 'ui/traces'
+VIDEOS_PATH = 'ui/videos'
+SCREENSHOT_QUALITY = 70  # jpeg
+
+# Web performance budgets by page: ms, CLS score, bytes
+WEB_PERF_BUDGETS = {
+    'Home': {'ready': 15000, 'load': 10000, 'lcp': 6000, 'cls': 0.1,
+             'transfer_size': 15 * 1024 * 1024},
+    'Models': {'ready': 10000, 'inp': 500, 'cls': 0.1},
+    'Deployments': {'ready': 10000, 'inp': 500, 'cls': 0.1},
+    'Credits Packs': {'ready': 5000, 'inp': 500, 'cls': 0.1},
+    'Docs Portal': {'ready': 8000, 'load': 6000, 'lcp': 4000, 'cls': 0.1,
+                    'transfer_size': 5 * 1024 * 1024}
+}
+
+# Network routes
+# third-party hosts (and their subdomains) not needed by UI assertions
+BLOCKED_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'fonts.googleapis.com',
+    'fonts.gstatic.com',
+    'youtube.com',
+    'ytimg.com',
+    'vimeo.com',
+    'vimeocdn.com',
+    'wistia.com',
+    'wistia.net',
+    'hotjar.com',
+    'segment.com',
+    'segment.io',
+    'intercom.io',
+    'facebook.net',
+    'linkedin.com',
+    'licdn.com',
+    'hubspot.com',
+    'hs-scripts.com',
+    'bizible.com',
+    'marketo.net',
+    'newrelic.com',
+    'nr-data.net'
+)
+# served live: tours and sign in depend on them
+NOT_CACHED_HOSTS = ('pendo.io', 'auth0.com')
+CACHED_RESOURCE_TYPES = ('script', 'stylesheet', 'font', 'image')
+ASSETS_CACHE_PATH = os.path.join(LOCAL_STATE_PATH, 'ui_assets')
+ASSETS_CACHE_MAX_AGE = 12 * 60 * 60  # seconds
+# recorded backend responses for @mark.stub_response
+UI_STUBS_PATH = 'data/ui_stubs/'
 
 # Error messages
 ELEMENT_NOT_FOUND_MESSAGE = 'Element with selector {} was not found. {}.'
@@ -24,6 +89,16 @@ CARD_IS_SELECTED_VALUE = 'card-container card-content selected'
 # Pendo
 PENDO_HOME_TOUR_GUIDE_ID = 'R609QK8MuMz3-8ULkS449XP5QGo'
 
+# POST /account/profile payload of AI profile created for UI tests,
+# same as Developer, Gaming, Create AI models at ai-profile page
+AI_PROFILE = {
+    'user_role': UserRole.SOFTWARE_DEVELOPER.value,
+    'industry': 'Gaming',
+    'product_usage_purpose': ProductUsagePurpose.CREATE_AI_MODELS.value,
+    'selected_learning_track': LearningTrack.ML_DEVELOPMENT.value,
+    'welcome_video_viewed': True
+}
+
 NO_TOUR_IF_CLOSED_WITH_YES_BUTTON = 'Tour must not appear again if closed with "Yes" button ' \
                                     'from "Was this tour helpful?" section'
 NO_TOUR_IF_CLOSED_WITH_NO_BUTTON = 'Tour must not appear again if closed with "No" button ' \
@@ -33,3 +108,5 @@ NO_TOUR_IF_CLOSED_WITH_X_BUTTON = 'Tour must not appear again if closed with X b
 PENDO_HIGHLIGHT = 'pendo-target-highlight'
 
 COMPUTE_PREDICTIONS_BUTTON = '"Compute and download predictions" button'
+# API call uploading a file chosen at deployments/{deployment_id}/predictions/make-predictions
+PREDICTION_DATASETS_URL_PART = '/predictionDatasets/'
@@ -0,0 +1,276 @@
+"""
+Frontend performance of UI test navigations.
+With --web_perf, BasePage navigations collect Navigation Timing, Resource Timing,
+LCP, CLS, INP and JS heap size, check them against WEB_PERF_BUDGETS of the page
+and append them to a .jsonl file of the process in ui/web_performance.
+Files of all processes are merged into a per-run .json file at the end of the run.
+"""
+
+import os
+import glob
+import json
+import logging
+from time import time
+from urllib.parse import urlparse
+
+from utils.file_lock import write_json_file
+from utils.ui_constants import (
+    WEB_PERF_RESULTS_PATH,
+    WEB_PERF_BUDGETS
+)
+from utils.errors import WebPerformanceBudgetException
+
+
+RECORD_MODE = 'record'
+ENFORCE_MODE = 'enforce'
+WEB_PERF_MODES = (RECORD_MODE, ENFORCE_MODE)
+SLOWEST_RESOURCES_COUNT = 5
+
+# Added as init script, so that buffered entries of every document are observed
+OBSERVERS_JS = """
+(() => {
+    const vitals = window.__tafVitals = {lcp: null, cls: 0, inp: null};
+    const observe = (type, callback, options = {}) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback))
+                .observe({type, buffered: true, ...options});
+        } catch (error) {
+            // entry type is not supported by the browser
+        }
+    };
+    observe('largest-contentful-paint', entry => {
+        vitals.lcp = entry.startTime;
+    });
+    observe('layout-shift', entry => {
+        if (!entry.hadRecentInput) {
+            vitals.cls += entry.value;
+        }
+    });
+    observe('event', entry => {
+        if (entry.interactionId) {
+            vitals.inp = Math.max(vitals.inp || 0, entry.duration);
+        }
+    }, {durationThreshold: 16});
+})();
+"""
+
+# Metrics of navigation since `since` ms of performance timeline:
+# 0 for a page load, performance.now() before a click for in-app navigation
+METRICS_JS = """
+([since, slowestCount]) => {
+    const navigation = since === 0 ? performance.getEntriesByType('navigation')[0] : null;
+    const resources = performance.getEntriesByType('resource')
+        .filter(entry => entry.startTime >= since);
+    const vitals = window.__tafVitals || {};
+    return {
+        ttfb: navigation ? navigation.responseStart : null,
+        dom_content_loaded: navigation ? navigation.domContentLoadedEventEnd : null,
+        load: navigation ? navigation.loadEventEnd : null,
+        ready: performance.now() - since,
+        resource_count: resources.length,
+        transfer_size: resources.reduce((size, entry) => size + entry.transferSize, 0)
+            + (navigation ? navigation.transferSize : 0),
+        slowest_resources: resources
+            .sort((a, b) => b.duration - a.duration)
+            .slice(0, slowestCount)
+            .map(entry => ({name: entry.name, duration: entry.duration})),
+        // LCP is reported for page loads only
+        lcp: navigation && vitals.lcp !== undefined ? vitals.lcp : null,
+        cls: vitals.cls === undefined ? null : vitals.cls,
+        inp: vitals.inp === undefined ? null : vitals.inp,
+        js_heap: performance.memory ? performance.memory.usedJSHeapSize : null
+    };
+}
+"""
+
+
+class WebPerformance:
+    """
+    Collects frontend performance metrics of navigations of the current UI test.
+    Disabled until start() is called by web_performance fixture.
+
+    Parameters
+    ----------
+    results_path : str
+        Path to dir with per-run .json files
+    budgets : dict
+        Metric limits by metric name by page name, e.g. {'Home': {'lcp': 6000}}
+
+    Attributes
+    ----------
+    results_path : str
+        Path to dir with per-run .json files
+    budgets : dict
+        Metric limits by metric name by page name
+    mode : str
+        'record' to save metrics, 'enforce' to also fail a test exceeding a budget.
+        None if disabled
+    run_id : str
+        Test run id, the same for all pytest-xdist workers
+    test_id : str
+        Nodeid of the current test
+    logger : logging.Logger
+        Inits Logger object
+    """
+
+    def __init__(self, results_path=WEB_PERF_RESULTS_PATH, budgets=WEB_PERF_BUDGETS):
+        self.results_path = results_path
+        self.budgets = budgets
+        self.mode = None
+        self.run_id = None
+        self.test_id = None
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def is_enabled(self):
+        return self.mode is not None
+
+    def start(self, page, mode, run_id, test_id):
+        """
+        Enables collection for a test: observers of LCP, CLS and INP
+        are added to every document loaded by the page.
+
+        Parameters
+        ----------
+        page : playwright.sync_api._generated.Page
+            Browser page
+        mode : str
+            'record' or 'enforce'
+        run_id : str
+            Test run id
+        test_id : str
+            Test nodeid
+        """
+        self.mode = mode
+        self.run_id = run_id
+        self.test_id = test_id
+        page.add_init_script(OBSERVERS_JS)
+
+    def stop(self):
+        self.mode = None
+        self.test_id = None
+
+    def now(self, page):
+        """
+        Returns current time of page performance timeline in ms
+        to capture in-app navigation started after it. Returns 0 if disabled.
+        """
+        if not self.is_enabled:
+            return 0
+        return page.evaluate('performance.now()')
+
+    def capture(self, page_object, page_name, since=0):
+        """
+        Saves metrics of the last navigation of page_object
+        and checks them against page_name budgets.
+        Does nothing if disabled.
+
+        Parameters
+        ----------
+        page_object : pages.base_page.BasePage
+            Page object which navigated
+        page_name : str
+            Page name of budgets, e.g. 'Home'
+        since : float
+            0 for a page load or now() value before in-app navigation
+
+        Returns
+        -------
+        record : dict
+            Navigation metrics. None if disabled
+
+        Raises
+        ------
+        WebPerformanceBudgetException
+            If a budget is exceeded in 'enforce' mode
+        """
+        if not self.is_enabled:
+            return None
+
+        metrics = page_object.page.evaluate(METRICS_JS, [since, SLOWEST_RESOURCES_COUNT])
+        breaches = self.budget_breaches(page_name, metrics)
+        record = {
+            'test': self.test_id,
+            'page': page_name,
+            'page_object': type(page_object).__name__,
+            'path': urlparse(page_object.page.url).path,
+            'navigation': 'load' if since == 0 else 'in-app',
+            'timestamp': time(),
+            'budget_breaches': breaches,
+            **metrics
+        }
+        self._save(record)
+
+        self.logger.info(
+            '%s page performance: ready %s ms, LCP %s ms, CLS %s, %d resources, %d bytes',
+            page_name, _round(metrics['ready']), _round(metrics['lcp']),
+            _round(metrics['cls'], 3), metrics['resource_count'], metrics['transfer_size'])
+        if breaches:
+            self.logger.warning('%s page exceeded budgets: %s', page_name, breaches)
+            if self.mode == ENFORCE_MODE:
+                raise WebPerformanceBudgetException(page_name, breaches)
+
+        return record
+
+    def budget_breaches(self, page_name, metrics):
+        """
+        Returns {metric: [value, limit]} of metrics exceeding page_name budgets.
+        Metrics not measured by the browser (None) are skipped.
+        """
+        breaches = {}
+        for metric, limit in self.budgets.get(page_name, {}).items():
+            value = metrics.get(metric)
+            if value is not None and value > limit:
+                breaches[metric] = [_round(value, 3), limit]
+
+        return breaches
+
+    def _save(self, record):
+        # every process appends to its own file, so no lock is needed
+        os.makedirs(self.results_path, exist_ok=True)
+        part_path = os.path.join(self.results_path, f'{self.run_id}.{os.getpid()}.jsonl')
+        with open(part_path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+
+    def merge(self, run_id):
+        """
+        Merges records saved by all processes of a run into {run_id}.json
+        sorted by timestamp and removes the files of the processes.
+        Called once at the end of the run.
+
+        Parameters
+        ----------
+        run_id : str
+            Test run id
+
+        Returns
+        -------
+        count : int
+            Number of merged records
+        """
+        part_paths = glob.glob(os.path.join(self.results_path, f'{run_id}.*.jsonl'))
+        if not part_paths:
+            return 0
+
+        records = []
+        for part_path in part_paths:
+            with open(part_path) as f:
+                records.extend(json.loads(line) for line in f if line.strip())
+        records.sort(key=lambda record: record['timestamp'])
+
+        run_path = os.path.join(self.results_path, f'{run_id}.json')
+        write_json_file(run_path, records)
+        for part_path in part_paths:
+            os.remove(part_path)
+        self.logger.info('Saved %d web performance records to %s', len(records), run_path)
+        return len(records)
+
+
+def _round(value, digits=0):
+    if value is None:
+        return None
+    return round(value, digits) if digits else int(value)
+
+
+# One collector per process: page objects created by different fixtures share it
+WEB_PERFORMANCE = WebPerformance()